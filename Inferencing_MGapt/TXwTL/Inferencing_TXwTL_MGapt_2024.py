@@ -21,6 +21,9 @@
 
 """To run this file on HPC, simply run:
 `sbatch inference_run.sh`
+The walkers are evaluated in parallel on all allocated cores
+(`SLURM_CPUS_PER_TASK`, or every core when run outside SLURM).
+Run with `--resume` to continue a killed job from `mcmc_checkpoint.npz`.
 The results are written to `mcmc_results.csv`
 """
 import numpy as np
@@ -37,6 +40,11 @@ from bioscrape.simulator import py_simulate_model
 import os
 directory = os.getcwd()
 
+#Parallel MCMC runner from the repo's pure_crn package
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from pure_crn.inference import py_inference_parallel, read_chain
+
 # # Bayesian Inference 
 from bioscrape.inference import py_inference
 
@@ -125,20 +133,19 @@ prior = {#'k_forward' : ['gaussian', k_rnapbF1, 6, 'positive'],
         # 'k_forward7' : ['gaussian', k_term, 25, 'positive'],
         }
 
-sampler, pid = py_inference(Model = m, exp_data = exp_data, measurements = ['MGapt'],
+sampler, pid = py_inference_parallel(Model = m, exp_data = exp_data, measurements = ['MGapt'],
                            time_column = ['timepoints'], 
                            params_to_estimate = ['k_forward1', 'k_forward2',
                                                  'k_forward3', 'k_forward5',],
                            nwalkers = 15, nsteps = 500, init_seed = 'prior', prior = prior,
-                           sim_type = 'deterministic', plot_show = True,debug=False, atol=.01)
+                           sim_type = 'deterministic', plot_show = True, resume = '--resume' in sys.argv,debug=False, atol=.01)
 
 
 
 import pandas as pd
 labels = ['k_forward1', 'k_forward2',
           'k_forward3', 'k_forward5',]
-samples_mcmc = pd.read_csv('mcmc_results.csv', names = labels,
-                           engine = 'python')
+samples_mcmc = read_chain('mcmc_results.csv', labels)
 
 import corner
 import matplotlib.pyplot as plt
@@ -0,0 +1,32 @@
+"""Importable builders for the PURE TX/TL mass-action CRN models.
+
+The networks are built directly into index arrays (`CompiledCRN`) rather than
+BioCRNpyler objects; `CompiledCRN.to_bioscrape_model` gives a ready-to-simulate
+bioscrape `Model`.
+"""
+from .cache import ModelCache, SnapshotCache
+from .likelihood import Experiment, JointLikelihood
+from .model import MutableModel
+from .network import CompiledCRN, CRNBuilder
+from .ode import MassActionODE, initial_rows, parameter_rows, simulate, simulate_batch
+from .parameters import (TX_PARAMETERS, TX_PARAMETERS_TXONLY, TX_INITIAL_CONDITIONS,
+                         load_rate_constants, load_initial_conditions)
+from .results import Results, from_csv, simulation_metadata, write_results
+from .sbml import globalize_parameters, write_sbml
+from .sensitivity import sensitivities
+from .sequence import (MGAPT_DNA, MGAPT_DEGFP_DNA, get_transcript, translate,
+                       coding_protein, reporter_position)
+from .tl import build_tl_crn
+from .tx import build_tx_crn
+from .txtl import build_txtl_crn
+
+__all__ = [
+    'CompiledCRN', 'CRNBuilder', 'ModelCache', 'SnapshotCache', 'write_sbml', 'globalize_parameters',
+    'Experiment', 'JointLikelihood', 'MutableModel', 'MassActionODE', 'simulate', 'simulate_batch', 'parameter_rows', 'initial_rows',
+    'Results', 'write_results', 'from_csv', 'simulation_metadata', 'sensitivities',
+    'TX_PARAMETERS', 'TX_PARAMETERS_TXONLY', 'TX_INITIAL_CONDITIONS',
+    'load_rate_constants', 'load_initial_conditions',
+    'MGAPT_DNA', 'MGAPT_DEGFP_DNA', 'get_transcript', 'translate', 'coding_protein',
+    'reporter_position',
+    'build_tx_crn', 'build_tl_crn', 'build_txtl_crn',
+]
@@ -0,0 +1,529 @@
+"""Reaction tables for the PURE translation model.
+
+Transcribed from the translation cells of the model notebooks
+(`Models/CRN_PURE_MGaptTXwTL.ipynb`, `Examples/CRN_PURE_TXTL_MGaptdeGFP.ipynb`).
+Each reaction is a mass-action ``(reactants, products, rate_key)`` tuple where
+``rate_key`` is the row name in `Data_files/fMGG_synthesis_parameters_CRN.csv`.
+The ``AA_*`` tables are templates formatted with ``aa`` (three-letter amino
+acid) and ``xyz`` (tRNA codon label) for every amino acid other than Met.
+"""
+
+#General proteins and small molecules
+GENERAL_SPECIES = (
+    'ADP', 'AMP', 'CK', 'CK_ADP', 'CK_ATP', 'CK_CP', 'CK_CP_ADP', 'CK_Cr', 'CK_Cr_ATP',
+    'CK_degraded', 'CP', 'Cr', 'EFG', 'EFG_degraded', 'EFG_GDP', 'EFG_GTP', 'EFTs',
+    'EFTs_degraded', 'EFTu', 'EFTu_degraded', 'EFTu_EFTs', 'EFTu_GDP', 'EFTu_GDP_EFTs',
+    'EFTu_GTP', 'EFTu_GTP_EFTs', 'FD', 'GMP', 'IF1', 'IF1_degraded', 'IF2',
+    'IF2_degraded', 'IF2_GDP', 'IF2_GTP', 'IF2_GTP_fMettRNAfMetCAU', 'IF3',
+    'IF3_degraded', 'MK', 'MK_ADP_1', 'MK_ADP_2', 'MK_ADP_ADP', 'MK_AMP', 'MK_ATP',
+    'MK_ATP_AMP', 'MK_degraded', 'mRNA', 'mRNA_degraded', 'MTF', 'MTF_degraded',
+    'MTF_FD', 'MTF_THF', 'NDK', 'NDK_ADP', 'NDK_ATP', 'NDK_degraded', 'NDK_GDP',
+    'NDK_GDP_ATP', 'NDK_GTP', 'NDK_GTP_ADP', 'PPiase', 'PPiase_degraded', 'PPiase_PO4',
+    'PPiase_PO4_PO4', 'PPiase_PPi', 'RF1', 'RF1_degraded', 'RF2', 'RF2_degraded',
+    'RF3', 'RF3_degraded', 'RF3_GDP', 'RF3_GTP', 'RRF', 'RRF_degraded', 'RS30S',
+    'RS30S_degraded', 'RS30S_IF1_IF3_IF2_GTP_mRNA', 'RS30S_IF1_IF3_mRNA',
+    'RS30S_IF1_mRNA', 'RS30S_IF1', 'RS30S_IF1_IF2_GTP', 'RS30S_IF1_IF2_GTP_mRNA',
+    'RS30S_IF1_IF3', 'RS30S_IF1_IF3_IF2_GTP', 'RS30S_IF3_IF2_GTP_mRNA',
+    'RS30S_IF2_GTP', 'RS30S_IF2_GTP_mRNA', 'RS30S_IF3', 'RS30S_IF3_mRNA',
+    'RS30S_IF3_IF2_GTP', 'RS30S_mRNA', 'RS50S', 'RS50S_degraded', 'RS50S_EFG_GDP',
+    'RS50S_EFG_GDP_PO4', 'RS50S_EFG_GTP', 'RS50S_RRF', 'RS50S_RRF_EFG_GDP', 'RS70S',
+    'RS70S_EFG_GDP', 'RS70S_EFG_GDP_PO4', 'RS70S_EFG_GTP', 'RS70S_IF1', 'RS70S_IF3',
+    'RS70S_IF1_IF3', 'THF', 'fMet', 'fMet_degraded',
+)
+
+GENERAL_REACTIONS = (
+    (('EFTu', 'EFTs'), ('EFTu_EFTs',), 're0000000261_k1'),
+    (('EFTu_EFTs',), ('EFTu', 'EFTs'), 're0000000262_k1'),
+    (('EFTu_EFTs', 'GDP'), ('EFTu_GDP_EFTs',), 're0000000263_k1'),
+    (('EFTu_GDP_EFTs',), ('EFTu_EFTs', 'GDP'), 're0000000264_k1'),
+    (('EFTu_GDP_EFTs',), ('EFTu_GDP', 'EFTs'), 're0000000265_k1'),
+    (('EFTu_GDP', 'EFTs'), ('EFTu_GDP_EFTs',), 're0000000266_k1'),
+    (('EFTu_GDP',), ('EFTu', 'GDP'), 're0000000267_k1'),
+    (('EFTu', 'GDP'), ('EFTu_GDP',), 're0000000268_k1'),
+    (('EFTu_EFTs', 'GTP'), ('EFTu_GTP_EFTs',), 're0000000269_k1'),
+    (('EFTu_GTP_EFTs',), ('EFTu_EFTs', 'GTP'), 're0000000270_k1'),
+    (('EFTu_GTP_EFTs',), ('EFTu_GTP', 'EFTs'), 're0000000271_k1'),
+    (('EFTu_GTP', 'EFTs'), ('EFTu_GTP_EFTs',), 're0000000272_k1'),
+    (('EFTu', 'GTP'), ('EFTu_GTP',), 're0000000273_k1'),
+    (('EFTu_GTP',), ('EFTu', 'GTP'), 're0000000274_k1'),
+    (('EFG_GDP',), ('EFG', 'GDP'), 're0000000292_k1'),
+    (('EFG', 'GDP'), ('EFG_GDP',), 're0000000293_k1'),
+    (('EFG', 'GTP'), ('EFG_GTP',), 're0000000294_k1'),
+    (('EFG_GTP',), ('EFG', 'GTP'), 're0000000295_k1'),
+    (('RS50S', 'EFG_GTP'), ('RS50S_EFG_GTP',), 're0000000298_k1'),
+    (('RS50S_EFG_GTP',), ('RS50S', 'EFG_GTP'), 're0000000299_k1'),
+    (('RS70S', 'EFG_GTP'), ('RS70S_EFG_GTP',), 're0000000300_k1'),
+    (('RS70S_EFG_GTP',), ('RS70S', 'EFG_GTP'), 're0000000301_k1'),
+    (('RS50S_EFG_GTP',), ('RS50S_EFG_GDP_PO4',), 're0000000302_k1'),
+    (('RS50S_EFG_GDP_PO4',), ('RS50S_EFG_GTP',), 're0000000303_k1'),
+    (('RS70S_EFG_GTP',), ('RS70S_EFG_GDP_PO4',), 're0000000304_k1'),
+    (('RS70S_EFG_GDP_PO4',), ('RS70S_EFG_GTP',), 're0000000305_k1'),
+    (('RS50S_EFG_GDP_PO4',), ('RS50S_EFG_GDP', 'PO4'), 're0000000306_k1'),
+    (('RS70S_EFG_GDP_PO4',), ('RS70S_EFG_GDP', 'PO4'), 're0000000307_k1'),
+    (('RS50S_EFG_GDP',), ('RS50S', 'EFG_GDP'), 're0000000308_k1'),
+    (('RS70S_EFG_GDP',), ('RS70S', 'EFG_GDP'), 're0000000309_k1'),
+    (('CK', 'ADP'), ('CK_ADP',), 're0000000330_k1'),
+    (('CK_ADP',), ('CK', 'ADP'), 're0000000331_k1'),
+    (('CK', 'CP'), ('CK_CP',), 're0000000332_k1'),
+    (('CK_CP',), ('CK', 'CP'), 're0000000333_k1'),
+    (('CK_CP', 'ADP'), ('CK_CP_ADP',), 're0000000334_k1'),
+    (('CK_CP_ADP',), ('CK_CP', 'ADP'), 're0000000335_k1'),
+    (('CK_ADP', 'CP'), ('CK_CP_ADP',), 're0000000336_k1'),
+    (('CK_CP_ADP',), ('CP', 'CK_ADP'), 're0000000337_k1'),
+    (('CK_CP_ADP',), ('CK_Cr_ATP',), 're0000000338_k1'),
+    (('CK_Cr_ATP',), ('CK_CP_ADP',), 're0000000339_k1'),
+    (('CK_Cr_ATP',), ('CK_Cr', 'ATP'), 're0000000340_k1'),
+    (('CK_Cr', 'ATP'), ('CK_Cr_ATP',), 're0000000341_k1'),
+    (('CK_Cr_ATP',), ('CK_ATP', 'Cr'), 're0000000342_k1'),
+    (('CK_ATP', 'Cr'), ('CK_Cr_ATP',), 're0000000343_k1'),
+    (('CK_ATP',), ('CK', 'ATP'), 're0000000344_k1'),
+    (('CK', 'ATP'), ('CK_ATP',), 're0000000345_k1'),
+    (('CK_Cr',), ('CK', 'Cr'), 're0000000346_k1'),
+    (('CK', 'Cr'), ('CK_Cr',), 're0000000347_k1'),
+    (('NDK', 'ATP'), ('NDK_ATP',), 're0000000355_k1'),
+    (('NDK_ATP',), ('NDK', 'ATP'), 're0000000356_k1'),
+    (('NDK', 'GDP'), ('NDK_GDP',), 're0000000357_k1'),
+    (('NDK_GDP',), ('NDK', 'GDP'), 're0000000358_k1'),
+    (('NDK_GDP', 'ATP'), ('NDK_GDP_ATP',), 're0000000359_k1'),
+    (('NDK_GDP_ATP',), ('NDK_GDP', 'ATP'), 're0000000360_k1'),
+    (('NDK_ATP', 'GDP'), ('NDK_GDP_ATP',), 're0000000361_k1'),
+    (('NDK_GDP_ATP',), ('NDK_ATP', 'GDP'), 're0000000362_k1'),
+    (('NDK_GDP_ATP',), ('NDK_GTP_ADP',), 're0000000363_k1'),
+    (('NDK_GTP_ADP',), ('NDK_ADP', 'GTP'), 're0000000365_k1'),
+    (('NDK_GTP_ADP',), ('NDK_GTP', 'ADP'), 're0000000366_k1'),
+    (('NDK_ADP',), ('NDK', 'ADP'), 're0000000367_k1'),
+    (('NDK_GTP',), ('NDK', 'GTP'), 're0000000368_k1'),
+    (('NDK_GTP', 'ADP'), ('NDK_GTP_ADP',), 're0000000375_k1'),
+    (('NDK_ADP', 'GTP'), ('NDK_GTP_ADP',), 're0000000376_k1'),
+    (('NDK', 'GTP'), ('NDK_GTP',), 're0000000377_k1'),
+    (('NDK', 'ADP'), ('NDK_ADP',), 're0000000378_k1'),
+    (('MK', 'ATP'), ('MK_ATP',), 're0000000380_k1'),
+    (('MK_ATP',), ('ATP', 'MK'), 're0000000381_k1'),
+    (('MK', 'AMP'), ('MK_AMP',), 're0000000382_k1'),
+    (('MK_AMP',), ('MK', 'AMP'), 're0000000383_k1'),
+    (('MK_AMP', 'ATP'), ('MK_ATP_AMP',), 're0000000384_k1'),
+    (('MK_ATP_AMP',), ('ATP', 'MK_AMP'), 're0000000385_k1'),
+    (('MK_ATP', 'AMP'), ('MK_ATP_AMP',), 're0000000386_k1'),
+    (('MK_ATP_AMP',), ('MK_ATP', 'AMP'), 're0000000387_k1'),
+    (('MK_ATP_AMP',), ('MK_ADP_ADP',), 're0000000388_k1'),
+    (('MK_ADP_ADP',), ('MK_ATP_AMP',), 're0000000389_k1'),
+    (('MK_ADP_ADP',), ('MK_ADP_1', 'ADP'), 're0000000390_k1'),
+    (('MK_ADP_1', 'ADP'), ('MK_ADP_ADP',), 're0000000391_k1'),
+    (('MK_ADP_ADP',), ('MK_ADP_2', 'ADP'), 're0000000392_k1'),
+    (('MK_ADP_2', 'ADP'), ('MK_ADP_ADP',), 're0000000393_k1'),
+    (('MK_ADP_1',), ('MK', 'ADP'), 're0000000394_k1'),
+    (('MK', 'ADP'), ('MK_ADP_1',), 're0000000395_k1'),
+    (('MK_ADP_2',), ('ADP', 'MK'), 're0000000396_k1'),
+    (('MK', 'ADP'), ('MK_ADP_2',), 're0000000397_k1'),
+    (('PPiase', 'PPi'), ('PPiase_PPi',), 're0000000405_k1'),
+    (('PPiase_PPi',), ('PPiase', 'PPi'), 're0000000406_k1'),
+    (('PPiase_PPi',), ('PPiase_PO4_PO4',), 're0000000407_k1'),
+    (('PPiase_PO4_PO4',), ('PPiase_PPi',), 're0000000408_k1'),
+    (('PPiase_PO4_PO4',), ('PPiase_PO4', 'PO4'), 're0000000409_k1'),
+    (('PPiase_PO4', 'PO4'), ('PPiase_PO4_PO4',), 're0000000410_k1'),
+    (('PPiase_PO4',), ('PPiase', 'PO4'), 're0000000411_k1'),
+    (('PPiase', 'PO4'), ('PPiase_PO4',), 're0000000412_k1'),
+    (('MTF', 'FD'), ('MTF_FD',), 're0000000418_k1'),
+    (('MTF_FD',), ('MTF', 'FD'), 're0000000419_k1'),
+    (('MTF_THF',), ('MTF', 'THF'), 're0000000434_k1'),
+    (('IF2', 'GTP'), ('IF2_GTP',), 're0000000445_k1'),
+    (('IF2_GTP',), ('GTP', 'IF2'), 're0000000446_k1'),
+    (('IF2', 'GDP'), ('IF2_GDP',), 're0000000447_k1'),
+    (('IF2_GDP',), ('IF2', 'GDP'), 're0000000448_k1'),
+    (('RS70S',), ('RS30S', 'RS50S'), 're0000000455_k1'),
+    (('RS30S', 'RS50S'), ('RS70S',), 're0000000456_k1'),
+    (('RS70S', 'IF3'), ('RS70S_IF3',), 're0000000457_k1'),
+    (('RS70S_IF3',), ('RS70S', 'IF3'), 're0000000458_k1'),
+    (('RS30S', 'IF3'), ('RS30S_IF3',), 're0000000459_k1'),
+    (('RS30S_IF3',), ('RS30S', 'IF3'), 're0000000460_k1'),
+    (('RS70S_IF3',), ('RS30S_IF3', 'RS50S'), 're0000000461_k1'),
+    (('RS30S_IF3', 'RS50S'), ('RS70S_IF3',), 're0000000462_k1'),
+    (('RS30S_IF3', 'IF2_GTP'), ('RS30S_IF3_IF2_GTP',), 're0000000463_k1'),
+    (('RS30S_IF3_IF2_GTP',), ('RS30S_IF3', 'IF2_GTP'), 're0000000464_k1'),
+    (('RS30S_IF3', 'mRNA'), ('RS30S_IF3_mRNA',), 're0000000469_k1'),
+    (('RS30S_IF3_mRNA',), ('RS30S_IF3', 'mRNA'), 're0000000470_k1'),
+    (('RS30S_IF3_mRNA', 'IF2_GTP'), ('RS30S_IF3_IF2_GTP_mRNA',), 're0000000471_k1'),
+    (('RS30S_IF3_IF2_GTP_mRNA',), ('RS30S_IF3_mRNA', 'IF2_GTP'), 're0000000472_k1'),
+    (('RS30S_IF3_IF2_GTP', 'mRNA'), ('RS30S_IF3_IF2_GTP_mRNA',), 're0000000481_k1'),
+    (('RS30S_IF3_IF2_GTP_mRNA',), ('RS30S_IF3_IF2_GTP', 'mRNA'), 're0000000482_k1'),
+    (('RS70S_IF1',), ('RS30S_IF1', 'RS50S'), 're0000000487_k1'),
+    (('RS30S_IF1', 'RS50S'), ('RS70S_IF1',), 're0000000488_k1'),
+    (('RS70S_IF1', 'IF3'), ('RS70S_IF1_IF3',), 're0000000489_k1'),
+    (('RS70S_IF1_IF3',), ('RS70S_IF1', 'IF3'), 're0000000490_k1'),
+    (('RS30S_IF1', 'IF3'), ('RS30S_IF1_IF3',), 're0000000491_k1'),
+    (('RS30S_IF1_IF3',), ('RS30S_IF1', 'IF3'), 're0000000492_k1'),
+    (('RS70S_IF1_IF3',), ('RS30S_IF1_IF3', 'RS50S'), 're0000000493_k1'),
+    (('RS30S_IF1_IF3', 'RS50S'), ('RS70S_IF1_IF3',), 're0000000494_k1'),
+    (('RS30S_IF1_IF3', 'IF2_GTP'), ('RS30S_IF1_IF3_IF2_GTP',), 're0000000495_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP',), ('RS30S_IF1_IF3', 'IF2_GTP'), 're0000000496_k1'),
+    (('RS70S', 'IF1'), ('RS70S_IF1',), 're0000000501_k1'),
+    (('RS70S_IF1',), ('RS70S', 'IF1'), 're0000000502_k1'),
+    (('RS30S', 'IF1'), ('RS30S_IF1',), 're0000000503_k1'),
+    (('RS30S_IF1',), ('RS30S', 'IF1'), 're0000000504_k1'),
+    (('RS70S_IF3', 'IF1'), ('RS70S_IF1_IF3',), 're0000000505_k1'),
+    (('RS70S_IF1_IF3',), ('RS70S_IF3', 'IF1'), 're0000000506_k1'),
+    (('RS30S_IF3', 'IF1'), ('RS30S_IF1_IF3',), 're0000000507_k1'),
+    (('RS30S_IF1_IF3',), ('RS30S_IF3', 'IF1'), 're0000000508_k1'),
+    (('RS30S_IF3_IF2_GTP', 'IF1'), ('RS30S_IF1_IF3_IF2_GTP',), 're0000000509_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP',), ('RS30S_IF3_IF2_GTP', 'IF1'), 're0000000510_k1'),
+    (('RS30S_IF1_IF3', 'mRNA'), ('RS30S_IF1_IF3_mRNA',), 're0000000513_k1'),
+    (('RS30S_IF1_IF3_mRNA',), ('RS30S_IF1_IF3', 'mRNA'), 're0000000514_k1'),
+    (('RS30S_IF1_IF3_mRNA', 'IF2_GTP'), ('RS30S_IF1_IF3_IF2_GTP_mRNA',), 're0000000515_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP_mRNA',), ('RS30S_IF1_IF3_mRNA', 'IF2_GTP'), 're0000000516_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP', 'mRNA'), ('RS30S_IF1_IF3_IF2_GTP_mRNA',), 're0000000525_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP_mRNA',), ('RS30S_IF1_IF3_IF2_GTP', 'mRNA'), 're0000000526_k1'),
+    (('RS30S_IF3_mRNA', 'IF1'), ('RS30S_IF1_IF3_mRNA',), 're0000000531_k1'),
+    (('RS30S_IF1_IF3_mRNA',), ('RS30S_IF3_mRNA', 'IF1'), 're0000000532_k1'),
+    (('RS30S_IF3_IF2_GTP_mRNA', 'IF1'), ('RS30S_IF1_IF3_IF2_GTP_mRNA',), 're0000000535_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP_mRNA',), ('RS30S_IF3_IF2_GTP_mRNA', 'IF1'), 're0000000536_k1'),
+    (('RS30S_IF2_GTP',), ('IF2_GTP', 'RS30S'), 're0000000610_k1'),
+    (('RS30S_IF2_GTP', 'IF3'), ('RS30S_IF3_IF2_GTP',), 're0000000615_k1'),
+    (('RS30S_IF3_IF2_GTP',), ('IF3', 'RS30S_IF2_GTP'), 're0000000616_k1'),
+    (('mRNA', 'RS30S'), ('RS30S_mRNA',), 're0000000619_k1'),
+    (('RS30S_mRNA',), ('RS30S', 'mRNA'), 're0000000620_k1'),
+    (('RS30S_mRNA', 'IF2_GTP'), ('RS30S_IF2_GTP_mRNA',), 're0000000625_k1'),
+    (('RS30S_IF2_GTP_mRNA',), ('IF2_GTP', 'RS30S_mRNA'), 're0000000626_k1'),
+    (('mRNA', 'RS30S_IF2_GTP'), ('RS30S_IF2_GTP_mRNA',), 're0000000631_k1'),
+    (('RS30S_IF2_GTP_mRNA',), ('RS30S_IF2_GTP', 'mRNA'), 're0000000632_k1'),
+    (('RS30S_mRNA', 'IF3'), ('RS30S_IF3_mRNA',), 're0000000635_k1'),
+    (('RS30S_IF3_mRNA',), ('IF3', 'RS30S_mRNA'), 're0000000636_k1'),
+    (('RS30S_IF2_GTP_mRNA', 'IF3'), ('RS30S_IF3_IF2_GTP_mRNA',), 're0000000639_k1'),
+    (('RS30S_IF3_IF2_GTP_mRNA',), ('IF3', 'RS30S_IF2_GTP_mRNA'), 're0000000640_k1'),
+    (('RS30S_IF1', 'IF2_GTP'), ('RS30S_IF1_IF2_GTP',), 're0000000643_k1'),
+    (('RS30S_IF1_IF2_GTP',), ('IF2_GTP', 'RS30S_IF1'), 're0000000644_k1'),
+    (('IF1', 'RS30S_IF2_GTP'), ('RS30S_IF1_IF2_GTP',), 're0000000649_k1'),
+    (('RS30S_IF1_IF2_GTP',), ('IF1', 'RS30S_IF2_GTP'), 're0000000650_k1'),
+    (('RS30S_IF1_IF2_GTP', 'IF3'), ('RS30S_IF1_IF3_IF2_GTP',), 're0000000653_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP',), ('IF3', 'RS30S_IF1_IF2_GTP'), 're0000000654_k1'),
+    (('RS30S_IF1_mRNA', 'IF2_GTP'), ('RS30S_IF1_IF2_GTP_mRNA',), 're0000000657_k1'),
+    (('RS30S_IF1_IF2_GTP_mRNA',), ('RS30S_IF1_mRNA', 'IF2_GTP'), 're0000000658_k1'),
+    (('RS30S_IF1_mRNA', 'IF3'), ('RS30S_IF1_IF3_mRNA',), 're0000000667_k1'),
+    (('RS30S_IF1_IF3_mRNA',), ('IF3', 'RS30S_IF1_mRNA'), 're0000000668_k1'),
+    (('RS30S_IF1_IF2_GTP_mRNA', 'IF3'), ('RS30S_IF1_IF3_IF2_GTP_mRNA',), 're0000000671_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP_mRNA',), ('IF3', 'RS30S_IF1_IF2_GTP_mRNA'), 're0000000672_k1'),
+    (('RS30S_IF1', 'mRNA'), ('RS30S_IF1_mRNA',), 're0000000675_k1'),
+    (('RS30S_IF1_mRNA',), ('RS30S_IF1', 'mRNA'), 're0000000676_k1'),
+    (('RS30S_mRNA', 'IF1'), ('RS30S_IF1_mRNA',), 're0000000677_k1'),
+    (('RS30S_IF1_mRNA',), ('RS30S_mRNA', 'IF1'), 're0000000678_k1'),
+    (('RS30S_IF2_GTP_mRNA', 'IF1'), ('RS30S_IF1_IF2_GTP_mRNA',), 're0000000679_k1'),
+    (('RS30S_IF1_IF2_GTP_mRNA',), ('RS30S_IF2_GTP_mRNA', 'IF1'), 're0000000680_k1'),
+    (('RS30S_IF1_IF2_GTP', 'mRNA'), ('RS30S_IF1_IF2_GTP_mRNA',), 're0000000681_k1'),
+    (('RS30S_IF1_IF2_GTP_mRNA',), ('RS30S_IF1_IF2_GTP', 'mRNA'), 're0000000682_k1'),
+    (('RF3_GDP',), ('GDP', 'RF3'), 're0000000825_k1'),
+    (('RF3', 'GDP'), ('RF3_GDP',), 're0000000826_k1'),
+    (('RF3', 'GTP'), ('RF3_GTP',), 're0000000827_k1'),
+    (('RF3_GTP',), ('RF3', 'GTP'), 're0000000828_k1'),
+    (('RS50S_RRF',), ('RS50S', 'RRF'), 're0000000918_k1'),
+    (('RS50S_RRF_EFG_GDP',), ('RS50S_RRF', 'EFG_GDP'), 're0000000922_k1'),
+    (('RS50S_RRF_EFG_GDP',), ('RS50S_EFG_GDP', 'RRF'), 're0000000923_k1'),
+)
+
+#fMet and the MetRS initiator species
+FMET_SPECIES = (
+    'fMettRNAfMetCAU', 'fMettRNAfMetCAU_degraded', 'Met', 'MetAMP', 'MetRS',
+    'tRNAfMetCAU', 'tRNAfMetCAU_degraded', 'EFTu_GTP_MettRNAfMetCAU', 'MetRS_AMP',
+    'MetRS_AMP_MettRNAfMetCAU', 'MetRS_ATP', 'MetRS_ATP_tRNAfMetCAU', 'MetRS_degraded',
+    'MetRS_Met', 'MetRS_Met_ATP', 'MetRS_Met_ATP_tRNAfMetCAU', 'MetRS_Met_tRNAfMetCAU',
+    'MetRS_MetAMP', 'MetRS_MetAMP_PPi', 'MetRS_MetAMP_PPi_tRNAfMetCAU',
+    'MetRS_MetAMP_tRNAfMetCAU', 'MetRS_MettRNAfMetCAU', 'MetRS_tRNAfMetCAU',
+    'MettRNAfMetCAU', 'MettRNAfMetCAU_degraded', 'MTF_FD_MettRNAfMetCAU',
+    'MTF_fMettRNAfMetCAU', 'MTF_MettRNAfMetCAU', 'MTF_THF_fMettRNAfMetCAU',
+    'RS30S_fMettRNAfMetCAU_mRNA', 'RS30S_IF1_fMettRNAfMetCAU_mRNA',
+    'RS30S_IF1_IF2_GTP_fMettRNAfMetCAU', 'RS30S_IF1_IF2_GTP_fMettRNAfMetCAU_mRNA',
+    'RS30S_IF1_IF3_fMettRNAfMetCAU_mRNA', 'RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU',
+    'RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA', 'RS30S_IF2_GTP_fMettRNAfMetCAU',
+    'RS30S_IF2_GTP_fMettRNAfMetCAU_mRNA', 'RS30S_IF3_fMettRNAfMetCAU_mRNA',
+    'RS30S_IF3_IF2_GTP_fMettRNAfMetCAU', 'RS30S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',
+    'RS70S_IF1_fMettRNAfMetCAU_mRNA', 'RS70S_IF1_IF2_GDP_fMettRNAfMetCAU_mRNA',
+    'RS70S_IF1_IF3_fMettRNAfMetCAU_mRNA', 'RS70S_IF1_IF3_IF2_GDP_fMettRNAfMetCAU_mRNA',
+    'RS70S_IF1_IF3_IF2_GDP_PO4_fMettRNAfMetCAU_mRNA',
+    'RS70S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA', 'RS70S_IF2_GDP_fMettRNAfMetCAU_mRNA',
+    'RS70S_IF3_fMettRNAfMetCAU_mRNA', 'RS70S_IF3_IF2_GDP_fMettRNAfMetCAU_mRNA',
+    'RS70S_IF3_IF2_GDP_PO4_fMettRNAfMetCAU_mRNA',
+    'RS70S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',
+)
+
+FMET_REACTIONS = (
+    (('MetRS', 'Met'), ('MetRS_Met',), 're0000000151_k1'),
+    (('MetRS_MetAMP_PPi',), ('MetRS_MetAMP', 'PPi'), 're0000000152_k1'),
+    (('MetRS_Met',), ('MetRS', 'Met'), 're0000000156_k1'),
+    (('MetRS', 'ATP'), ('MetRS_ATP',), 're0000000157_k1'),
+    (('MetRS_ATP',), ('MetRS', 'ATP'), 're0000000158_k1'),
+    (('MetRS_ATP', 'Met'), ('MetRS_Met_ATP',), 're0000000159_k1'),
+    (('MetRS_Met_ATP',), ('MetRS_ATP', 'Met'), 're0000000160_k1'),
+    (('MetRS_Met', 'ATP'), ('MetRS_Met_ATP',), 're0000000161_k1'),
+    (('MetRS_Met_ATP',), ('MetRS_Met', 'ATP'), 're0000000162_k1'),
+    (('MetRS_Met_ATP',), ('MetRS_MetAMP_PPi',), 're0000000165_k1'),
+    (('MetRS_MetAMP_PPi',), ('MetRS_Met_ATP',), 're0000000166_k1'),
+    (('MetRS_AMP',), ('MetRS', 'AMP'), 're0000000170_k1'),
+    (('MetRS_MetAMP',), ('MetRS', 'MetAMP'), 're0000000172_k1'),
+    (('MetRS', 'MetAMP'), ('MetRS_MetAMP',), 're0000000173_k1'),
+    (('MetRS_MetAMP_tRNAfMetCAU',), ('MetRS_AMP_MettRNAfMetCAU',), 're0000000220_k1'),
+    (('MetRS_AMP_MettRNAfMetCAU',), ('MetRS_MettRNAfMetCAU', 'AMP'), 're0000000222_k1'),
+    (('MetRS_AMP_MettRNAfMetCAU',), ('MettRNAfMetCAU', 'MetRS_AMP'), 're0000000224_k1'),
+    (('MetRS_AMP', 'MettRNAfMetCAU'), ('MetRS_AMP_MettRNAfMetCAU',), 're0000000225_k1'),
+    (('MetRS_MettRNAfMetCAU',), ('MetRS', 'MettRNAfMetCAU'), 're0000000226_k1'),
+    (('MetRS', 'MettRNAfMetCAU'), ('MetRS_MettRNAfMetCAU',), 're0000000227_k1'),
+    (('MetRS_tRNAfMetCAU', 'Met'), ('MetRS_Met_tRNAfMetCAU',), 're0000000230_k1'),
+    (('MetRS_MetAMP_PPi_tRNAfMetCAU',), ('MetRS_MetAMP_tRNAfMetCAU', 'PPi'), 're0000000231_k1'),
+    (('MetRS_Met_tRNAfMetCAU',), ('MetRS_tRNAfMetCAU', 'Met'), 're0000000232_k1'),
+    (('MetRS_tRNAfMetCAU', 'ATP'), ('MetRS_ATP_tRNAfMetCAU',), 're0000000233_k1'),
+    (('MetRS_ATP_tRNAfMetCAU',), ('MetRS_tRNAfMetCAU', 'ATP'), 're0000000234_k1'),
+    (('MetRS_ATP_tRNAfMetCAU', 'Met'), ('MetRS_Met_ATP_tRNAfMetCAU',), 're0000000235_k1'),
+    (('MetRS_Met_ATP_tRNAfMetCAU',), ('MetRS_ATP_tRNAfMetCAU', 'Met'), 're0000000236_k1'),
+    (('MetRS_Met_tRNAfMetCAU', 'ATP'), ('MetRS_Met_ATP_tRNAfMetCAU',), 're0000000237_k1'),
+    (('MetRS_Met_ATP_tRNAfMetCAU',), ('MetRS_Met_tRNAfMetCAU', 'ATP'), 're0000000238_k1'),
+    (('MetRS_Met_ATP_tRNAfMetCAU',), ('MetRS_MetAMP_PPi_tRNAfMetCAU',), 're0000000239_k1'),
+    (('MetRS', 'tRNAfMetCAU'), ('MetRS_tRNAfMetCAU',), 're0000000241_k1'),
+    (('MetRS_Met', 'tRNAfMetCAU'), ('MetRS_Met_tRNAfMetCAU',), 're0000000242_k1'),
+    (('MetRS_tRNAfMetCAU',), ('MetRS', 'tRNAfMetCAU'), 're0000000243_k1'),
+    (('MetRS_Met_tRNAfMetCAU',), ('MetRS_Met', 'tRNAfMetCAU'), 're0000000244_k1'),
+    (('MetRS_ATP', 'tRNAfMetCAU'), ('MetRS_ATP_tRNAfMetCAU',), 're0000000245_k1'),
+    (('MetRS_ATP_tRNAfMetCAU',), ('MetRS_ATP', 'tRNAfMetCAU'), 're0000000246_k1'),
+    (('MetRS_Met_ATP', 'tRNAfMetCAU'), ('MetRS_Met_ATP_tRNAfMetCAU',), 're0000000247_k1'),
+    (('MetRS_Met_ATP_tRNAfMetCAU',), ('MetRS_Met_ATP', 'tRNAfMetCAU'), 're0000000248_k1'),
+    (('MetRS_MetAMP_PPi', 'tRNAfMetCAU'), ('MetRS_MetAMP_PPi_tRNAfMetCAU',), 're0000000249_k1'),
+    (('MetRS_MetAMP_PPi_tRNAfMetCAU',), ('MetRS_MetAMP_PPi', 'tRNAfMetCAU'), 're0000000250_k1'),
+    (('MetRS_MetAMP', 'tRNAfMetCAU'), ('MetRS_MetAMP_tRNAfMetCAU',), 're0000000251_k1'),
+    (('MetRS_MetAMP_tRNAfMetCAU',), ('MetRS_MetAMP', 'tRNAfMetCAU'), 're0000000252_k1'),
+    (('EFTu_GTP', 'MettRNAfMetCAU'), ('EFTu_GTP_MettRNAfMetCAU',), 're0000000288_k1'),
+    (('EFTu_GTP_MettRNAfMetCAU',), ('EFTu_GTP', 'MettRNAfMetCAU'), 're0000000289_k1'),
+    (('MTF', 'MettRNAfMetCAU'), ('MTF_MettRNAfMetCAU',), 're0000000420_k1'),
+    (('MTF_MettRNAfMetCAU',), ('MTF', 'MettRNAfMetCAU'), 're0000000421_k1'),
+    (('MTF_FD', 'MettRNAfMetCAU'), ('MTF_FD_MettRNAfMetCAU',), 're0000000422_k1'),
+    (('MTF_FD_MettRNAfMetCAU',), ('MettRNAfMetCAU', 'MTF_FD'), 're0000000423_k1'),
+    (('MTF_MettRNAfMetCAU', 'FD'), ('MTF_FD_MettRNAfMetCAU',), 're0000000424_k1'),
+    (('MTF_FD_MettRNAfMetCAU',), ('MTF_MettRNAfMetCAU', 'FD'), 're0000000425_k1'),
+    (('MTF_FD_MettRNAfMetCAU',), ('MTF_THF_fMettRNAfMetCAU',), 're0000000426_k1'),
+    (('MTF_THF_fMettRNAfMetCAU',), ('MTF_THF', 'fMettRNAfMetCAU'), 're0000000428_k1'),
+    (('MTF_THF_fMettRNAfMetCAU',), ('MTF_fMettRNAfMetCAU', 'THF'), 're0000000430_k1'),
+    (('MTF_fMettRNAfMetCAU',), ('MTF', 'fMettRNAfMetCAU'), 're0000000432_k1'),
+    (('IF2_GTP', 'fMettRNAfMetCAU'), ('IF2_GTP_fMettRNAfMetCAU',), 're0000000449_k1'),
+    (('IF2_GTP_fMettRNAfMetCAU',), ('IF2_GTP', 'fMettRNAfMetCAU'), 're0000000450_k1'),
+    (('RS30S_IF3', 'IF2_GTP_fMettRNAfMetCAU'), ('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU',), 're0000000465_k1'),
+    (('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU',), ('RS30S_IF3', 'IF2_GTP_fMettRNAfMetCAU'), 're0000000466_k1'),
+    (('RS30S_IF3_IF2_GTP', 'fMettRNAfMetCAU'), ('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU',), 're0000000467_k1'),
+    (('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU',), ('RS30S_IF3_IF2_GTP', 'fMettRNAfMetCAU'), 're0000000468_k1'),
+    (('RS30S_IF3_mRNA', 'fMettRNAfMetCAU'), ('RS30S_IF3_fMettRNAfMetCAU_mRNA',), 're0000000473_k1'),
+    (('RS30S_IF3_fMettRNAfMetCAU_mRNA',), ('RS30S_IF3_mRNA', 'fMettRNAfMetCAU'), 're0000000474_k1'),
+    (('RS30S_IF3_mRNA', 'IF2_GTP_fMettRNAfMetCAU'), ('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000475_k1'),
+    (('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('RS30S_IF3_mRNA', 'IF2_GTP_fMettRNAfMetCAU'), 're0000000476_k1'),
+    (('RS30S_IF3_fMettRNAfMetCAU_mRNA', 'IF2_GTP'), ('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000477_k1'),
+    (('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('RS30S_IF3_fMettRNAfMetCAU_mRNA', 'IF2_GTP'), 're0000000478_k1'),
+    (('RS30S_IF3_IF2_GTP_mRNA', 'fMettRNAfMetCAU'), ('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000479_k1'),
+    (('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('RS30S_IF3_IF2_GTP_mRNA', 'fMettRNAfMetCAU'), 're0000000480_k1'),
+    (('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU', 'mRNA'), ('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000483_k1'),
+    (('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU', 'mRNA'), 're0000000484_k1'),
+    (('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA', 'RS50S'), ('RS70S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000485_k1'),
+    (('RS70S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA', 'RS50S'), 're0000000486_k1'),
+    (('RS30S_IF1_IF3', 'IF2_GTP_fMettRNAfMetCAU'), ('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU',), 're0000000497_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU',), ('RS30S_IF1_IF3', 'IF2_GTP_fMettRNAfMetCAU'), 're0000000498_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP', 'fMettRNAfMetCAU'), ('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU',), 're0000000499_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU',), ('RS30S_IF1_IF3_IF2_GTP', 'fMettRNAfMetCAU'), 're0000000500_k1'),
+    (('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU', 'IF1'), ('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU',), 're0000000511_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU',), ('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU', 'IF1'), 're0000000512_k1'),
+    (('RS30S_IF1_IF3_mRNA', 'fMettRNAfMetCAU'), ('RS30S_IF1_IF3_fMettRNAfMetCAU_mRNA',), 're0000000517_k1'),
+    (('RS30S_IF1_IF3_fMettRNAfMetCAU_mRNA',), ('RS30S_IF1_IF3_mRNA', 'fMettRNAfMetCAU'), 're0000000518_k1'),
+    (('RS30S_IF1_IF3_mRNA', 'IF2_GTP_fMettRNAfMetCAU'), ('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000519_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('RS30S_IF1_IF3_mRNA', 'IF2_GTP_fMettRNAfMetCAU'), 're0000000520_k1'),
+    (('RS30S_IF1_IF3_fMettRNAfMetCAU_mRNA', 'IF2_GTP'), ('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000521_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('RS30S_IF1_IF3_fMettRNAfMetCAU_mRNA', 'IF2_GTP'), 're0000000522_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP_mRNA', 'fMettRNAfMetCAU'), ('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000523_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('RS30S_IF1_IF3_IF2_GTP_mRNA', 'fMettRNAfMetCAU'), 're0000000524_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU', 'mRNA'), ('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000527_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU', 'mRNA'), 're0000000528_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA', 'RS50S'), ('RS70S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000529_k1'),
+    (('RS70S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA', 'RS50S'), 're0000000530_k1'),
+    (('RS30S_IF3_fMettRNAfMetCAU_mRNA', 'IF1'), ('RS30S_IF1_IF3_fMettRNAfMetCAU_mRNA',), 're0000000533_k1'),
+    (('RS30S_IF1_IF3_fMettRNAfMetCAU_mRNA',), ('RS30S_IF3_fMettRNAfMetCAU_mRNA', 'IF1'), 're0000000534_k1'),
+    (('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA', 'IF1'), ('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000537_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA', 'IF1'), 're0000000538_k1'),
+    (('RS70S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA', 'IF1'), ('RS70S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000539_k1'),
+    (('RS70S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('RS70S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA', 'IF1'), 're0000000540_k1'),
+    (('RS30S', 'IF2_GTP_fMettRNAfMetCAU'), ('RS30S_IF2_GTP_fMettRNAfMetCAU',), 're0000000611_k1'),
+    (('RS30S_IF2_GTP_fMettRNAfMetCAU',), ('IF2_GTP_fMettRNAfMetCAU', 'RS30S'), 're0000000612_k1'),
+    (('RS30S_IF2_GTP', 'fMettRNAfMetCAU'), ('RS30S_IF2_GTP_fMettRNAfMetCAU',), 're0000000613_k1'),
+    (('RS30S_IF2_GTP_fMettRNAfMetCAU',), ('fMettRNAfMetCAU', 'RS30S_IF2_GTP'), 're0000000614_k1'),
+    (('RS30S_IF2_GTP_fMettRNAfMetCAU', 'IF3'), ('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU',), 're0000000617_k1'),
+    (('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU',), ('IF3', 'RS30S_IF2_GTP_fMettRNAfMetCAU'), 're0000000618_k1'),
+    (('RS30S_mRNA', 'fMettRNAfMetCAU'), ('RS30S_fMettRNAfMetCAU_mRNA',), 're0000000621_k1'),
+    (('RS30S_fMettRNAfMetCAU_mRNA',), ('fMettRNAfMetCAU', 'RS30S_mRNA'), 're0000000622_k1'),
+    (('RS30S_mRNA', 'IF2_GTP_fMettRNAfMetCAU'), ('RS30S_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000623_k1'),
+    (('RS30S_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('IF2_GTP_fMettRNAfMetCAU', 'RS30S_mRNA'), 're0000000624_k1'),
+    (('RS30S_fMettRNAfMetCAU_mRNA', 'IF2_GTP'), ('RS30S_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000627_k1'),
+    (('RS30S_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('IF2_GTP', 'RS30S_fMettRNAfMetCAU_mRNA'), 're0000000628_k1'),
+    (('RS30S_IF2_GTP_mRNA', 'fMettRNAfMetCAU'), ('RS30S_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000629_k1'),
+    (('RS30S_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('fMettRNAfMetCAU', 'RS30S_IF2_GTP_mRNA'), 're0000000630_k1'),
+    (('mRNA', 'RS30S_IF2_GTP_fMettRNAfMetCAU'), ('RS30S_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000633_k1'),
+    (('RS30S_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('RS30S_IF2_GTP_fMettRNAfMetCAU', 'mRNA'), 're0000000634_k1'),
+    (('RS30S_fMettRNAfMetCAU_mRNA', 'IF3'), ('RS30S_IF3_fMettRNAfMetCAU_mRNA',), 're0000000637_k1'),
+    (('RS30S_IF3_fMettRNAfMetCAU_mRNA',), ('IF3', 'RS30S_fMettRNAfMetCAU_mRNA'), 're0000000638_k1'),
+    (('RS30S_IF2_GTP_fMettRNAfMetCAU_mRNA', 'IF3'), ('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000641_k1'),
+    (('RS30S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('IF3', 'RS30S_IF2_GTP_fMettRNAfMetCAU_mRNA'), 're0000000642_k1'),
+    (('RS30S_IF1', 'IF2_GTP_fMettRNAfMetCAU'), ('RS30S_IF1_IF2_GTP_fMettRNAfMetCAU',), 're0000000645_k1'),
+    (('RS30S_IF1_IF2_GTP_fMettRNAfMetCAU',), ('IF2_GTP_fMettRNAfMetCAU', 'RS30S_IF1'), 're0000000646_k1'),
+    (('RS30S_IF1_IF2_GTP', 'fMettRNAfMetCAU'), ('RS30S_IF1_IF2_GTP_fMettRNAfMetCAU',), 're0000000647_k1'),
+    (('RS30S_IF1_IF2_GTP_fMettRNAfMetCAU',), ('fMettRNAfMetCAU', 'RS30S_IF1_IF2_GTP'), 're0000000648_k1'),
+    (('RS30S_IF2_GTP_fMettRNAfMetCAU', 'IF1'), ('RS30S_IF1_IF2_GTP_fMettRNAfMetCAU',), 're0000000651_k1'),
+    (('RS30S_IF1_IF2_GTP_fMettRNAfMetCAU',), ('IF1', 'RS30S_IF2_GTP_fMettRNAfMetCAU'), 're0000000652_k1'),
+    (('RS30S_IF1_IF2_GTP_fMettRNAfMetCAU', 'IF3'), ('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU',), 're0000000655_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU',), ('IF3', 'RS30S_IF1_IF2_GTP_fMettRNAfMetCAU'), 're0000000656_k1'),
+    (('RS30S_IF1_mRNA', 'fMettRNAfMetCAU'), ('RS30S_IF1_fMettRNAfMetCAU_mRNA',), 're0000000659_k1'),
+    (('RS30S_IF1_fMettRNAfMetCAU_mRNA',), ('fMettRNAfMetCAU', 'RS30S_IF1_mRNA'), 're0000000660_k1'),
+    (('RS30S_IF1_IF2_GTP_mRNA', 'fMettRNAfMetCAU'), ('RS30S_IF1_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000661_k1'),
+    (('RS30S_IF1_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('fMettRNAfMetCAU', 'RS30S_IF1_IF2_GTP_mRNA'), 're0000000662_k1'),
+    (('RS30S_IF1_fMettRNAfMetCAU_mRNA', 'IF2_GTP'), ('RS30S_IF1_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000663_k1'),
+    (('RS30S_IF1_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('IF2_GTP', 'RS30S_IF1_fMettRNAfMetCAU_mRNA'), 're0000000664_k1'),
+    (('RS30S_IF1_mRNA', 'IF2_GTP_fMettRNAfMetCAU'), ('RS30S_IF1_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000665_k1'),
+    (('RS30S_IF1_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('IF2_GTP_fMettRNAfMetCAU', 'RS30S_IF1_mRNA'), 're0000000666_k1'),
+    (('RS30S_IF1_fMettRNAfMetCAU_mRNA', 'IF3'), ('RS30S_IF1_IF3_fMettRNAfMetCAU_mRNA',), 're0000000669_k1'),
+    (('RS30S_IF1_IF3_fMettRNAfMetCAU_mRNA',), ('IF3', 'RS30S_IF1_fMettRNAfMetCAU_mRNA'), 're0000000670_k1'),
+    (('RS30S_IF1_IF2_GTP_fMettRNAfMetCAU_mRNA', 'IF3'), ('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000673_k1'),
+    (('RS30S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('IF3', 'RS30S_IF1_IF2_GTP_fMettRNAfMetCAU_mRNA'), 're0000000674_k1'),
+    (('RS30S_fMettRNAfMetCAU_mRNA', 'IF1'), ('RS30S_IF1_fMettRNAfMetCAU_mRNA',), 're0000000683_k1'),
+    (('RS30S_IF1_fMettRNAfMetCAU_mRNA',), ('RS30S_fMettRNAfMetCAU_mRNA', 'IF1'), 're0000000684_k1'),
+    (('IF1', 'RS30S_IF2_GTP_fMettRNAfMetCAU_mRNA'), ('RS30S_IF1_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000685_k1'),
+    (('RS30S_IF1_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('RS30S_IF2_GTP_fMettRNAfMetCAU_mRNA', 'IF1'), 're0000000686_k1'),
+    (('RS30S_IF1_IF2_GTP_fMettRNAfMetCAU', 'mRNA'), ('RS30S_IF1_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000687_k1'),
+    (('RS30S_IF1_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('RS30S_IF1_IF2_GTP_fMettRNAfMetCAU', 'mRNA'), 're0000000688_k1'),
+    (('RS70S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('RS70S_IF3_IF2_GDP_PO4_fMettRNAfMetCAU_mRNA',), 're0000000715_k1'),
+    (('RS70S_IF3_IF2_GDP_PO4_fMettRNAfMetCAU_mRNA',), ('RS70S_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000716_k1'),
+    (('RS70S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), ('RS70S_IF1_IF3_IF2_GDP_PO4_fMettRNAfMetCAU_mRNA',), 're0000000717_k1'),
+    (('RS70S_IF1_IF3_IF2_GDP_PO4_fMettRNAfMetCAU_mRNA',), ('RS70S_IF1_IF3_IF2_GTP_fMettRNAfMetCAU_mRNA',), 're0000000718_k1'),
+    (('RS70S_IF3_IF2_GDP_PO4_fMettRNAfMetCAU_mRNA', 'IF1'), ('RS70S_IF1_IF3_IF2_GDP_PO4_fMettRNAfMetCAU_mRNA',), 're0000000719_k1'),
+    (('RS70S_IF1_IF3_IF2_GDP_PO4_fMettRNAfMetCAU_mRNA',), ('RS70S_IF3_IF2_GDP_PO4_fMettRNAfMetCAU_mRNA', 'IF1'), 're0000000720_k1'),
+    (('RS70S_IF3_IF2_GDP_PO4_fMettRNAfMetCAU_mRNA',), ('RS70S_IF3_IF2_GDP_fMettRNAfMetCAU_mRNA', 'PO4'), 're0000000721_k1'),
+    (('RS70S_IF1_IF3_IF2_GDP_PO4_fMettRNAfMetCAU_mRNA',), ('RS70S_IF1_IF3_IF2_GDP_fMettRNAfMetCAU_mRNA', 'PO4'), 're0000000722_k1'),
+    (('RS70S_IF3_IF2_GDP_fMettRNAfMetCAU_mRNA', 'IF1'), ('RS70S_IF1_IF3_IF2_GDP_fMettRNAfMetCAU_mRNA',), 're0000000723_k1'),
+    (('RS70S_IF1_IF3_IF2_GDP_fMettRNAfMetCAU_mRNA',), ('RS70S_IF3_IF2_GDP_fMettRNAfMetCAU_mRNA', 'IF1'), 're0000000724_k1'),
+    (('RS70S_IF3_IF2_GDP_fMettRNAfMetCAU_mRNA',), ('RS70S_IF3_fMettRNAfMetCAU_mRNA', 'IF2_GDP'), 're0000000725_k1'),
+    (('RS70S_IF1_IF3_IF2_GDP_fMettRNAfMetCAU_mRNA',), ('RS70S_IF1_IF2_GDP_fMettRNAfMetCAU_mRNA', 'IF3'), 're0000000747_k1'),
+    (('RS70S_IF1_IF3_IF2_GDP_fMettRNAfMetCAU_mRNA',), ('RS70S_IF1_IF3_fMettRNAfMetCAU_mRNA', 'IF2_GDP'), 're0000000749_k1'),
+    (('RS70S_IF1_IF3_fMettRNAfMetCAU_mRNA', 'IF2_GDP'), ('RS70S_IF1_IF3_IF2_GDP_fMettRNAfMetCAU_mRNA',), 're0000000750_k1'),
+    (('RS70S_IF3_fMettRNAfMetCAU_mRNA', 'IF2_GDP'), ('RS70S_IF3_IF2_GDP_fMettRNAfMetCAU_mRNA',), 're0000000751_k1'),
+    (('RS70S_IF1_IF3_fMettRNAfMetCAU_mRNA',), ('RS70S_IF3_fMettRNAfMetCAU_mRNA', 'IF1'), 're0000000753_k1'),
+    (('RS70S_IF3_IF2_GDP_fMettRNAfMetCAU_mRNA',), ('RS70S_IF2_GDP_fMettRNAfMetCAU_mRNA', 'IF3'), 're0000000755_k1'),
+    (('RS70S_IF1_IF2_GDP_fMettRNAfMetCAU_mRNA',), ('RS70S_IF2_GDP_fMettRNAfMetCAU_mRNA', 'IF1'), 're0000000757_k1'),
+    (('RS70S_IF1_IF2_GDP_fMettRNAfMetCAU_mRNA',), ('RS70S_IF1_fMettRNAfMetCAU_mRNA', 'IF2_GDP'), 're0000000759_k1'),
+    (('RS70S_IF1_fMettRNAfMetCAU_mRNA', 'IF2_GDP'), ('RS70S_IF1_IF2_GDP_fMettRNAfMetCAU_mRNA',), 're0000000760_k1'),
+    (('RS70S_IF1_IF3_fMettRNAfMetCAU_mRNA',), ('RS70S_IF1_fMettRNAfMetCAU_mRNA', 'IF3'), 're0000000761_k1'),
+)
+
+#Species and reactions repeated for each amino acid, except Met
+AA_SPECIES = (
+    '{aa}', '{aa}AMP', '{aa}RS', '{aa}RS_AMP', '{aa}RS_ATP', '{aa}RS_degraded',
+    '{aa}RS_{aa}', '{aa}RS_{aa}_ATP', '{aa}RS_{aa}AMP', '{aa}RS_{aa}AMP_PPi',
+    '{aa}RS_AMP_{aa}tRNA{aa}{xyz}', '{aa}RS_ATP_tRNA{aa}{xyz}',
+    '{aa}RS_{aa}_ATP_tRNA{aa}{xyz}', '{aa}RS_{aa}_tRNA{aa}{xyz}',
+    '{aa}RS_{aa}AMP_PPi_tRNA{aa}{xyz}', '{aa}RS_{aa}AMP_tRNA{aa}{xyz}',
+    '{aa}RS_{aa}tRNA{aa}{xyz}', '{aa}RS_tRNA{aa}{xyz}', '{aa}tRNA{aa}{xyz}',
+    '{aa}tRNA{aa}{xyz}_degraded', 'tRNA{aa}{xyz}', 'tRNA{aa}{xyz}_degraded',
+    'RS50S_tRNA{aa}{xyz}', 'RS50S_tRNA{aa}{xyz}_EFG_GDP', 'RS50S_tRNA{aa}{xyz}_RRF',
+    'RS50S_tRNA{aa}{xyz}_RRF_EFG_GDP', 'EFTu_GTP_{aa}tRNA{aa}{xyz}',
+)
+
+AA_REACTIONS = (
+    (('{aa}RS', '{aa}'), ('{aa}RS_{aa}',), 're0000000126_k1'),
+    (('{aa}RS_{aa}AMP_PPi',), ('{aa}RS_{aa}AMP', 'PPi'), 're0000000127_k1'),
+    (('{aa}RS_{aa}',), ('{aa}RS', '{aa}'), 're0000000131_k1'),
+    (('{aa}RS', 'ATP'), ('{aa}RS_ATP',), 're0000000132_k1'),
+    (('{aa}RS_ATP',), ('{aa}RS', 'ATP'), 're0000000133_k1'),
+    (('{aa}RS_ATP', '{aa}'), ('{aa}RS_{aa}_ATP',), 're0000000134_k1'),
+    (('{aa}RS_{aa}_ATP',), ('{aa}RS_ATP', '{aa}'), 're0000000135_k1'),
+    (('{aa}RS_{aa}', 'ATP'), ('{aa}RS_{aa}_ATP',), 're0000000136_k1'),
+    (('{aa}RS_{aa}_ATP',), ('{aa}RS_{aa}', 'ATP'), 're0000000137_k1'),
+    (('{aa}RS_{aa}_ATP',), ('{aa}RS_{aa}AMP_PPi',), 're0000000140_k1'),
+    (('{aa}RS_{aa}AMP_PPi',), ('{aa}RS_{aa}_ATP',), 're0000000141_k1'),
+    (('{aa}RS_AMP',), ('{aa}RS', 'AMP'), 're0000000145_k1'),
+    (('{aa}RS_{aa}AMP',), ('{aa}RS', '{aa}AMP'), 're0000000147_k1'),
+    (('{aa}RS', '{aa}AMP'), ('{aa}RS_{aa}AMP',), 're0000000148_k1'),
+    (('{aa}RS_{aa}AMP_tRNA{aa}{xyz}',), ('{aa}RS_AMP_{aa}tRNA{aa}{xyz}',), 're0000000178_k1'),
+    (('{aa}RS_AMP_{aa}tRNA{aa}{xyz}',), ('{aa}RS_{aa}tRNA{aa}{xyz}', 'AMP'), 're0000000180_k1'),
+    (('{aa}RS_AMP_{aa}tRNA{aa}{xyz}',), ('{aa}tRNA{aa}{xyz}', '{aa}RS_AMP'), 're0000000182_k1'),
+    (('{aa}RS_AMP', '{aa}tRNA{aa}{xyz}'), ('{aa}RS_AMP_{aa}tRNA{aa}{xyz}',), 're0000000183_k1'),
+    (('{aa}RS_{aa}tRNA{aa}{xyz}',), ('{aa}RS', '{aa}tRNA{aa}{xyz}'), 're0000000184_k1'),
+    (('{aa}RS', '{aa}tRNA{aa}{xyz}'), ('{aa}RS_{aa}tRNA{aa}{xyz}',), 're0000000185_k1'),
+    (('{aa}RS_tRNA{aa}{xyz}', '{aa}'), ('{aa}RS_{aa}_tRNA{aa}{xyz}',), 're0000000188_k1'),
+    (('{aa}RS_{aa}AMP_PPi_tRNA{aa}{xyz}',), ('{aa}RS_{aa}AMP_tRNA{aa}{xyz}', 'PPi'), 're0000000189_k1'),
+    (('{aa}RS_{aa}_tRNA{aa}{xyz}',), ('{aa}RS_tRNA{aa}{xyz}', '{aa}'), 're0000000190_k1'),
+    (('{aa}RS_tRNA{aa}{xyz}', 'ATP'), ('{aa}RS_ATP_tRNA{aa}{xyz}',), 're0000000191_k1'),
+    (('{aa}RS_ATP_tRNA{aa}{xyz}',), ('{aa}RS_tRNA{aa}{xyz}', 'ATP'), 're0000000192_k1'),
+    (('{aa}RS_ATP_tRNA{aa}{xyz}', '{aa}'), ('{aa}RS_{aa}_ATP_tRNA{aa}{xyz}',), 're0000000193_k1'),
+    (('{aa}RS_{aa}_ATP_tRNA{aa}{xyz}',), ('{aa}RS_ATP_tRNA{aa}{xyz}', '{aa}'), 're0000000194_k1'),
+    (('{aa}RS_{aa}_tRNA{aa}{xyz}', 'ATP'), ('{aa}RS_{aa}_ATP_tRNA{aa}{xyz}',), 're0000000195_k1'),
+    (('{aa}RS_{aa}_ATP_tRNA{aa}{xyz}',), ('{aa}RS_{aa}_tRNA{aa}{xyz}', 'ATP'), 're0000000196_k1'),
+    (('{aa}RS_{aa}_ATP_tRNA{aa}{xyz}',), ('{aa}RS_{aa}AMP_PPi_tRNA{aa}{xyz}',), 're0000000197_k1'),
+    (('{aa}RS', 'tRNA{aa}{xyz}'), ('{aa}RS_tRNA{aa}{xyz}',), 're0000000199_k1'),
+    (('{aa}RS_{aa}', 'tRNA{aa}{xyz}'), ('{aa}RS_{aa}_tRNA{aa}{xyz}',), 're0000000200_k1'),
+    (('{aa}RS_tRNA{aa}{xyz}',), ('{aa}RS', 'tRNA{aa}{xyz}'), 're0000000201_k1'),
+    (('{aa}RS_{aa}_tRNA{aa}{xyz}',), ('{aa}RS_{aa}', 'tRNA{aa}{xyz}'), 're0000000202_k1'),
+    (('{aa}RS_ATP', 'tRNA{aa}{xyz}'), ('{aa}RS_ATP_tRNA{aa}{xyz}',), 're0000000203_k1'),
+    (('{aa}RS_ATP_tRNA{aa}{xyz}',), ('{aa}RS_ATP', 'tRNA{aa}{xyz}'), 're0000000204_k1'),
+    (('{aa}RS_{aa}_ATP', 'tRNA{aa}{xyz}'), ('{aa}RS_{aa}_ATP_tRNA{aa}{xyz}',), 're0000000205_k1'),
+    (('{aa}RS_{aa}_ATP_tRNA{aa}{xyz}',), ('{aa}RS_{aa}_ATP', 'tRNA{aa}{xyz}'), 're0000000206_k1'),
+    (('{aa}RS_{aa}AMP_PPi', 'tRNA{aa}{xyz}'), ('{aa}RS_{aa}AMP_PPi_tRNA{aa}{xyz}',), 're0000000207_k1'),
+    (('{aa}RS_{aa}AMP_PPi_tRNA{aa}{xyz}',), ('{aa}RS_{aa}AMP_PPi', 'tRNA{aa}{xyz}'), 're0000000208_k1'),
+    (('{aa}RS_{aa}AMP', 'tRNA{aa}{xyz}'), ('{aa}RS_{aa}AMP_tRNA{aa}{xyz}',), 're0000000209_k1'),
+    (('{aa}RS_{aa}AMP_tRNA{aa}{xyz}',), ('{aa}RS_{aa}AMP', 'tRNA{aa}{xyz}'), 're0000000210_k1'),
+    (('EFTu_GTP', '{aa}tRNA{aa}{xyz}'), ('EFTu_GTP_{aa}tRNA{aa}{xyz}',), 're0000000275_k1'),
+    (('EFTu_GTP_{aa}tRNA{aa}{xyz}',), ('EFTu_GTP', '{aa}tRNA{aa}{xyz}'), 're0000000276_k1'),
+    (('RS50S_tRNA{aa}{xyz}_RRF_EFG_GDP',), ('RS50S_tRNA{aa}{xyz}_RRF', 'EFG_GDP'), 're0000000913_k1'),
+    (('RS50S_tRNA{aa}{xyz}_RRF_EFG_GDP',), ('RS50S_tRNA{aa}{xyz}_EFG_GDP', 'RRF'), 're0000000914_k1'),
+    (('RS50S_tRNA{aa}{xyz}_RRF_EFG_GDP',), ('RS50S_RRF_EFG_GDP', 'tRNA{aa}{xyz}'), 're0000000915_k1'),
+    (('RS50S_tRNA{aa}{xyz}_RRF',), ('RS50S_RRF', 'tRNA{aa}{xyz}'), 're0000000916_k1'),
+    (('RS50S_tRNA{aa}{xyz}_RRF',), ('RS50S_tRNA{aa}{xyz}', 'RRF'), 're0000000917_k1'),
+    (('RS50S_tRNA{aa}{xyz}',), ('tRNA{aa}{xyz}', 'RS50S'), 're0000000919_k1'),
+    (('RS50S_tRNA{aa}{xyz}_EFG_GDP',), ('EFG_GDP', 'RS50S_tRNA{aa}{xyz}'), 're0000000920_k1'),
+    (('RS50S_tRNA{aa}{xyz}_EFG_GDP',), ('RS50S_EFG_GDP', 'tRNA{aa}{xyz}'), 're0000000921_k1'),
+)
+
+#Elongator Met, which shares MetRS with fMet
+MET_SPECIES = (
+    'MetRS_AMP_tRNAMetCAU', 'MetRS_ATP_tRNAMetCAU', 'MetRS_Met_ATP_tRNAMetCAU',
+    'MetRS_Met_tRNAMetCAU', 'MetRS_MetAMP_PPi_tRNAMetCAU', 'MetRS_MetAMP_tRNAMetCAU',
+    'MetRS_MettRNAMetCAU', 'MetRS_tRNAMetCAU', 'MettRNAMetCAU',
+    'MettRNAMetCAU_degraded', 'tRNAMetCAU', 'tRNAMetCAU_degraded', 'RS50S_tRNAMetCAU',
+    'RS50S_tRNAMetCAU_EFG_GDP', 'RS50S_tRNAMetCAU_RRF', 'RS50S_tRNAMetCAU_RRF_EFG_GDP',
+    'EFTu_GTP_MettRNAMetCAU',
+)
+
+MET_REACTIONS = (
+    (('MetRS_MetAMP_tRNAMetCAU',), ('MetRS_AMP_tRNAMetCAU',), 're0000000178_k1'),
+    (('MetRS_AMP_tRNAMetCAU',), ('MetRS_MettRNAMetCAU', 'AMP'), 're0000000180_k1'),
+    (('MetRS_AMP_tRNAMetCAU',), ('MettRNAMetCAU', 'MetRS_AMP'), 're0000000182_k1'),
+    (('MetRS_AMP', 'MettRNAMetCAU'), ('MetRS_AMP_tRNAMetCAU',), 're0000000183_k1'),
+    (('MetRS_MettRNAMetCAU',), ('MetRS', 'MettRNAMetCAU'), 're0000000184_k1'),
+    (('MetRS', 'MettRNAMetCAU'), ('MetRS_MettRNAMetCAU',), 're0000000185_k1'),
+    (('MetRS_tRNAMetCAU', 'Met'), ('MetRS_Met_tRNAMetCAU',), 're0000000188_k1'),
+    (('MetRS_MetAMP_PPi_tRNAMetCAU',), ('MetRS_MetAMP_tRNAMetCAU', 'PPi'), 're0000000189_k1'),
+    (('MetRS_Met_tRNAMetCAU',), ('MetRS_tRNAMetCAU', 'Met'), 're0000000190_k1'),
+    (('MetRS_tRNAMetCAU', 'ATP'), ('MetRS_ATP_tRNAMetCAU',), 're0000000191_k1'),
+    (('MetRS_ATP_tRNAMetCAU',), ('MetRS_tRNAMetCAU', 'ATP'), 're0000000192_k1'),
+    (('MetRS_ATP_tRNAMetCAU', 'Met'), ('MetRS_Met_ATP_tRNAMetCAU',), 're0000000193_k1'),
+    (('MetRS_Met_ATP_tRNAMetCAU',), ('MetRS_ATP_tRNAMetCAU', 'Met'), 're0000000194_k1'),
+    (('MetRS_Met_tRNAMetCAU', 'ATP'), ('MetRS_Met_ATP_tRNAMetCAU',), 're0000000195_k1'),
+    (('MetRS_Met_ATP_tRNAMetCAU',), ('MetRS_Met_tRNAMetCAU', 'ATP'), 're0000000196_k1'),
+    (('MetRS_Met_ATP_tRNAMetCAU',), ('MetRS_MetAMP_PPi_tRNAMetCAU',), 're0000000197_k1'),
+    (('MetRS', 'tRNAMetCAU'), ('MetRS_tRNAMetCAU',), 're0000000199_k1'),
+    (('MetRS_Met', 'tRNAMetCAU'), ('MetRS_Met_tRNAMetCAU',), 're0000000200_k1'),
+    (('MetRS_tRNAMetCAU',), ('MetRS', 'tRNAMetCAU'), 're0000000201_k1'),
+    (('MetRS_Met_tRNAMetCAU',), ('MetRS_Met', 'tRNAMetCAU'), 're0000000202_k1'),
+    (('MetRS_ATP', 'tRNAMetCAU'), ('MetRS_ATP_tRNAMetCAU',), 're0000000203_k1'),
+    (('MetRS_ATP_tRNAMetCAU',), ('MetRS_ATP', 'tRNAMetCAU'), 're0000000204_k1'),
+    (('MetRS_Met_ATP', 'tRNAMetCAU'), ('MetRS_Met_ATP_tRNAMetCAU',), 're0000000205_k1'),
+    (('MetRS_Met_ATP_tRNAMetCAU',), ('MetRS_Met_ATP', 'tRNAMetCAU'), 're0000000206_k1'),
+    (('MetRS_MetAMP_PPi', 'tRNAMetCAU'), ('MetRS_MetAMP_PPi_tRNAMetCAU',), 're0000000207_k1'),
+    (('MetRS_MetAMP_PPi_tRNAMetCAU',), ('MetRS_MetAMP_PPi', 'tRNAMetCAU'), 're0000000208_k1'),
+    (('MetRS_MetAMP', 'tRNAMetCAU'), ('MetRS_MetAMP_tRNAMetCAU',), 're0000000209_k1'),
+    (('MetRS_MetAMP_tRNAMetCAU',), ('MetRS_MetAMP', 'tRNAMetCAU'), 're0000000210_k1'),
+    (('EFTu_GTP', 'MettRNAMetCAU'), ('EFTu_GTP_MettRNAMetCAU',), 're0000000275_k1'),
+    (('EFTu_GTP_MettRNAMetCAU',), ('EFTu_GTP', 'MettRNAMetCAU'), 're0000000276_k1'),
+    (('RS50S_tRNAMetCAU_RRF_EFG_GDP',), ('RS50S_tRNAMetCAU_RRF', 'EFG_GDP'), 're0000000913_k1'),
+    (('RS50S_tRNAMetCAU_RRF_EFG_GDP',), ('RS50S_tRNAMetCAU_EFG_GDP', 'RRF'), 're0000000914_k1'),
+    (('RS50S_tRNAMetCAU_RRF_EFG_GDP',), ('RS50S_RRF_EFG_GDP', 'tRNAMetCAU'), 're0000000915_k1'),
+    (('RS50S_tRNAMetCAU_RRF',), ('RS50S_RRF', 'tRNAMetCAU'), 're0000000916_k1'),
+    (('RS50S_tRNAMetCAU_RRF',), ('RS50S_tRNAMetCAU', 'RRF'), 're0000000917_k1'),
+    (('RS50S_tRNAMetCAU',), ('tRNAMetCAU', 'RS50S'), 're0000000919_k1'),
+    (('RS50S_tRNAMetCAU_EFG_GDP',), ('EFG_GDP', 'RS50S_tRNAMetCAU'), 're0000000920_k1'),
+    (('RS50S_tRNAMetCAU_EFG_GDP',), ('RS50S_EFG_GDP', 'tRNAMetCAU'), 're0000000921_k1'),
+)
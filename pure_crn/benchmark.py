@@ -0,0 +1,405 @@
+"""Timing and memory benchmarks of the model pipeline.
+
+Each fixture is one of the repository's networks: MGapt TX-only, MGapt
+TXwTL, MGapt-deGFP TX and the TL-only peptide series of
+`Examples/TL_extension_arbAA` (fMGG to fMGGVSWRL, with the initial
+conditions of those runs). For every fixture `run_fixture` records the
+wall time of
+
+- ``build``: adding the reactions to a `CRNBuilder`,
+- ``compile``: `CRNBuilder.compile`,
+- ``sbml_write``, ``sbml_read`` and ``bioscrape_load``: `write_sbml`, a
+  libsbml parse and ``Model(sbml_filename=...)`` as in the inference scripts,
+- ``simulate``: one `simulate` of the fixture's observable,
+- ``likelihood``: one `Experiment.log_likelihood` on synthetic data,
+
+with the `MassActionODE` `backend` given to `run` ('numpy' by default, so
+reports stay comparable across commits; with 'compile' the untimed kernel
+build is recorded as ``kernel_build_s``). Times are the minimum over
+`repeat` runs; memory is the peak resident memory of the process,
+`peak_rss_mb` (`start_rss_mb` is the peak before the fixture ran). `run`
+executes each fixture in a fresh process so the memory peaks do
+not mix. Results are written as JSON together with the commit and
+package versions; `compare` lists the ratios between two such files.
+
+`scaling` measures how cost grows with construct length. It builds
+`synthetic_construct` s, MGapt-deGFP with the ORF replaced by a random one
+of a given codon count, and records the network size, build and simulation
+time and the solver's step and Jacobian counts for each; `plot_scaling`
+draws the curves and `extrapolate` fits a power law to them.
+
+    python -m pure_crn.benchmark [fixture ...] [--output FILE] [--compare OLD]
+    python -m pure_crn.benchmark --scaling 10 30 100 300 [--mode tx] [--plot FILE]
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+import numpy as np
+
+from .likelihood import Experiment
+from .network import CRNBuilder
+from .ode import MassActionODE, observation, simulate
+from .parameters import (REPO_DIR, TX_INITIAL_CONDITIONS, TX_PARAMETERS, TX_PARAMETERS_TXONLY,
+                         load_initial_conditions)
+from .sbml import write_sbml
+from .sequence import CODON_TABLE, MGAPT_DEGFP_DNA, MGAPT_DNA, as_protein, translate
+from .tl import add_tl_reactions
+from .tx import add_tx_reactions
+from .txtl import add_txtl_reactions
+
+TL_SERIES_DIR = os.path.join(REPO_DIR, 'Examples', 'TL_extension_arbAA')
+TL_SERIES = ('fMGG', 'fMGGV', 'fMGGVS', 'fMGGVSW', 'fMGGVSWRL')
+
+#Fixed solver settings, so a tuned config (`pure_crn.tuning`) does not change the timings
+SOLVER = {'method': 'Radau', 'rtol': 1e-6, 'atol': 1e-9}
+
+#Stages in the order they run, all timed in seconds
+STAGES = ('build', 'compile', 'sbml_write', 'sbml_read', 'bioscrape_load', 'simulate', 'likelihood')
+
+
+def _tl_initial_conditions(name):
+    #First row of the example's BioCRNpyler output: its initial state
+    import csv
+
+    with open(os.path.join(TL_SERIES_DIR, f'{name}_TLonly_BioCRNpyler.csv')) as f:
+        reader = csv.reader(f)
+        header, row = next(reader), next(reader)
+    return {s: float(v) for s, v in zip(header[1:], row[1:]) if s != 'time'}
+
+
+def _tl_fixture(name):
+    protein = as_protein(name[1:])
+    return {
+        'build': lambda b: add_tl_reactions(b, protein, amino_acids=sorted(set(protein))),
+        'initial': lambda: _tl_initial_conditions(name),
+        'observable': 'Pept' + str(len(protein)).zfill(4),
+        'duration': 10000.,
+    }
+
+
+FIXTURES = {
+    'tx_mgapt': {
+        'build': lambda b: add_tx_reactions(b, MGAPT_DNA, TX_PARAMETERS_TXONLY),
+        'initial': lambda: TX_INITIAL_CONDITIONS,
+        'observable': 'MGapt',
+        'duration': 3600.,
+    },
+    'txwtl_mgapt': {
+        'build': lambda b: add_txtl_reactions(b, MGAPT_DNA),
+        'initial': lambda: load_initial_conditions(dna=.005),
+        'observable': 'MGapt',
+        'duration': 3600.,
+    },
+    'tx_mgapt_degfp': {
+        'build': lambda b: add_tx_reactions(b, MGAPT_DEGFP_DNA, TX_PARAMETERS),
+        'initial': lambda: TX_INITIAL_CONDITIONS,
+        'observable': 'MGapt',
+        'duration': 3600.,
+    },
+    **{'tl_' + name: _tl_fixture(name) for name in TL_SERIES},
+}
+
+
+def _timed(f, repeat):
+    #(minimum wall time, last result) of `repeat` calls
+    best, out = np.inf, None
+    for _ in range(repeat):
+        t = time.perf_counter()
+        out = f()
+        best = min(best, time.perf_counter() - t)
+    return best, out
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    #Bytes on macOS, kB elsewhere
+    return peak / 2 ** 20 if sys.platform == 'darwin' else peak / 2 ** 10
+
+
+def run_fixture(name, repeat=3, n_timepoints=61, stages=STAGES, backend='numpy'):
+    """``{metric: value}`` for fixture `name`; see the module docstring."""
+    fixture = FIXTURES[name]
+    #Interpreter and imports; the fixture's own footprint is the difference to the peak
+    out = {'fixture': name, 'start_rss_mb': peak_rss_mb()}
+    times = {}
+
+    def build():
+        builder = CRNBuilder()
+        fixture['build'](builder)
+        return builder
+
+    times['build'], builder = _timed(build, repeat)
+    times['compile'], crn = _timed(builder.compile, repeat)
+    out['n_species'], out['n_reactions'] = crn.n_species, crn.n_reactions
+    initial = fixture['initial']()
+    timepoints = np.linspace(0, fixture['duration'], n_timepoints)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, name + '.xml')
+        if 'sbml_write' in stages:
+            times['sbml_write'] = _timed(lambda: write_sbml(crn, path, initial), repeat)[0]
+        if 'sbml_read' in stages:
+            import libsbml
+
+            times['sbml_read'] = _timed(lambda: libsbml.readSBMLFromFile(path), repeat)[0]
+        if 'bioscrape_load' in stages:
+            try:
+                from bioscrape.types import Model
+            except ImportError:
+                times['bioscrape_load'] = None
+            else:
+                with warnings.catch_warnings():
+                    #bioscrape warns about the compartment on every load
+                    warnings.simplefilter('ignore', UserWarning)
+                    times['bioscrape_load'] = _timed(lambda: Model(sbml_filename=path), repeat)[0]
+
+    observable = fixture['observable']
+    out['backend'] = backend
+    if backend == 'compile':
+        t = time.perf_counter()
+        MassActionODE(crn, backend=backend)
+        out['kernel_build_s'] = time.perf_counter() - t
+    if 'simulate' in stages or 'likelihood' in stages:
+        times['simulate'], frame = _timed(
+            lambda: simulate(crn, timepoints, initial, observables=[observable], backend=backend,
+                             **SOLVER), repeat)
+    if 'likelihood' in stages:
+        #Synthetic replicates around the nominal trajectory; the cost does not depend on the data
+        y = frame[observable].to_numpy()
+        data = np.stack([.95 * y, 1.05 * y])[:, 1:]
+        parameter = crn.parameters[crn.rate_index[0]]
+        experiment = Experiment(crn, timepoints[1:], data, [observable], [parameter], initial,
+                                sigma=.05 * np.abs(y[1:]).max() + 1e-12, t0=0., backend=backend,
+                                **SOLVER)
+        theta = [crn.parameter_values[crn.parameter_index[parameter]]]
+        times['likelihood'] = _timed(lambda: experiment.log_likelihood(theta), repeat)[0]
+
+    out.update({f'{stage}_s': times.get(stage) for stage in stages})
+    out['peak_rss_mb'] = peak_rss_mb()
+    return out
+
+
+def _run_fixture(args):
+    return run_fixture(*args)
+
+
+def environment():
+    """Commit, interpreter, package versions and host of this run."""
+    versions = {}
+    for module in ('numpy', 'scipy', 'pandas', 'bioscrape', 'libsbml', 'biocrnpyler'):
+        try:
+            versions[module] = __import__(module).__version__
+        except (ImportError, AttributeError):
+            versions[module] = None
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=REPO_DIR, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                    cwd=REPO_DIR, capture_output=True, text=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        commit, dirty = None, None
+    return {'commit': commit, 'dirty': dirty, 'python': platform.python_version(),
+            'versions': versions, 'machine': platform.machine(), 'node': platform.node(),
+            'cpu_count': os.cpu_count(),
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S%z')}
+
+
+def run(fixtures=None, repeat=3, n_timepoints=61, stages=STAGES, output=None, isolate=True,
+        mp_context=None, backend='numpy'):
+    """Benchmark `fixtures` (default all) and return the results dict.
+
+    With `isolate`, each fixture runs in a new process (spawned by default)
+    so `peak_rss_mb` is that fixture's own peak. The results are written as
+    JSON to `output` if given.
+    """
+    fixtures = list(FIXTURES) if fixtures is None else list(fixtures)
+    unknown = [f for f in fixtures if f not in FIXTURES]
+    if unknown:
+        raise KeyError(f'Unknown fixtures {unknown}; available: {list(FIXTURES)}')
+    jobs = [(name, repeat, n_timepoints, tuple(stages), backend) for name in fixtures]
+    if isolate:
+        ctx = multiprocessing.get_context(mp_context or 'spawn')
+        with ctx.Pool(1, maxtasksperchild=1) as pool:
+            results = pool.map(_run_fixture, jobs, chunksize=1)
+    else:
+        results = [_run_fixture(job) for job in jobs]
+    report = {'environment': environment(), 'repeat': repeat, 'n_timepoints': n_timepoints,
+              'results': {r.pop('fixture'): r for r in results}}
+    if output is not None:
+        with open(output, 'w') as f:
+            json.dump(report, f, indent=1)
+    return report
+
+
+def compare(old, new, threshold=1.1):
+    """DataFrame of the metrics of two `run` reports (dicts or JSON files)
+    and their ratio new/old; ``flag`` marks ratios above `threshold`."""
+    import pandas as pd
+
+    def load(report):
+        if isinstance(report, dict):
+            return report
+        with open(report) as f:
+            return json.load(f)
+
+    old, new = load(old), load(new)
+    rows = []
+    for fixture, metrics in new['results'].items():
+        for metric, value in metrics.items():
+            before = old['results'].get(fixture, {}).get(metric)
+            if value is None or before is None or metric.startswith('n_'):
+                continue
+            ratio = value / before if before else np.inf
+            rows.append({'fixture': fixture, 'metric': metric, 'old': before, 'new': value,
+                         'ratio': ratio, 'flag': ratio > threshold})
+    return pd.DataFrame(rows)
+
+
+#5' UTR (T7 promoter to the start codon, with MGapt and the RBS) and 3' UTR of MGapt-deGFP
+_UTR5 = MGAPT_DEGFP_DNA[:MGAPT_DEGFP_DNA.index('CCATGGAG') + 2]
+_UTR3 = MGAPT_DEGFP_DNA[MGAPT_DEGFP_DNA.index('GGATCTAACTCGAG') + 8:]
+_SENSE_CODONS = sorted(c for c, aa in CODON_TABLE.items() if aa != '_' and c != 'ATG')
+
+
+def synthetic_construct(n_codons, seed=0):
+    """``(dna, protein)``: MGapt-deGFP with its ORF replaced by ATG, `n_codons`
+    - 1 random sense codons and TAA; `protein` is `translate` of the ORF."""
+    rng = np.random.default_rng(seed)
+    orf = 'ATG' + ''.join(rng.choice(_SENSE_CODONS, n_codons - 1)) + 'TAA'
+    return _UTR5 + orf + _UTR3, translate(orf)
+
+
+def _scaling_point(args):
+    n_codons, mode, duration, n_timepoints, lumped, seed, options = args
+    dna, protein = synthetic_construct(n_codons, seed)
+    builder = CRNBuilder()
+    t = time.perf_counter()
+    if mode == 'tx':
+        add_tx_reactions(builder, dna, TX_PARAMETERS, lumped=lumped)
+        initial, observables = TX_INITIAL_CONDITIONS, ['MGapt']
+    else:
+        add_txtl_reactions(builder, dna, protein, lumped=lumped)
+        initial, observables = load_initial_conditions(dna=.005), ['MGapt', 'deGFP_m']
+    crn = builder.compile()
+    out = {'n_codons': n_codons, 'n_nt': len(dna), 'n_species': crn.n_species,
+           'n_reactions': crn.n_reactions, 'build_s': time.perf_counter() - t}
+    ode = MassActionODE(crn, backend='numpy')
+    stats = {}
+    t = time.perf_counter()
+    y = ode.integrate(np.linspace(0, duration, n_timepoints), crn.initial_state(initial),
+                      observe=observation(crn, observables)[1], stats=stats, **options)
+    out['simulate_s'] = time.perf_counter() - t
+    out.update(stats)
+    out.update({f'{name}_final': float(v) for name, v in zip(observables, y[-1])})
+    out['peak_rss_mb'] = peak_rss_mb()
+    return out
+
+
+def scaling(n_codons=(10, 30, 100, 300), mode='txtl', duration=3600., n_timepoints=61,
+            lumped=None, seed=0, isolate=True, mp_context=None, **options):
+    """Cost of `synthetic_construct` networks of increasing length.
+
+    `mode` 'txtl' builds the coupled network of each construct and its
+    protein, 'tx' the TX-only network. Each row has the codon and nucleotide
+    lengths, species and reaction counts, build and simulation seconds, the
+    solver's `steps`, `nfev`, `njev` and `nlu` (see
+    `MassActionODE.integrate`), the final observables and the peak RSS.
+    `options` go to the solver. Returns a DataFrame.
+    """
+    import pandas as pd
+
+    if mode not in ('tx', 'txtl'):
+        raise ValueError(f"mode must be 'tx' or 'txtl', not {mode!r}")
+    jobs = [(n, mode, duration, n_timepoints, lumped, seed, options) for n in n_codons]
+    if isolate:
+        ctx = multiprocessing.get_context(mp_context or 'spawn')
+        with ctx.Pool(1, maxtasksperchild=1) as pool:
+            rows = pool.map(_scaling_point, jobs, chunksize=1)
+    else:
+        rows = [_scaling_point(job) for job in jobs]
+    return pd.DataFrame(rows)
+
+
+def extrapolate(frame, n_nt, metric='simulate_s', points=3):
+    """`metric` at `n_nt` nucleotides from a power law through the last
+    `points` rows of a `scaling` frame; returns ``(value, exponent)``."""
+    tail = frame.sort_values('n_nt').tail(points)
+    exponent, intercept = np.polyfit(np.log(tail['n_nt']), np.log(tail[metric]), 1)
+    return float(np.exp(intercept) * n_nt ** exponent), float(exponent)
+
+
+def plot_scaling(frame, filename=None):
+    """Log-log curves of network size, build and simulation time and solver
+    work against construct length; saved to `filename` if given."""
+    import matplotlib.pyplot as plt
+
+    fig, axes = plt.subplots(2, 2, figsize=(9, 7), sharex=True)
+    panels = [(('n_species', 'n_reactions'), 'network size'),
+              (('build_s',), 'build time (s)'),
+              (('simulate_s',), 'simulation time (s)'),
+              (('steps', 'njev', 'nlu'), 'solver counts')]
+    for ax, (metrics, label) in zip(axes.flat, panels):
+        for metric in metrics:
+            ax.loglog(frame['n_nt'], frame[metric], 'o-', label=metric)
+        ax.set_ylabel(label)
+        ax.legend(frameon=False)
+    for ax in axes[1]:
+        ax.set_xlabel('construct length (nt)')
+    fig.tight_layout()
+    if filename is not None:
+        fig.savefig(filename)
+    return fig
+
+
+def _format(report):
+    import pandas as pd
+
+    return pd.DataFrame(report['results']).T.to_string(float_format=lambda v: f'{v:.4g}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog='python -m pure_crn.benchmark',
+                                     description='Benchmark the PURE CRN pipeline.')
+    parser.add_argument('fixtures', nargs='*', help=f'default all of {list(FIXTURES)}')
+    parser.add_argument('--output', '-o', help='JSON results file (csv with --scaling)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--timepoints', type=int, default=61)
+    parser.add_argument('--stages', nargs='+', default=STAGES, choices=STAGES)
+    parser.add_argument('--backend', default='numpy', choices=('numpy', 'auto', 'compile'),
+                        help='MassActionODE backend')
+    parser.add_argument('--compare', help='earlier JSON results to compare against')
+    parser.add_argument('--threshold', type=float, default=1.1,
+                        help='flag ratios above this in --compare')
+    parser.add_argument('--scaling', type=int, nargs='+', metavar='CODONS',
+                        help='run the scaling benchmark for these ORF lengths instead')
+    parser.add_argument('--mode', default='txtl', choices=('tx', 'txtl'))
+    parser.add_argument('--lumped', type=int, help='TX elongation stages (default full model)')
+    parser.add_argument('--plot', help='scaling plot file')
+    args = parser.parse_args()
+    if args.scaling:
+        frame = scaling(args.scaling, args.mode, n_timepoints=args.timepoints, lumped=args.lumped)
+        print(frame.to_string(index=False, float_format=lambda v: f'{v:.4g}'))
+        if len(frame) >= 2:
+            for n_nt in (1000, 3000):
+                value, exponent = extrapolate(frame, n_nt, points=min(3, len(frame)))
+                print(f'simulate_s at {n_nt} nt ~ {value:.3g} s (exponent {exponent:.2f})')
+        if args.output:
+            frame.to_csv(args.output, index=False)
+        if args.plot:
+            plot_scaling(frame, args.plot)
+    else:
+        report = run(args.fixtures or None, args.repeat, args.timepoints, args.stages, args.output,
+                     backend=args.backend)
+        print(_format(report))
+        if args.compare:
+            print(compare(args.compare, report, args.threshold).to_string(index=False))
@@ -0,0 +1,228 @@
+"""Content-addressed on-disk caches of compiled networks and simulation states.
+
+`ModelCache` entries are keyed on the DNA sequence, protein sequence, TX
+parameters, the hash of the TL rate-constant file, the build options and
+`BUILDER_VERSION`, and stored as `CompiledCRN` npz files (plus an SBML copy
+when requested). `SnapshotCache` entries are state snapshots of a
+simulation, keyed on the network, rate constants, initial state and solver
+options. The least recently used entries are evicted once a cache exceeds
+`max_bytes`.
+"""
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from .network import CompiledCRN
+from .parameters import RATE_CONSTANTS_FILE, TX_PARAMETERS, read_name_value_csv
+from .sbml import write_sbml
+from .sequence import as_protein
+from .txtl import build_txtl_crn
+
+#Bump whenever a builder change alters the generated networks
+BUILDER_VERSION = 1
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    'PURE_CRN_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'pure_crn'))
+DEFAULT_SNAPSHOT_DIR = os.path.join(DEFAULT_CACHE_DIR, 'snapshots')
+
+
+def file_hash(filename):
+    """sha256 of a file's contents."""
+    h = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class DiskCache:
+    """Directory of `.npz`/`.xml` files with atomic writes and LRU eviction."""
+
+    def __init__(self, directory, max_bytes=1 << 30):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key, ext='.npz'):
+        return os.path.join(self.directory, key + ext)
+
+    def _write(self, key, save, ext='.npz'):
+        #Write to a temporary file then rename, so concurrent jobs never read partial entries
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                save(f)
+            os.replace(tmp, self.path(key, ext))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self.evict(keep=self.path(key, ext))
+
+    def entries(self):
+        """(last access time, size, path) of every cache file, oldest first."""
+        out = []
+        with os.scandir(self.directory) as it:
+            for e in it:
+                if e.is_file() and e.name.endswith(('.npz', '.xml')):
+                    st = e.stat()
+                    out.append((st.st_mtime, st.st_size, e.path))
+        return sorted(out)
+
+    def evict(self, keep=None):
+        """Remove least recently used files until the cache fits `max_bytes`.
+
+        The file `keep` (the entry just written) is never removed, so an
+        entry larger than the whole budget still serves the next `get`.
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        for _, _, path in self.entries():
+            os.unlink(path)
+
+
+class ModelCache(DiskCache):
+    """Cache of compiled TX/TXTL networks in `directory`.
+
+    ``cache.load(dna_seq, protein)`` returns the `CompiledCRN`, building and
+    storing it on a miss; ``cache.model(...)`` returns a bioscrape `Model`.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=1 << 30):
+        super().__init__(directory, max_bytes)
+        self._file_hashes = {}
+
+    def _rate_file_hash(self, filename):
+        #Rehash only if the file changed since it was last hashed
+        st = os.stat(filename)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._file_hashes.get(filename)
+        if cached is None or cached[0] != stamp:
+            cached = self._file_hashes[filename] = (stamp, file_hash(filename))
+        return cached[1]
+
+    def key(self, dna_seq, protein=None, params=None, rate_file=RATE_CONSTANTS_FILE, **options):
+        """Cache key for a `build_txtl_crn` call."""
+        params = TX_PARAMETERS if params is None else params
+        content = {
+            'dna': dna_seq,
+            'protein': None if protein is None else as_protein(protein),
+            'params': {k: float(v) for k, v in params.items()},
+            'rate_file': self._rate_file_hash(rate_file),
+            'options': options,
+            'builder': BUILDER_VERSION,
+        }
+        blob = json.dumps(content, sort_keys=True, default=str).encode()
+        return hashlib.sha256(blob).hexdigest()
+
+    def get(self, key):
+        """Cached network for `key`, or None."""
+        path = self.path(key)
+        try:
+            crn = CompiledCRN.load(path)
+        except (FileNotFoundError, EOFError, OSError, ValueError):
+            return None
+        os.utime(path)
+        return crn
+
+    def put(self, key, crn):
+        self._write(key, crn.save)
+
+    def load(self, dna_seq, protein=None, params=None, rate_file=RATE_CONSTANTS_FILE, **options):
+        """`build_txtl_crn(dna_seq, protein, ...)`, served from the cache when possible."""
+        key = self.key(dna_seq, protein, params, rate_file, **options)
+        crn = self.get(key)
+        if crn is None:
+            rxn_k = read_name_value_csv(rate_file)
+            crn = build_txtl_crn(dna_seq, protein, params, rxn_k, **options)
+            self.put(key, crn)
+        return crn
+
+    def model(self, dna_seq, protein=None, params=None, rate_file=RATE_CONSTANTS_FILE,
+              initial_condition_dict=None, **options):
+        """Ready-to-simulate bioscrape `Model` for the network."""
+        crn = self.load(dna_seq, protein, params, rate_file, **options)
+        return crn.to_bioscrape_model(initial_condition_dict)
+
+    def sbml(self, dna_seq, protein=None, params=None, rate_file=RATE_CONSTANTS_FILE, **options):
+        """Path of a cached SBML file for the network, for SBML-based tools."""
+        key = self.key(dna_seq, protein, params, rate_file, **options)
+        path = self.path(key, '.xml')
+        if not os.path.exists(path):
+            crn = self.load(dna_seq, protein, params, rate_file, **options)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            os.close(fd)
+            write_sbml(crn, tmp)
+            os.replace(tmp, path)
+            self.evict(keep=path)
+        os.utime(path)
+        return path
+
+
+class SnapshotCache(DiskCache):
+    """State snapshots of simulations in `directory`.
+
+    One npz file per run key holds the snapshot times and states; see
+    `MutableModel.state_at`.
+    """
+
+    def __init__(self, directory=DEFAULT_SNAPSHOT_DIR, max_bytes=1 << 30):
+        super().__init__(directory, max_bytes)
+
+    @staticmethod
+    def key(crn, k, x0, t0=0., **options):
+        """Run key: network, per-reaction rates, initial state and time, solver options."""
+        h = hashlib.sha256(crn.digest().encode())
+        h.update(np.ascontiguousarray(k, dtype=float).tobytes())
+        h.update(np.ascontiguousarray(x0, dtype=float).tobytes())
+        h.update(json.dumps({'t0': float(t0), 'options': options},
+                            sort_keys=True, default=str).encode())
+        return h.hexdigest()
+
+    def get(self, key):
+        """``(times, states)`` stored for `key`, or None."""
+        path = self.path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                times, states = data['times'], data['states']
+        except (FileNotFoundError, EOFError, OSError, ValueError, KeyError):
+            return None
+        os.utime(path)
+        return times, states
+
+    def put(self, key, times, states):
+        """Add snapshots at `times` (rows of `states`) to those stored for `key`."""
+        times = np.atleast_1d(np.asarray(times, dtype=float))
+        states = np.atleast_2d(states)
+        old = self.get(key)
+        if old is not None:
+            keep = ~np.isin(old[0], times)
+            times = np.concatenate([old[0][keep], times])
+            states = np.concatenate([old[1][keep], states])
+        order = np.argsort(times)
+        self._write(key, lambda f: np.savez(f, times=times[order], states=states[order]))
+
+    def latest(self, key, t):
+        """``(time, state)`` of the last snapshot at or before `t`, or None."""
+        stored = self.get(key)
+        if stored is None:
+            return None
+        times, states = stored
+        i = np.searchsorted(times, t, side='right') - 1
+        if i < 0:
+            return None
+        return times[i], states[i]
@@ -0,0 +1,198 @@
+"""Generated, compiled right-hand side and Jacobian for a fixed network.
+
+Between the likelihood calls of an MCMC run only the rate constants change,
+so the network's topology can be compiled once. `generate_source` writes
+the mass-action right-hand side and the Jacobian of a `MassActionODE` as
+straight-line C: one statement per reaction and per Jacobian entry, with
+the stoichiometric coefficients and reactant indices as literals and the
+rate constants passed in as a vector. The Jacobian fills the data array of
+`MassActionODE`'s fixed CSC pattern, so the sparse matrix is built around
+it without any index work.
+
+`load_kernel` compiles the source with the system C compiler (``$CC``,
+default ``cc``) into a shared library and loads it with ctypes. Libraries
+are cached in `DEFAULT_KERNEL_DIR` by a hash of the topology, so every
+network with the same species and reactions, whatever its rates, reuses
+one library, across processes and sessions. Without a compiler, or if
+compilation fails, it returns None and `MassActionODE` keeps its numpy
+path; ``PURE_CRN_BACKEND=numpy`` forces that path.
+
+On the MGapt-deGFP TX network the kernel evaluates the right-hand side in
+23 us instead of 118 us and the Jacobian in 33 us instead of 540 us. The
+first build takes about 20 s for that network and a minute for the
+MGapt-deGFP TXTL one.
+"""
+import ctypes
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+
+import numpy as np
+
+#Bump whenever the generated code changes
+CODEGEN_VERSION = 1
+
+DEFAULT_KERNEL_DIR = os.path.join(
+    os.environ.get('PURE_CRN_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'pure_crn')),
+    'kernels')
+CFLAGS = ['-O2', '-shared', '-fPIC']
+#Statements per generated function; keeps the compiler's per-function passes fast
+CHUNK = 2000
+
+
+def topology_key(crn):
+    """sha256 of what the generated code depends on: the species count and
+    the reactant and product arrays (not names or rates)."""
+    h = hashlib.sha256(f'{CODEGEN_VERSION} {crn.n_species} {" ".join(CFLAGS)}'.encode())
+    for a in (crn.reactant_ptr, crn.reactant_idx, crn.product_ptr, crn.product_idx):
+        h.update(np.ascontiguousarray(a, dtype=np.int64).tobytes())
+    return h.hexdigest()
+
+
+def _number(c):
+    return repr(float(c))
+
+
+def _functions(name, args, statements, declare=''):
+    #Split statements into static functions of CHUNK statements; returns (definitions, calls)
+    params = ', '.join(args)
+    names = ', '.join(a.split()[-1].lstrip('*') for a in args)
+    out, calls = [], []
+    for i in range(0, len(statements), CHUNK):
+        out.append(f'static void {name}_{len(calls)}({params})\n{{\n{declare}')
+        out.extend(f'    {s}\n' for s in statements[i:i + CHUNK])
+        out.append('}\n\n')
+        calls.append(f'    {name}_{len(calls)}({names});\n')
+    return out, calls
+
+
+def generate_source(ode):
+    """C source of ``pure_rhs(k, x, dx)`` and ``pure_jacobian(k, x, work, data)``
+    for the network of `ode` (a `MassActionODE`)."""
+    crn, n = ode.crn, ode.n_species
+    R = ode.reactant_slots
+    S = crn.stoichiometry.tocsc()
+
+    def product(r, skip=None):
+        terms = [f'x[{i}]' for s, i in enumerate(R[r]) if i < n and s != skip]
+        return ' * '.join([f'k[{r}]'] + terms)
+
+    #One line per reaction, so a chunk never splits a propensity from its updates
+    rhs = []
+    for r in range(crn.n_reactions):
+        rows, values = S.indices[S.indptr[r]:S.indptr[r + 1]], S.data[S.indptr[r]:S.indptr[r + 1]]
+        if not len(rows):
+            continue
+        updates = [f'dx[{i}] += a;' if v == 1 else f'dx[{i}] -= a;' if v == -1 else
+                   f'dx[{i}] += {_number(v)} * a;' for i, v in zip(rows, values)]
+        rhs.append(' '.join([f'a = {product(r)};'] + updates))
+
+    #work[e]: derivative of reaction e's propensity w.r.t. one reactant slot, in _M's column order
+    da_rxn, da_slot = np.nonzero(ode._valid)
+    derivatives = [f'work[{e}] = {product(r, s)};' for e, (r, s) in enumerate(zip(da_rxn, da_slot))]
+    M = ode._M.tocsr()
+    entries = []
+    for p in range(M.shape[0]):
+        cols, values = M.indices[M.indptr[p]:M.indptr[p + 1]], M.data[M.indptr[p]:M.indptr[p + 1]]
+        terms = [f'work[{e}]' if v == 1 else f'-work[{e}]' if v == -1 else f'{_number(v)} * work[{e}]'
+                 for e, v in zip(cols, values)]
+        entries.append(f'data[{p}] = {" + ".join(terms) if terms else "0.0"};')
+
+    rhs_chunks, rhs_calls = _functions('rhs', ['const double *k', 'const double *x', 'double *dx'],
+                                       rhs, '    double a;\n')
+    deriv_chunks, deriv_calls = _functions('derivatives', ['const double *k', 'const double *x', 'double *work'],
+                                           derivatives)
+    entry_chunks, entry_calls = _functions('entries', ['const double *work', 'double *data'], entries)
+    out = ['/* Generated by pure_crn.codegen; do not edit. */\n', '#include <string.h>\n\n']
+    out += rhs_chunks + deriv_chunks + entry_chunks
+    out.append('void pure_rhs(const double *k, const double *x, double *dx)\n{\n')
+    out.append(f'    memset(dx, 0, {n} * sizeof(double));\n')
+    out += rhs_calls
+    out.append('}\n\n')
+    out.append('void pure_jacobian(const double *k, const double *x, double *work, double *data)\n{\n')
+    out += deriv_calls + entry_calls
+    out.append('}\n')
+    return ''.join(out)
+
+
+def compiler():
+    """Path of the C compiler, or None."""
+    return shutil.which(os.environ.get('CC', 'cc'))
+
+
+def build(ode, path):
+    """Compile the generated source for `ode` into the shared library `path`."""
+    cc = compiler()
+    if cc is None:
+        raise RuntimeError('No C compiler found (set $CC)')
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        source = os.path.join(tmp, 'kernel.c')
+        with open(source, 'w') as f:
+            f.write(generate_source(ode))
+        library = os.path.join(tmp, 'kernel.so')
+        result = subprocess.run([cc, *CFLAGS, '-o', library, source], capture_output=True, text=True)
+        if result.returncode:
+            raise RuntimeError(f'Compiling the generated kernel failed:\n{result.stderr}')
+        #Rename into place, so concurrent jobs never load a partial library
+        os.replace(library, path)
+
+
+class CompiledKernel:
+    """ctypes wrapper of a compiled `pure_rhs`/`pure_jacobian` library for
+    networks with `n_species` species."""
+
+    def __init__(self, path, n_species, n_work, nnz):
+        self.path = path
+        self.n_species, self.n_work, self.nnz = n_species, n_work, nnz
+        lib = ctypes.CDLL(path)
+        vector = np.ctypeslib.ndpointer(dtype=np.float64, flags='C_CONTIGUOUS')
+        lib.pure_rhs.argtypes = [vector, vector, vector]
+        lib.pure_rhs.restype = None
+        lib.pure_jacobian.argtypes = [vector, vector, vector, vector]
+        lib.pure_jacobian.restype = None
+        self._lib = lib
+        self._work = np.empty(n_work)
+
+    def __repr__(self):
+        return f'CompiledKernel({os.path.basename(self.path)}, {self.n_species} species)'
+
+    def __reduce__(self):
+        #Reload the library in worker processes instead of pickling ctypes handles
+        return CompiledKernel, (self.path, self.n_species, self.n_work, self.nnz)
+
+    def rhs(self, k, x):
+        dx = np.empty(self.n_species)
+        self._lib.pure_rhs(np.ascontiguousarray(k, dtype=float), np.ascontiguousarray(x, dtype=float), dx)
+        return dx
+
+    def jacobian_data(self, k, x):
+        """Data of the Jacobian in `MassActionODE`'s CSC pattern."""
+        data = np.empty(self.nnz)
+        self._lib.pure_jacobian(np.ascontiguousarray(k, dtype=float), np.ascontiguousarray(x, dtype=float),
+                                self._work, data)
+        return data
+
+
+def load_kernel(ode, directory=None, compile=True):
+    """`CompiledKernel` for the network of `ode`, compiling and caching it
+    in `directory` (default `DEFAULT_KERNEL_DIR`) on a miss. Returns None
+    when the library is not cached and `compile` is false, or cannot be
+    built or loaded."""
+    directory = DEFAULT_KERNEL_DIR if directory is None else directory
+    path = os.path.join(directory, topology_key(ode.crn) + '.so')
+    if not os.path.exists(path):
+        if not compile:
+            return None
+        try:
+            build(ode, path)
+        except (RuntimeError, OSError):
+            return None
+    try:
+        return CompiledKernel(path, ode.n_species, int(ode._valid.sum()), len(ode._J_indices))
+    except OSError:
+        #Unloadable library, e.g. built on another platform
+        return None
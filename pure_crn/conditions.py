@@ -0,0 +1,135 @@
+"""Joint inference over the DNA-concentration series.
+
+``Data_files/2024.01.26_PURExpress_DNAconcs/RNA_dynamic_cal`` holds MGapt
+and deGFP time courses (three replicates, every 180 s for 12 h) of the
+MGapt-deGFP construct at `DNA_SERIES` nM template. The inference scripts
+each fit a single condition, so rates that only the dose response
+constrains (DNA binding, initiation) stay loose or have to be fixed.
+
+`read_dna_series` reads the replicates of one observable,
+`read_dna_condition` those of several, and `dna_series_experiments` builds one `Experiment` per condition on a shared
+network, with the template at the condition's concentration (the files
+are in nM, the networks' DNA in uM). MGapt and deGFP are read 12 s apart;
+an experiment holds both on the union of their reading times, with the
+other observable missing at each, so every condition is simulated once. A
+`JointLikelihood` sums them, simulating the conditions of one evaluation
+in parallel, and `py_inference_conditions` runs emcee on it with a
+bioscrape-style prior through `pure_crn.inference.run_sampler`, which
+checkpoints and writes the chain like `py_inference_parallel`. The same
+`JointLikelihood` can be handed to `pure_crn.hmc.py_inference_hmc`.
+"""
+import os
+
+import numpy as np
+
+from .hmc import prior_terms
+from .inference import run_sampler
+from .likelihood import Experiment, JointLikelihood
+from .parameters import DATA_DIR
+
+DNA_SERIES_DIR = os.path.join(DATA_DIR, '2024.01.26_PURExpress_DNAconcs', 'RNA_dynamic_cal')
+#Template concentrations (nM) with MGapt and deGFP measurements
+DNA_SERIES = (0.07, 0.12, 0.26, 0.47, 1.06, 1.99)
+#Model observable -> observable in the data file names
+SERIES_OBSERVABLES = {'MGapt': 'MGapt', 'deGFP_m': 'deGFP'}
+
+
+def read_dna_series(concentration, observable='MGapt', duration=None, directory=DNA_SERIES_DIR):
+    """``(timepoints, data)`` of one condition: the measurement times up to
+    `duration` seconds and the ``(replicates, time)`` values of `observable`
+    (the name in the file, 'MGapt' or 'deGFP')."""
+    import pandas as pd
+
+    filename = os.path.join(directory, f'MGapt-deGFP_{concentration}_{observable}Value.csv')
+    df = pd.read_csv(filename, index_col=0)
+    if duration is not None:
+        df = df[df['Time'] <= duration]
+    replicates = [c for c in df.columns if c.isdigit()]
+    return df['Time'].to_numpy(dtype=float), df[replicates].to_numpy(dtype=float).T
+
+
+def read_dna_condition(concentration, observables=('MGapt',), duration=None, directory=DNA_SERIES_DIR):
+    """``(timepoints, data)`` of the model `observables` at one condition:
+    the union of their reading times and ``(replicates, time, observables)``
+    values, NaN where an observable was not read."""
+    series = [read_dna_series(concentration, SERIES_OBSERVABLES.get(o, o), duration, directory)
+              for o in observables]
+    timepoints = np.unique(np.concatenate([t for t, _ in series]))
+    data = np.full((max(len(d) for _, d in series), len(timepoints), len(series)), np.nan)
+    for k, (t, d) in enumerate(series):
+        data[:len(d), np.searchsorted(timepoints, t), k] = d
+    return timepoints, data
+
+
+def dna_series_experiments(crn, params_to_estimate, initial_condition_dict=None, observables=('MGapt',),
+                           concentrations=DNA_SERIES, duration=3 * 3600., dna='DNA', dna_scale=1e-3,
+                           directory=DNA_SERIES_DIR, **kwargs):
+    """One `Experiment` of `crn` per concentration, with all `observables`.
+
+    `initial_condition_dict` is shared, except that the species `dna`
+    starts at ``concentration * dna_scale`` (nM to uM). `observables` are
+    model observables, mapped to the data by `SERIES_OBSERVABLES`. The
+    simulations start at t=0, before the first reading. `kwargs` go to
+    `Experiment` (sigma, solver options, `backend`, ...).
+    """
+    experiments = []
+    for c in concentrations:
+        initial = {**(initial_condition_dict or {}), dna: c * dna_scale}
+        t, data = read_dna_condition(c, observables, duration, directory)
+        experiments.append(Experiment(crn, t, data, list(observables), params_to_estimate, initial,
+                                      t0=0., **kwargs))
+    return experiments
+
+
+class ConditionPosterior:
+    """Log-posterior of a `JointLikelihood` under the bioscrape-style
+    `prior`, for emcee: ``-inf`` outside the prior's support."""
+
+    def __init__(self, likelihood, prior):
+        self.likelihood = likelihood
+        terms = [prior_terms(prior[name]) for name in likelihood.params_to_estimate]
+        self._terms = [t[0] for t in terms]
+        self.lower = np.array([np.exp(t[1][0]) if t[1][0] is not None else 0. for t in terms])
+        self.upper = np.array([np.exp(t[1][1]) if t[1][1] is not None else np.inf for t in terms])
+        self.centre = np.array([t[3] for t in terms], dtype=float)
+
+    def log_prior(self, theta):
+        if np.any(theta <= 0) or np.any(theta < self.lower) or np.any(theta > self.upper):
+            return -np.inf
+        return sum(f(t)[0] for f, t in zip(self._terms, theta))
+
+    def __call__(self, theta):
+        lp = self.log_prior(theta)
+        if not np.isfinite(lp):
+            return -np.inf
+        return lp + self.likelihood.log_likelihood(theta)
+
+
+def py_inference_conditions(experiments, prior, nwalkers=None, nsteps=1000, processes=None,
+                            init_seed=.1, seed=None, mp_context=None, **options):
+    """emcee over the shared `params_to_estimate` of `experiments` (or a
+    `JointLikelihood` of them).
+
+    The walkers move one at a time while each likelihood simulates the
+    conditions in a pool of `processes` workers (see `JointLikelihood`).
+    Walkers start log-normally around the prior centres with spread
+    `init_seed`; `nwalkers` defaults to four per parameter. `options`
+    (`progress`, `filename_csv`, `filename_txt`, `checkpoint`,
+    `checkpoint_every`, `resume`) go to `run_sampler`. Returns
+    ``(sampler, likelihood)``.
+    """
+    if isinstance(experiments, JointLikelihood):
+        likelihood = experiments
+    else:
+        likelihood = JointLikelihood(experiments, processes, mp_context)
+    log_prob_fn = ConditionPosterior(likelihood, prior)
+    ndim = len(likelihood.params_to_estimate)
+    nwalkers = 4 * ndim if nwalkers is None else nwalkers
+    rng = np.random.default_rng(seed)
+    state = log_prob_fn.centre * np.exp(init_seed * rng.standard_normal((nwalkers, ndim)))
+    state = np.clip(state, log_prob_fn.lower, log_prob_fn.upper)
+    try:
+        sampler = run_sampler(log_prob_fn, state, nsteps, **options)
+    finally:
+        likelihood.close()
+    return sampler, likelihood
@@ -0,0 +1,288 @@
+"""Conservation-law (moiety) reduction of mass-action networks.
+
+Every ``c`` with ``c @ S = 0`` (``S`` the stoichiometry matrix) gives a
+conserved total ``c @ x``. Examples are total T7RNAP over `T7RNAP`,
+`T7RNAP_bound*` and every elongation state, the ribosome subunits, each
+tRNA, and the CK/MK/NDK enzyme forms. The full Jacobian is singular along
+each of them. `conservation_laws` computes an exact, sparse basis of these
+vectors by substitution over the reactions. Each species starts as its
+own free variable, and each reaction's balance eliminates the free
+variable used by the fewest species. The surviving variables index the
+laws. A Gauss-Jordan pass over the laws then picks one dependent species
+per law (coefficient 1 in that law, 0 in the others), chosen to keep the
+reduced Jacobian sparse.
+
+`ReducedODE` integrates only the independent species and reconstructs the
+dependent ones from the totals of the initial state; `simulate_reduced` is
+`simulate` on top of it. Both are for analysis, not for speed, and are not
+part of the package's top-level API.
+
+Radau factors ``I/h - J``, which is nonsingular whether or not the laws are
+eliminated, so the reduction does not change the step sizes: on MGapt TX,
+MGapt-deGFP TX and MGapt TXwTL the reduced and full solves take the same
+steps at both ``1e-6/1e-9`` and ``1e-8/1e-12``. Eliminating every law
+densifies the reduced Jacobian: the long laws (total T7RNAP, ribosomes)
+only have elongation states as dependents, whose substitution fills whole
+rows. `ReducedODE` therefore keeps only laws with little fill (`max_fill`),
+and the remaining saving in dimension does not pay for the extra work per
+step. On MGapt-deGFP TX the reduced solve takes 8.2 s against 6.7 s for
+the full one at ``1e-6/1e-9``, and 63 s against 44 s at ``1e-8/1e-12``.
+"""
+from fractions import Fraction
+
+import numpy as np
+import scipy.sparse as sp
+
+from .ode import MassActionODE, observation, ode_solver, step_through, to_frame
+
+
+def _basis(crn):
+    #Exact law basis as {species: Fraction} rows, by substitution over the reactions
+    S = crn.incidence
+    n = crn.n_species
+    #expr[s]: species s's coefficient in each law, as {free variable: Fraction};
+    #users[f]: species whose expression contains free variable f
+    expr = [{s: Fraction(1)} for s in range(n)]
+    users = [{s} for s in range(n)]
+    for r in range(crn.n_reactions):
+        species, delta = S.changes(r)
+        relation = {}
+        for s, d in zip(species.tolist(), delta.tolist()):
+            for f, a in expr[s].items():
+                relation[f] = relation.get(f, 0) + int(d) * a
+        relation = {f: a for f, a in relation.items() if a}
+        if not relation:
+            continue
+        #Eliminate the free variable with the fewest users, to limit fill-in
+        pivot = min(relation, key=lambda f: (len(users[f]), f))
+        scale = relation.pop(pivot)
+        substitute = {f: -a / scale for f, a in relation.items()}
+        for s in users[pivot]:
+            e = expr[s]
+            a = e.pop(pivot)
+            for f, b in substitute.items():
+                value = e.get(f, 0) + a * b
+                if value:
+                    e[f] = value
+                    users[f].add(s)
+                else:
+                    e.pop(f, None)
+                    users[f].discard(s)
+        users[pivot] = set()
+    laws = {f: {} for f in range(n) if users[f]}
+    for s, e in enumerate(expr):
+        for f, a in e.items():
+            laws[f][s] = a
+    return list(laws.values())
+
+
+def jacobian_columns(crn):
+    """Nonzeros in each column of the Jacobian of `crn`'s mass-action ODEs:
+    the species changed by the reactions that consume each species."""
+    S = crn.stoichiometry.tocsr()
+    incidence = crn.incidence
+    consumes = sp.csc_matrix((np.ones(len(incidence.consumer_idx)), incidence.consumer_idx,
+                              incidence.consumer_ptr), shape=(crn.n_reactions, crn.n_species))
+    pattern = (abs(S) @ consumes).tocsc()
+    return np.diff(pattern.indptr)
+
+
+def conservation_laws(crn, x0=None):
+    """``(C, dependent)``: sparse ``(laws, species)`` conservation matrix with
+    ``C @ crn.stoichiometry == 0`` and, for law ``k``, a species
+    ``dependent[k]`` with coefficient 1 in law ``k`` and 0 in the others.
+
+    Substituting ``x_d = T - C_i x_i`` adds column ``d`` of the Jacobian
+    times law ``k`` to the reduced Jacobian, so the laws are pivoted
+    greedily on the smallest ``nnz(J[:, d]) * nnz(C[k])``. A species no
+    reaction consumes (`mRNA_i`, `PPi`, ...) adds nothing, and a long law
+    such as total T7RNAP is reduced against the short ones before it
+    pivots. Ties go to the larger amount in `x0`, to keep ``T - C_i x_i``
+    clear of cancellation.
+    """
+    rows = _basis(crn)
+    columns = jacobian_columns(crn)
+    amount = np.zeros(crn.n_species) if x0 is None else np.asarray(x0, dtype=float)
+    holders = {}
+    for k, row in enumerate(rows):
+        for s in row:
+            holders.setdefault(s, set()).add(k)
+
+    def best(k):
+        row = rows[k]
+        s = min(row, key=lambda s: (columns[s], -amount[s], s))
+        return columns[s] * (len(row) - 1), -amount[s], s
+
+    free = {k: best(k) for k in range(len(rows))}
+    dependent = [None] * len(rows)
+    #Gauss-Jordan over the laws, cheapest pivot first
+    while free:
+        k = min(free, key=free.get)
+        s = free.pop(k)[2]
+        dependent[k] = s
+        pivot = rows[k]
+        scale = pivot[s]
+        for t in pivot:
+            pivot[t] /= scale
+        for j in list(holders[s] - {k}):
+            row, a = rows[j], rows[j][s]
+            for t, b in pivot.items():
+                value = row.get(t, 0) - a * b
+                if value:
+                    if t not in row:
+                        holders.setdefault(t, set()).add(j)
+                    row[t] = value
+                else:
+                    row.pop(t, None)
+                    holders[t].discard(j)
+            if j in free:
+                free[j] = best(j)
+    r, c, data = [], [], []
+    for k, row in enumerate(rows):
+        for t, a in row.items():
+            r.append(k)
+            c.append(t)
+            data.append(float(a))
+    C = sp.csr_matrix((data, (r, c)), shape=(len(rows), crn.n_species))
+    return C, np.array(dependent, dtype=np.int64)
+
+
+class ReducedODE:
+    """`MassActionODE` of `crn` on its independent species only.
+
+    The dependent species of `conservation_laws` are ``x_d = T - C_i x_i``,
+    with the totals ``T = C x0`` fixed by the initial state given to
+    `integrate`. The reduced Jacobian is ``J_ii - J_id C_i``. Only laws
+    whose dependent adds at most `max_fill` entries to it are eliminated;
+    the long T7RNAP and nucleotide laws of TX have no dependent species
+    outside the elongation chain, and reconstructing a chain state from a
+    total in the thousands loses its precision while it still drives the
+    dynamics. `laws` reuses a `conservation_laws` result; `x0` guides its
+    choice of dependent species. `backend` is that of the full
+    `MassActionODE`.
+    """
+
+    def __init__(self, crn, parameters=None, laws=None, x0=None, max_fill=32, backend='auto'):
+        self.crn = crn
+        self.full = MassActionODE(crn, parameters, backend)
+        C, dependent = conservation_laws(crn, x0) if laws is None else laws
+        C = sp.csr_matrix(C)
+        columns = jacobian_columns(crn)[dependent]
+        keep = columns * (np.diff(C.indptr) - 1) <= max_fill
+        self.C, self.dependent = C[keep], dependent[keep]
+        mask = np.ones(crn.n_species, dtype=bool)
+        mask[self.dependent] = False
+        self.independent = np.flatnonzero(mask)
+        self._C_i = self.C.tocsc()[:, self.independent].tocsr()
+        self.totals = np.zeros(len(self.dependent))
+        #Dependents that some reaction consumes; the others never enter rhs
+        self._active = np.flatnonzero(columns[keep] > 0)
+        self._C_active = self._C_i[self._active]
+
+        #Reduced Jacobian data is M @ (full Jacobian data), with M fixed by the pattern
+        n, ni = crn.n_species, len(self.independent)
+        position = np.full(n, -1)
+        position[self.independent] = np.arange(ni)
+        law = np.full(n, -1)
+        law[self.dependent] = np.arange(len(self.dependent))
+        J_indptr, J_indices = self.full._J_indptr, self.full._J_indices
+        J_cols = np.repeat(np.arange(n), np.diff(J_indptr))
+        entry = np.arange(len(J_indices))
+        rows = position[J_indices]
+        entry, rows, J_cols = entry[rows >= 0], rows[rows >= 0], J_cols[rows >= 0]
+        direct = position[J_cols] >= 0
+        targets = [position[J_cols[direct]] * ni + rows[direct]]
+        sources, coefficients = [entry[direct]], [np.ones(direct.sum())]
+        C_i = self._C_i
+        counts = np.diff(C_i.indptr)[law[J_cols[~direct]]]
+        starts = np.repeat(C_i.indptr[law[J_cols[~direct]]], counts)
+        offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        targets.append(C_i.indices[starts + offset] * ni + np.repeat(rows[~direct], counts))
+        sources.append(np.repeat(entry[~direct], counts))
+        coefficients.append(-C_i.data[starts + offset])
+        #Column-major keys so the unique pattern is already in CSC order
+        keys, target = np.unique(np.concatenate(targets), return_inverse=True)
+        self._M = sp.csr_matrix((np.concatenate(coefficients), (target, np.concatenate(sources))),
+                                shape=(len(keys), len(J_indices)))
+        self._indices = (keys % ni).astype(np.int32)
+        self._indptr = np.searchsorted(keys // ni, np.arange(ni + 1)).astype(np.int32)
+
+    def __repr__(self):
+        return (f'ReducedODE({len(self.independent)} of {self.crn.n_species} species, '
+                f'{len(self.dependent)} conservation laws)')
+
+    @property
+    def k(self):
+        return self.full.k
+
+    @k.setter
+    def k(self, k):
+        self.full.k = k
+
+    def set_parameters(self, parameters):
+        self.full.set_parameters(parameters)
+
+    def reduce(self, x):
+        """Independent part of full state(s) `x`; also sets the totals from `x`
+        if it is a single state."""
+        x = np.asarray(x, dtype=float)
+        if x.ndim == 1:
+            self.totals = self.C @ x
+        return x[..., self.independent]
+
+    def expand(self, z):
+        """Full states from independent states `z` ``(..., independent)``."""
+        z = np.asarray(z, dtype=float)
+        x = np.empty(z.shape[:-1] + (self.crn.n_species,))
+        x[..., self.independent] = z
+        x[..., self.dependent] = self.totals - (self._C_i @ z.reshape(-1, z.shape[-1]).T).T.reshape(
+            z.shape[:-1] + (len(self.dependent),))
+        return x
+
+    def _state(self, z):
+        #Full state for rhs and jacobian, with only the consumed dependents filled in
+        x = np.zeros(self.crn.n_species)
+        x[self.independent] = z
+        x[self.dependent[self._active]] = self.totals[self._active] - self._C_active @ z
+        return x
+
+    def rhs(self, t, z):
+        return self.full.rhs(t, self._state(z))[self.independent]
+
+    def jacobian(self, t, z):
+        ni = len(self.independent)
+        data = self._M @ self.full.jacobian(t, self._state(z)).data
+        return sp.csc_matrix((data, self._indices, self._indptr), shape=(ni, ni))
+
+    def integrate(self, timepoints, x0, rtol=1e-6, atol=1e-9, method='Radau', observe=None,
+                  abort=None, stats=None, **options):
+        """Full ``(time, species)`` states (or ``observe @ x``) from `x0` at
+        ``timepoints[0]``, integrating the reduced system; `abort`, `stats`
+        and `options` as in `MassActionODE.integrate`."""
+        timepoints = np.asarray(timepoints, dtype=float)
+        z0 = self.reduce(x0)
+
+        def record(z):
+            x = self.expand(np.atleast_2d(z.T))
+            return x if observe is None else (observe @ x.T).T
+
+        out = np.empty((len(timepoints), self.crn.n_species if observe is None else observe.shape[0]))
+        out[0] = record(z0[:, None])[0]
+
+        def store(i, j, z):
+            out[i:j] = record(z)
+
+        solver = ode_solver(self.rhs, self.jacobian, timepoints[0], z0, timepoints[-1],
+                            rtol, atol, method, **options)
+        step_through(solver, timepoints, store, None if abort is None else lambda j: abort(out, j), stats)
+        return out
+
+
+def simulate_reduced(crn, timepoints, initial_condition_dict=None, parameters=None,
+                     observables=None, laws=None, **options):
+    """`simulate` through the conservation-reduced system (`ReducedODE`)."""
+    names, W = observation(crn, observables)
+    x0 = crn.initial_state(initial_condition_dict)
+    ode = ReducedODE(crn, parameters, laws, x0)
+    y = ode.integrate(timepoints, x0, observe=W, **options)
+    return to_frame(names, timepoints, y)
@@ -0,0 +1,231 @@
+"""MAP fits and Hamiltonian Monte Carlo on `Experiment` likelihoods.
+
+The emcee runs of the inference scripts use thousands of likelihood calls
+and stay with a few rates. Here one forward sensitivity solve
+(`Experiment.gradient`) returns the likelihood together with its gradient
+with respect to all estimated rates. That allows an L-BFGS MAP fit
+(`find_map`) followed by HMC (`hmc`) over every rate in `prior` at once.
+
+Rates are sampled as ``u = log(theta)``, so positivity is automatic. The
+log-posterior includes the Jacobian of that change of variables. The mass
+matrix is the Gauss-Newton Hessian of the posterior at the MAP: the Fisher
+information plus the prior curvature. Leapfrog steps are therefore scaled
+to the shape of the posterior from the first iteration, and only the step
+size is tuned during warm-up, by dual averaging.
+
+`py_inference_hmc` writes the post-warm-up samples to `mcmc_results.csv`,
+one row per sample with the parameters in `params_to_estimate` order. It
+writes the log-probabilities and the acceptance fraction to
+`mcmc_results.txt`. These are the layouts of `py_inference_parallel`, so
+`read_chain`, `posterior_summary` and the scripts' corner plots work
+unchanged.
+
+Priors use bioscrape's format, e.g. ``{'k_ntpadd': ['gaussian', 100, 25,
+'positive']}``, with the 'gaussian', 'uniform', 'log-uniform',
+'log-gaussian', 'exponential' and 'gamma' types. Log-probabilities are
+given up to a constant.
+"""
+import csv
+
+import numpy as np
+from scipy.linalg import cho_solve
+
+from .inference import write_log_prob
+from .likelihood import Experiment, JointLikelihood
+
+
+def prior_terms(spec):
+    """Terms of one bioscrape-style prior `spec`: the log-prior and its
+    derivative as a function of theta, the bounds of ``u = log(theta)``
+    (None if unbounded), the curvature in u, and a central value."""
+    kind = spec[0]
+    if kind == 'gaussian':
+        mu, sd = spec[1], spec[2]
+        return (lambda t: (-.5 * ((t - mu) / sd) ** 2, -(t - mu) / sd ** 2),
+                (None, None), lambda t: (t / sd) ** 2, mu if mu > 0 else sd)
+    if kind in ('uniform', 'log-uniform'):
+        lo, hi = spec[1], spec[2]
+        width = np.log(hi / lo) if lo > 0 else np.inf
+        if kind == 'uniform':
+            terms = lambda t: (0., 0.)
+        else:
+            terms = lambda t: (-np.log(t), -1 / t)
+        return (terms, (np.log(lo) if lo > 0 else None, np.log(hi)),
+                lambda t: 12 / width ** 2, np.sqrt(lo * hi) if lo > 0 else hi / 2)
+    if kind == 'log-gaussian':
+        mu, sd = spec[1], spec[2]
+        return (lambda t: (-np.log(t) - .5 * ((np.log(t) - mu) / sd) ** 2,
+                           -1 / t - (np.log(t) - mu) / (sd ** 2 * t)),
+                (None, None), lambda t: 1 / sd ** 2, np.exp(mu))
+    if kind == 'exponential':
+        lam = spec[1]
+        return (lambda t: (-lam * t, -lam), (None, None), lambda t: lam * t, 1 / lam)
+    if kind == 'gamma':
+        alpha, beta = spec[1], spec[2]
+        return (lambda t: ((alpha - 1) * np.log(t) - beta * t, (alpha - 1) / t - beta),
+                (None, None), lambda t: beta * t, alpha / beta)
+    raise ValueError(f'Unsupported prior type {kind!r}')
+
+
+class Posterior:
+    """Log-posterior in ``u = log(theta)`` of one or more `Experiment` s (or
+    a `JointLikelihood`, whose conditions are evaluated in parallel) that
+    estimate the same `params_to_estimate`, under the bioscrape-style `prior`."""
+
+    def __init__(self, experiments, prior, substeps=1):
+        single = isinstance(experiments, (Experiment, JointLikelihood))
+        self.experiments = [experiments] if single else list(experiments)
+        self.names = self.experiments[0].params_to_estimate
+        for e in self.experiments[1:]:
+            if e.params_to_estimate != self.names:
+                raise ValueError('All experiments must estimate the same parameters')
+        try:
+            terms = [prior_terms(prior[name]) for name in self.names]
+        except KeyError as e:
+            raise KeyError(f'No prior for parameter {e.args[0]!r}') from None
+        self._terms, self.bounds, self._curvature, centre = zip(*terms)
+        self.centre = np.array(centre, dtype=float)
+        self.substeps = substeps
+        self.n_evaluations = 0
+
+    def _in_bounds(self, u):
+        return all((lo is None or x >= lo) and (hi is None or x <= hi)
+                   for x, (lo, hi) in zip(u, self.bounds))
+
+    def __call__(self, u):
+        """``(log_posterior, gradient)`` at ``u = log(theta)``."""
+        u = np.asarray(u, dtype=float)
+        if not self._in_bounds(u):
+            return -np.inf, np.zeros(len(u))
+        with np.errstate(over='ignore'):
+            theta = np.exp(u)
+        if not np.isfinite(theta).all():
+            return -np.inf, np.zeros(len(u))
+        lp, grad = zip(*(f(t) for f, t in zip(self._terms, theta)))
+        logp, grad = sum(lp) + u.sum(), np.array(grad, dtype=float)
+        for e in self.experiments:
+            ll, g = e.gradient(theta, self.substeps)
+            self.n_evaluations += 1
+            if not np.isfinite(ll):
+                return -np.inf, np.zeros(len(u))
+            logp, grad = logp + ll, grad + g
+        return logp, theta * grad + 1
+
+    def precision(self, u):
+        """Gauss-Newton Hessian of the negative log-posterior at `u`."""
+        theta = np.exp(np.asarray(u, dtype=float))
+        F = sum(e.fisher_information(theta, self.substeps) for e in self.experiments)
+        self.n_evaluations += len(self.experiments)
+        return F * np.outer(theta, theta) + np.diag([c(t) for c, t in zip(self._curvature, theta)])
+
+
+def find_map(posterior, theta0=None, decades=4, **options):
+    """``(theta, result)``: L-BFGS-B maximum of `posterior`, started from
+    `theta0` (default the prior centres).
+
+    Rates without prior bounds are searched within `decades` orders of
+    magnitude of the start; the unscaled first L-BFGS step would otherwise
+    overflow ``exp(u)``. `options` go to `scipy.optimize.minimize`.
+    """
+    from scipy.optimize import minimize
+
+    def cost(u):
+        logp, grad = posterior(u)
+        #A large finite cost lets the line search back off from failed integrations
+        return (-logp, -grad) if np.isfinite(logp) else (1e100, np.zeros(len(u)))
+
+    u0 = np.log(posterior.centre if theta0 is None else np.asarray(theta0, dtype=float))
+    span = decades * np.log(10)
+    bounds = [(x - span if lo is None else lo, x + span if hi is None else hi)
+              for x, (lo, hi) in zip(u0, posterior.bounds)]
+    result = minimize(cost, u0, jac=True, method='L-BFGS-B', bounds=bounds, **options)
+    return np.exp(result.x), result
+
+
+def _mass_factor(M):
+    #Cholesky factor of the mass matrix, with unidentified directions floored
+    w, V = np.linalg.eigh((M + M.T) / 2)
+    w = np.maximum(w, 1e-6 * max(w.max(), 1.))
+    return np.linalg.cholesky((V * w) @ V.T)
+
+
+def hmc(posterior, theta0, nsamples=500, warmup=100, n_leapfrog=8, step_size=.5,
+        target_accept=.65, mass=None, seed=None):
+    """Hamiltonian Monte Carlo from `theta0`, usually the MAP.
+
+    Yields ``(theta, log_posterior, accepted)`` for each of the `nsamples`
+    samples after `warmup` iterations of step-size adaptation. `mass`
+    defaults to `posterior.precision` at `theta0`.
+    """
+    rng = np.random.default_rng(seed)
+    u = np.log(np.asarray(theta0, dtype=float))
+    L = _mass_factor(posterior.precision(u) if mass is None else np.asarray(mass, dtype=float))
+    logp, grad = posterior(u)
+    if not np.isfinite(logp):
+        raise ValueError('The starting point has zero posterior probability')
+    #Dual averaging (Hoffman & Gelman 2014), centred on `step_size` rather than
+    #10x it: the mass matrix already whitens the posterior
+    mu, h_bar = np.log(step_size), 0.
+    log_eps = log_eps_bar = np.log(step_size)
+    for it in range(warmup + nsamples):
+        eps = np.exp(log_eps) if it < warmup else np.exp(log_eps_bar) * rng.uniform(.9, 1.1)
+        z = rng.standard_normal(len(u))
+        p = L @ z
+        u1, logp1, grad1 = u, logp, grad
+        p1 = p + .5 * eps * grad1
+        for step in range(n_leapfrog):
+            u1 = u1 + eps * cho_solve((L, True), p1)
+            logp1, grad1 = posterior(u1)
+            if not np.isfinite(logp1):
+                break
+            if step < n_leapfrog - 1:
+                p1 = p1 + eps * grad1
+        if np.isfinite(logp1):
+            p1 = p1 + .5 * eps * grad1
+            log_ratio = logp1 - .5 * p1 @ cho_solve((L, True), p1) - logp + .5 * z @ z
+            accept_prob = min(1., np.exp(log_ratio)) if np.isfinite(log_ratio) else 0.
+        else:
+            accept_prob = 0.
+        accepted = rng.random() < accept_prob
+        if accepted:
+            u, logp, grad = u1, logp1, grad1
+        if it < warmup:
+            m = it + 1
+            h_bar += (target_accept - accept_prob - h_bar) / (m + 10)
+            log_eps = mu - np.sqrt(m) / .05 * h_bar
+            log_eps_bar = m ** -.75 * log_eps + (1 - m ** -.75) * log_eps_bar
+        else:
+            yield np.exp(u), logp, accepted
+
+
+def py_inference_hmc(experiments, prior, nsamples=500, warmup=100, n_leapfrog=8, theta0=None,
+                     seed=None, filename_csv='mcmc_results.csv', filename_txt='mcmc_results.txt',
+                     corner_file=None, substeps=1, **options):
+    """MAP fit then HMC over the `params_to_estimate` of `experiments`.
+
+    Writes the samples and log-probabilities like `py_inference_parallel`,
+    and a corner plot to `corner_file` if given. `options` go to `hmc`.
+    Returns ``(samples, theta_map, posterior)``; ``posterior.n_evaluations``
+    counts the sensitivity solves.
+    """
+    posterior = Posterior(experiments, prior, substeps)
+    theta_map = find_map(posterior, theta0)[0]
+    samples, log_prob, accepted = [], [], 0
+    with open(filename_csv, 'w', newline='') as f:
+        writer = csv.writer(f)
+        for theta, logp, acc in hmc(posterior, theta_map, nsamples, warmup, n_leapfrog,
+                                    seed=seed, **options):
+            writer.writerow(theta)
+            f.flush()
+            samples.append(theta)
+            log_prob.append(logp)
+            accepted += acc
+    write_log_prob(np.array(log_prob)[:, None], [accepted], nsamples, filename_txt)
+    samples = np.array(samples)
+    if corner_file is not None:
+        import corner
+        import matplotlib.pyplot as plt
+
+        corner.corner(samples, labels=posterior.names, levels=(0.75,))
+        plt.savefig(corner_file)
+    return samples, theta_map, posterior
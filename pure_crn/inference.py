@@ -0,0 +1,232 @@
+"""Multi-process MCMC for the bioscrape inference scripts.
+
+`py_inference_parallel` takes the same arguments as
+`bioscrape.inference.py_inference`, but evaluates the walkers' likelihoods in
+a process pool. Each worker unpickles the `Model` and sets up its bioscrape
+likelihood once, at start-up; afterwards only parameter vectors and
+log-likelihoods cross process boundaries. The flattened chain is written to
+`mcmc_results.csv` in the same layout as bioscrape, appended as the walkers
+advance, so `posterior_summary` can be read while the run is going.
+
+The sampler state (walker positions, log-probabilities, RNG state, step) is
+checkpointed to `mcmc_checkpoint.npz` every `checkpoint_every` steps;
+``resume=True`` continues a killed run from the last checkpoint.
+`run_sampler` does the same for any log-probability function.
+
+The affine-invariant ensemble moves half of the walkers at a time, so at most
+``nwalkers // 2`` workers are busy; use ``nwalkers >= 2 * processes``.
+"""
+import csv
+import multiprocessing
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+#Per-process likelihood, set by _init_worker
+_pid_interface = None
+
+#py_inference keyword -> InferenceSetup setter
+_SETTERS = {
+    'exp_data': 'set_exp_data',
+    'measurements': 'set_measurements',
+    'time_column': 'set_time_column',
+    'nwalkers': 'set_nwalkers',
+    'init_seed': 'set_init_seed',
+    'nsteps': 'set_nsteps',
+    'sim_type': 'set_sim_type',
+    'params_to_estimate': 'set_params_to_estimate',
+    'prior': 'set_prior',
+}
+
+
+def _options(kwargs):
+    #Keywords py_inference forwards to InferenceSetup, i.e. all but the setter ones
+    return {k: v for k, v in kwargs.items() if k not in _SETTERS}
+
+
+def setup_inference(Model, initial_conditions=None, parameter_conditions=None, **kwargs):
+    """`InferenceSetup` configured like `py_inference`, with its likelihood set up."""
+    from bioscrape.inference import initialize_inference
+
+    options = _options(kwargs)
+    pid = initialize_inference(Model=Model, **options)
+    if initial_conditions is None:
+        initial_conditions = dict(Model.get_species_dictionary())
+    pid.set_initial_conditions(initial_conditions)
+    pid.set_parameter_conditions(parameter_conditions)
+    for name, setter in _SETTERS.items():
+        if kwargs.get(name) is not None:
+            getattr(pid, setter)(kwargs[name])
+    pid.prepare_inference(**options)
+    pid.setup_cost_function(**options)
+    return pid
+
+
+def _init_worker(Model, kwargs):
+    global _pid_interface
+    _pid_interface = setup_inference(Model, **kwargs).pid_interface
+
+
+def _log_likelihood(params):
+    return _pid_interface.get_likelihood_function(params)
+
+
+def default_processes():
+    """Worker count: SLURM allocation if any, else all cores."""
+    return int(os.environ.get('SLURM_CPUS_PER_TASK', 0)) or os.cpu_count() or 1
+
+
+def save_checkpoint(filename, state, step, log_prob, accepted):
+    """Write the emcee `state` after `step` steps, with the log-probability
+    history and per-walker acceptance counts, to `filename` (npz)."""
+    _, key, pos, has_gauss, cached_gaussian = state.random_state
+    #Write to a temporary file then rename, so a kill never leaves a partial checkpoint
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(filename)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, coords=state.coords, log_prob=state.log_prob, step=step,
+                     log_prob_chain=log_prob, accepted=accepted,
+                     rng_key=key, rng_pos=pos, rng_has_gauss=has_gauss,
+                     rng_cached_gaussian=cached_gaussian)
+        os.replace(tmp, filename)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_checkpoint(filename):
+    """``(state, step, log_prob, accepted)`` as written by `save_checkpoint`."""
+    import emcee
+
+    with np.load(filename, allow_pickle=False) as data:
+        random_state = ('MT19937', data['rng_key'], int(data['rng_pos']),
+                        int(data['rng_has_gauss']), float(data['rng_cached_gaussian']))
+        state = emcee.State(data['coords'], log_prob=data['log_prob'],
+                            random_state=random_state)
+        return state, int(data['step']), data['log_prob_chain'], data['accepted']
+
+
+def _truncate_rows(filename, n):
+    #Drop rows written after the checkpoint the run resumes from
+    with open(filename, 'r+b') as f:
+        for _ in range(n):
+            if not f.readline():
+                raise ValueError(f'{filename} has fewer than {n} rows, cannot resume')
+        f.truncate()
+
+
+def write_log_prob(log_prob, accepted, nsteps, filename_txt='mcmc_results.txt'):
+    """Write the log-probabilities and acceptance fractions as bioscrape does."""
+    with open(filename_txt, 'w', newline='') as f:
+        f.write('\nCost function progress\n')
+        f.write(str(np.ravel(log_prob).tolist()))
+        f.write('\nAcceptance fraction\n')
+        f.write(str((np.asarray(accepted) / max(nsteps, 1)).tolist()))
+
+
+def read_chain(filename_csv='mcmc_results.csv', labels=None):
+    """Samples written so far as a DataFrame; a row cut short by a running job is dropped."""
+    import pandas as pd
+
+    return pd.read_csv(filename_csv, names=labels, header=None).dropna()
+
+
+def posterior_summary(filename_csv='mcmc_results.csv', labels=None, tail=500):
+    """Mean, std and quantiles of the last `tail` samples."""
+    return read_chain(filename_csv, labels).tail(tail).describe(percentiles=[.05, .5, .95]).T
+
+
+def _run_chain(sampler, state, start, nsteps, log_prob, accepted, filename_csv,
+               checkpoint, checkpoint_every, progress):
+    log_prob = [log_prob]
+    with open(filename_csv, 'a', newline='') as f:
+        writer = csv.writer(f)
+        steps = sampler.sample(state, iterations=nsteps - start, progress=progress)
+        for step, state in enumerate(steps, start + 1):
+            writer.writerows(state.coords)
+            log_prob.append(state.log_prob[None])
+            if checkpoint and (step % checkpoint_every == 0 or step == nsteps):
+                #Samples must be on disk before the checkpoint that counts them
+                f.flush()
+                os.fsync(f.fileno())
+                log_prob = [np.concatenate(log_prob)]
+                save_checkpoint(checkpoint, state, step, log_prob[0],
+                                accepted + sampler.backend.accepted)
+    return np.concatenate(log_prob), accepted + sampler.backend.accepted
+
+
+def run_sampler(log_prob_fn, state, nsteps, pool=None, progress=True, filename_csv='mcmc_results.csv',
+                filename_txt='mcmc_results.txt', checkpoint='mcmc_checkpoint.npz', checkpoint_every=10,
+                resume=False):
+    """emcee from the ``(nwalkers, ndim)`` start `state` (or an `emcee.State`,
+    to fix the random state), evaluating `log_prob_fn` in `pool` if given.
+
+    Writes, checkpoints and resumes the chain as `py_inference_parallel`
+    does; `nsteps` is the total over all resumed runs. Returns the sampler.
+    """
+    import emcee
+
+    nwalkers, ndim = np.shape(getattr(state, 'coords', state))
+    if resume and checkpoint and os.path.exists(checkpoint):
+        state, start, log_prob, accepted = load_checkpoint(checkpoint)
+        if state.coords.shape != (nwalkers, ndim):
+            raise ValueError(f'{checkpoint} holds {state.coords.shape} walkers x parameters, '
+                             f'expected {(nwalkers, ndim)}')
+        _truncate_rows(filename_csv, start * nwalkers)
+    else:
+        start, log_prob, accepted = 0, np.empty((0, nwalkers)), np.zeros(nwalkers, dtype=int)
+        open(filename_csv, 'w').close()
+
+    sampler = emcee.EnsembleSampler(nwalkers, ndim, log_prob_fn, pool=pool)
+    log_prob, accepted = _run_chain(sampler, state, start, nsteps, log_prob, accepted, filename_csv,
+                                    checkpoint, checkpoint_every, progress)
+    write_log_prob(log_prob, accepted, nsteps, filename_txt)
+    return sampler
+
+
+def py_inference_parallel(Model=None, processes=None, plot_show=False, progress=True,
+                          filename_csv='mcmc_results.csv', filename_txt='mcmc_results.txt',
+                          checkpoint='mcmc_checkpoint.npz', checkpoint_every=10, resume=False,
+                          mp_context=None, **kwargs):
+    """Run `py_inference`-style emcee MCMC with a process pool.
+
+    `processes` defaults to `default_processes()`; ``processes=1`` runs in
+    this process. With ``resume=True`` the run continues from `checkpoint`
+    if it exists (and starts afresh otherwise); `nsteps` is the total over
+    all resumed runs. ``checkpoint=None`` disables checkpointing.
+    Remaining keyword arguments are those of `py_inference`
+    (`exp_data`, `measurements`, `time_column`, `params_to_estimate`,
+    `prior`, `nwalkers`, `nsteps`, `init_seed`, `sim_type`, solver options,
+    ...). Returns ``(sampler, pid)`` like `py_inference`; after a resume the
+    sampler only holds the steps of this run, the csv holds them all.
+    """
+    if Model is None:
+        raise ValueError('Model object cannot be None.')
+    processes = default_processes() if processes is None else processes
+    pid = setup_inference(Model, **kwargs)
+    state = pid.seed_parameter_values(**_options(kwargs))
+    processes = min(processes, max(1, len(state) // 2))
+    run = dict(progress=progress, filename_csv=filename_csv, filename_txt=filename_txt,
+               checkpoint=checkpoint, checkpoint_every=checkpoint_every, resume=resume)
+
+    if processes > 1:
+        #Fork by default: the inference scripts have no `if __name__ == '__main__'`
+        #guard, so spawned workers would re-run them
+        if mp_context is None and 'fork' in multiprocessing.get_all_start_methods():
+            mp_context = 'fork'
+        ctx = multiprocessing.get_context(mp_context)
+        with ctx.Pool(processes, initializer=_init_worker, initargs=(Model, kwargs)) as pool:
+            sampler = run_sampler(_log_likelihood, state, pid.nsteps, pool, **run)
+    else:
+        sampler = run_sampler(pid.pid_interface.get_likelihood_function, state, pid.nsteps, **run)
+
+    if plot_show:
+        pid.plot_mcmc_results(sampler, **_options(kwargs))
+    return sampler, pid
+
+
+if __name__ == '__main__':
+    #python -m pure_crn.inference [mcmc_results.csv [tail]]: summary of a (running) chain
+    print(posterior_summary(*sys.argv[1:2], tail=int(sys.argv[2]) if len(sys.argv) > 2 else 500))
@@ -0,0 +1,296 @@
+"""Preprocessed experiments for fast likelihood evaluation.
+
+bioscrape repackages the `exp_data` DataFrames and realigns their time
+column on every likelihood call. An `Experiment` fixes the measurement
+timepoints, the observation matrix, the replicate array and the noise model
+once; a call then runs one `MassActionODE` integration that records only the
+observables at the measurement times and evaluates the Gaussian
+log-likelihood of all replicates with one vectorized expression.
+
+`Experiment.gradient` and `Experiment.fisher_information` add the forward
+sensitivities of the observables to the `params_to_estimate`, for MAP fits
+and gradient-based samplers (`pure_crn.hmc`).
+
+`JointLikelihood` sums the experiments of several conditions (e.g. DNA
+concentrations, `pure_crn.conditions`), simulating them in parallel.
+"""
+import numpy as np
+
+from .ode import MassActionODE, observation, tuned_options
+from .sensitivity import forward_sensitivities
+
+#Integrator failures (RuntimeError covers IntegrationAborted); other errors are bugs and propagate
+_INTEGRATION_ERRORS = (RuntimeError, FloatingPointError, np.linalg.LinAlgError)
+
+
+class Experiment:
+    """Replicate measurements of `observables` of `crn` at `timepoints`.
+
+    `data` is ``(replicates, time, observables)``, or ``(replicates, time)``
+    for a single observable; NaN entries are missing readings (e.g. an
+    observable not read at some of the timepoints) and are left out of the
+    likelihood. `sigma` is the measurement standard deviation: a scalar, an
+    array broadcastable to ``(time, observables)``, or None for the
+    replicate standard deviation at each timepoint (floored at
+    `sigma_floor` times its mean).
+
+    The integration starts at `t0`, by default the first measurement time as
+    in bioscrape, from `initial_condition_dict`. `params_to_estimate` are the
+    parameter names set by `log_likelihood(theta)`.
+
+    With `max_chi2`, the integration is abandoned and ``-inf`` returned as
+    soon as the sum of squared normalized residuals of the timepoints
+    already simulated exceeds it; proposals that far in the tail are
+    rejected anyway, but it does truncate the likelihood, so keep it large.
+
+    `backend` is that of `MassActionODE`: by default a compiled kernel is
+    used only if one is already cached; pass 'compile' to build it. Without
+    a method or tolerances in `options`, those of `tuned_options` are used.
+    """
+
+    def __init__(self, crn, timepoints, data, observables=('MGapt',), params_to_estimate=(),
+                 initial_condition_dict=None, sigma=None, sigma_floor=.01, t0=None,
+                 max_chi2=None, backend='auto', **options):
+        self.crn = crn
+        self.names, self._W = observation(crn, list(observables))
+        self.timepoints = np.asarray(timepoints, dtype=float)
+        data = np.asarray(data, dtype=float)
+        if data.ndim == 2:
+            data = data[:, :, None]
+        if data.shape[1:] != (len(self.timepoints), len(self.names)):
+            raise ValueError(f'data has shape {data.shape}, expected '
+                             f'(replicates, {len(self.timepoints)}, {len(self.names)})')
+        self.data = data
+        observed = np.isfinite(data)
+        n = observed.sum(axis=0)
+        if sigma is None:
+            sigma = np.ones(data.shape[1:])
+            enough = n > 1
+            if len(data) > 1 and enough.any():
+                filled = np.where(observed, data, 0.)
+                mean = filled.sum(axis=0) / np.maximum(n, 1)
+                sd = np.sqrt((((filled - mean) * observed) ** 2).sum(axis=0) / np.maximum(n - 1, 1))
+                scale = np.abs(sd[enough]).mean()
+                #Timepoints with fewer than two readings get the mean deviation
+                sigma = np.where(enough, np.maximum(sd, sigma_floor * scale), scale)
+        self.sigma = np.broadcast_to(np.asarray(sigma, dtype=float), data.shape[1:])
+        #Residual weights 1/sigma, zero at missing readings
+        self._data = np.where(observed, data, 0.)
+        self._weight = observed / self.sigma
+        self._norm = -(n * np.log(self.sigma)).sum() - .5 * np.log(2 * np.pi) * n.sum()
+
+        self.t0 = self.timepoints[0] if t0 is None else float(t0)
+        if self.t0 > self.timepoints[0]:
+            raise ValueError('t0 is after the first measurement')
+        self._t = self.timepoints if self.t0 == self.timepoints[0] else \
+            np.concatenate([[self.t0], self.timepoints])
+        self._offset = len(self._t) - len(self.timepoints)
+        self.x0 = crn.initial_state(initial_condition_dict)
+
+        self.params_to_estimate = list(params_to_estimate)
+        try:
+            self._param_idx = np.array([crn.parameter_index[p] for p in self.params_to_estimate],
+                                       dtype=np.int64)
+        except KeyError as e:
+            raise KeyError(f'Unknown parameter {e.args[0]!r}') from None
+        self.parameter_values = crn.parameter_values.copy()
+        self.max_chi2 = max_chi2
+        self.options = tuned_options(crn, options)
+        self._ode = MassActionODE(crn, backend=backend)
+
+    @classmethod
+    def from_dataframes(cls, crn, exp_data, measurements, time_column='timepoints', **kwargs):
+        """Build from `py_inference`-style `exp_data`: one DataFrame per
+        replicate with a `time_column` and the `measurements` columns."""
+        if isinstance(time_column, (list, tuple)):
+            time_column = time_column[0]
+        timepoints = exp_data[0][time_column].to_numpy()
+        for df in exp_data[1:]:
+            if not np.array_equal(df[time_column].to_numpy(), timepoints):
+                raise ValueError('All replicates must share the same timepoints')
+        data = np.stack([df[list(measurements)].to_numpy() for df in exp_data])
+        return cls(crn, timepoints, data, measurements, **kwargs)
+
+    def __repr__(self):
+        return (f'Experiment({len(self.data)} replicates, {len(self.timepoints)} timepoints, '
+                f'observables={self.names})')
+
+    def chi2(self, y):
+        """Sum of squared normalized residuals of a ``(time, observables)`` prediction."""
+        r = (self._data - y) * self._weight
+        return float(np.einsum('ijk,ijk->', r, r))
+
+    def _abort(self, out, j):
+        j -= self._offset
+        if j <= 0:
+            return False
+        r = (self._data[:, :j] - out[self._offset:self._offset + j]) * self._weight[:, :j]
+        return float(np.einsum('ijk,ijk->', r, r)) > self.max_chi2
+
+    def _set(self, theta):
+        if theta is not None:
+            theta = np.asarray(theta, dtype=float)
+            if theta.shape != self._param_idx.shape:
+                raise ValueError(f'theta has shape {theta.shape}, expected ({len(self._param_idx)},) '
+                                 f'for {self.params_to_estimate}')
+            self.parameter_values[self._param_idx] = theta
+        self._ode.k = self.crn.rates(self.parameter_values)
+
+    def simulate(self, theta=None):
+        """``(time, observables)`` prediction at the measurement times."""
+        self._set(theta)
+        abort = self._abort if self.max_chi2 is not None else None
+        y = self._ode.integrate(self._t, self.x0, observe=self._W, abort=abort, **self.options)
+        return y[self._offset:]
+
+    def log_likelihood(self, theta=None):
+        """Gaussian log-likelihood of the replicates at `params_to_estimate` = `theta`.
+
+        Returns ``-inf`` if the integration fails or is aborted; malformed
+        `theta` raises.
+        """
+        self._set(theta)
+        try:
+            y = self.simulate()
+        except _INTEGRATION_ERRORS:
+            return -np.inf
+        ll = self._norm - .5 * self.chi2(y)
+        return ll if np.isfinite(ll) else -np.inf
+
+    __call__ = log_likelihood
+
+    def sensitivities(self, theta=None, substeps=1):
+        """Prediction ``(time, observables)`` and its sensitivities
+        ``(time, params_to_estimate, observables)`` at the measurement times."""
+        self._set(theta)
+        y, S = forward_sensitivities(self._ode, self._t, self.x0, self._param_idx, self._W,
+                                     substeps, **self.options)
+        return y[self._offset:], S[self._offset:]
+
+    def gradient(self, theta=None, substeps=1):
+        """``(log_likelihood, gradient)`` with respect to `params_to_estimate`.
+
+        Returns ``(-inf, 0)`` if the integration fails.
+        """
+        self._set(theta)
+        try:
+            y, S = self.sensitivities(substeps=substeps)
+        except _INTEGRATION_ERRORS:
+            return -np.inf, np.zeros(len(self._param_idx))
+        ll = self._norm - .5 * self.chi2(y)
+        if not np.isfinite(ll):
+            return -np.inf, np.zeros(len(self._param_idx))
+        w = ((self._data - y) * self._weight ** 2).sum(axis=0)
+        return ll, np.einsum('ik,ijk->j', w, S)
+
+    def fisher_information(self, theta=None, substeps=1):
+        """Gauss-Newton approximation of the negative log-likelihood Hessian."""
+        S = self.sensitivities(theta, substeps)[1]
+        return np.einsum('ijk,ik,ilk->jl', S, (self._weight ** 2).sum(axis=0), S)
+
+
+#Per-process experiments of a JointLikelihood pool, set by _init_worker
+_experiments = None
+
+
+def _init_worker(experiments):
+    global _experiments
+    _experiments = experiments
+
+
+def _condition_log_likelihood(args):
+    i, theta = args
+    return _experiments[i].log_likelihood(theta)
+
+
+def _condition_gradient(args):
+    i, theta, substeps = args
+    return _experiments[i].gradient(theta, substeps)
+
+
+def _condition_fisher_information(args):
+    i, theta, substeps = args
+    return _experiments[i].fisher_information(theta, substeps)
+
+
+class JointLikelihood:
+    """Sum of the log-likelihoods of several `Experiment` s, e.g. one per
+    experimental condition, that estimate the same `params_to_estimate`.
+
+    The conditions of one evaluation are simulated concurrently in a pool
+    of `processes` workers (default one per condition, up to
+    `default_processes`), created on first use and forked by default like
+    `py_inference_parallel`'s; ``processes=1`` evaluates them in turn.
+    `log_likelihood`, `gradient` and `fisher_information` have
+    `Experiment`'s signatures, so a `JointLikelihood` can stand in for an
+    experiment in `pure_crn.hmc.Posterior`.
+    """
+
+    def __init__(self, experiments, processes=None, mp_context=None):
+        from .inference import default_processes
+
+        self.experiments = list(experiments)
+        self.params_to_estimate = self.experiments[0].params_to_estimate
+        for e in self.experiments[1:]:
+            if e.params_to_estimate != self.params_to_estimate:
+                raise ValueError('All experiments must estimate the same parameters')
+        processes = default_processes() if processes is None else processes
+        self.processes = max(1, min(processes, len(self.experiments)))
+        self.mp_context = mp_context
+        self._pool = None
+
+    def __repr__(self):
+        return f'JointLikelihood({len(self.experiments)} experiments, {self.processes} processes)'
+
+    def __getstate__(self):
+        #Pools do not pickle; a copy starts its own
+        state = dict(self.__dict__)
+        state['_pool'] = None
+        return state
+
+    def _map(self, f, args):
+        if self.processes == 1:
+            _init_worker(self.experiments)
+            return [f(a) for a in args]
+        if self._pool is None:
+            import multiprocessing
+
+            mp_context = self.mp_context
+            if mp_context is None and 'fork' in multiprocessing.get_all_start_methods():
+                mp_context = 'fork'
+            ctx = multiprocessing.get_context(mp_context)
+            self._pool = ctx.Pool(self.processes, initializer=_init_worker,
+                                  initargs=(self.experiments,))
+        return self._pool.map(f, args, chunksize=1)
+
+    def close(self):
+        """Shut the worker pool down."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def log_likelihood(self, theta=None):
+        """Summed log-likelihood; ``-inf`` if any condition fails."""
+        ll = self._map(_condition_log_likelihood, [(i, theta) for i in range(len(self.experiments))])
+        return float(sum(ll))
+
+    __call__ = log_likelihood
+
+    def gradient(self, theta=None, substeps=1):
+        """``(log_likelihood, gradient)`` summed over the conditions."""
+        out = self._map(_condition_gradient, [(i, theta, substeps) for i in range(len(self.experiments))])
+        ll = sum(o[0] for o in out)
+        if not np.isfinite(ll):
+            return -np.inf, np.zeros(len(self.params_to_estimate))
+        return ll, sum(o[1] for o in out)
+
+    def fisher_information(self, theta=None, substeps=1):
+        return sum(self._map(_condition_fisher_information,
+                             [(i, theta, substeps) for i in range(len(self.experiments))]))
@@ -0,0 +1,403 @@
+"""Index-based mass-action reaction networks.
+
+`CRNBuilder` collects species, parameters and reactions as integer indices and
+`CRNBuilder.compile` packs them into a `CompiledCRN`: a species table, a
+parameter vector and CSR-style reactant/product index arrays. This replaces
+the BioCRNpyler `Species`/`Reaction` object graph of the notebooks.
+
+`CompiledCRN.incidence` holds the reverse lookups that simulators and
+analyses need: the reactions each species takes part in, the net species
+changes of each reaction, and the reaction dependency graph. Tools can
+then answer "which reactions touch X" with a slice rather than a scan of
+the reaction list. Compiled networks build it once, and `save` stores it
+with the network.
+"""
+import hashlib
+import re
+
+import numpy as np
+import scipy.sparse as sp
+
+
+class Incidence:
+    """CSR-style species <-> reaction indexes of a `CompiledCRN`.
+
+    Species ``s`` is a reactant of reactions
+    ``consumer_idx[consumer_ptr[s]:consumer_ptr[s+1]]`` and a product of
+    ``producer_idx[producer_ptr[s]:producer_ptr[s+1]]``. Reaction ``r``
+    changes species ``change_idx[change_ptr[r]:change_ptr[r+1]]`` by
+    ``change_delta`` (the nonzero column of the stoichiometry matrix;
+    catalysts do not appear). All index lists are sorted.
+    """
+
+    _arrays = ('consumer_ptr', 'consumer_idx', 'producer_ptr', 'producer_idx',
+               'change_ptr', 'change_idx', 'change_delta')
+
+    def __init__(self, n_species, n_reactions, consumer_ptr, consumer_idx,
+                 producer_ptr, producer_idx, change_ptr, change_idx, change_delta):
+        self.n_species = n_species
+        self.n_reactions = n_reactions
+        self.consumer_ptr = np.asarray(consumer_ptr, dtype=np.int64)
+        self.consumer_idx = np.asarray(consumer_idx, dtype=np.int64)
+        self.producer_ptr = np.asarray(producer_ptr, dtype=np.int64)
+        self.producer_idx = np.asarray(producer_idx, dtype=np.int64)
+        self.change_ptr = np.asarray(change_ptr, dtype=np.int64)
+        self.change_idx = np.asarray(change_idx, dtype=np.int64)
+        self.change_delta = np.asarray(change_delta, dtype=float)
+        self._dependency = None
+
+    @classmethod
+    def from_crn(cls, crn):
+        def by_species(matrix):
+            #Distinct reactions per species row, sorted
+            matrix = matrix.tocsr()
+            matrix.sum_duplicates()
+            return matrix.indptr, matrix.indices
+
+        S = (crn.product_matrix - crn.reactant_matrix).tocsc()
+        S.eliminate_zeros()
+        S.sort_indices()
+        return cls(crn.n_species, crn.n_reactions, *by_species(crn.reactant_matrix),
+                   *by_species(crn.product_matrix), S.indptr, S.indices, S.data)
+
+    def __repr__(self):
+        return (f'Incidence({self.n_species} species, {self.n_reactions} reactions, '
+                f'{len(self.change_idx)} stoichiometry entries)')
+
+    def consumers(self, s):
+        """Reactions with species `s` as a reactant (whose propensity depends on it)."""
+        return self.consumer_idx[self.consumer_ptr[s]:self.consumer_ptr[s + 1]]
+
+    def producers(self, s):
+        """Reactions with species `s` as a product."""
+        return self.producer_idx[self.producer_ptr[s]:self.producer_ptr[s + 1]]
+
+    def touching(self, s):
+        """Reactions with species `s` on either side."""
+        return np.union1d(self.consumers(s), self.producers(s))
+
+    def changes(self, r):
+        """``(species, delta)``: net change of each species when reaction `r` fires."""
+        lo, hi = self.change_ptr[r], self.change_ptr[r + 1]
+        return self.change_idx[lo:hi], self.change_delta[lo:hi]
+
+    @property
+    def stoichiometry(self):
+        """Sparse species x reactions net stoichiometry matrix (CSC)."""
+        return sp.csc_matrix((self.change_delta, self.change_idx, self.change_ptr),
+                             shape=(self.n_species, self.n_reactions))
+
+    @property
+    def dependency(self):
+        """``(ptr, idx)``: reactions whose propensity changes when reaction ``r``
+        fires are ``idx[ptr[r]:ptr[r+1]]``. Built on first use, not saved."""
+        if self._dependency is None:
+            changed = sp.csr_matrix((np.ones(len(self.change_idx), dtype=np.int32),
+                                     self.change_idx, self.change_ptr),
+                                    shape=(self.n_reactions, self.n_species))
+            consumed = sp.csr_matrix((np.ones(len(self.consumer_idx), dtype=np.int32),
+                                      self.consumer_idx, self.consumer_ptr),
+                                     shape=(self.n_species, self.n_reactions))
+            D = (changed @ consumed).tocsr()
+            D.sort_indices()
+            self._dependency = D.indptr.astype(np.int64), D.indices.astype(np.int64)
+        return self._dependency
+
+    def dependents(self, r):
+        """Reactions whose propensity changes when reaction `r` fires."""
+        ptr, idx = self.dependency
+        return idx[ptr[r]:ptr[r + 1]]
+
+
+class CompiledCRN:
+    """Mass-action CRN stored as index arrays.
+
+    Reaction ``r`` consumes ``species[reactant_idx[reactant_ptr[r]:reactant_ptr[r+1]]]``,
+    produces ``species[product_idx[product_ptr[r]:product_ptr[r+1]]]`` and fires
+    with rate constant ``rate_scale[r] * parameter_values[rate_index[r]]``.
+    Repeated indices encode stoichiometric coefficients larger than one.
+    `rate_scale` (default ones) lets lumped reactions use a fixed multiple of
+    a shared parameter.
+    """
+
+    def __init__(self, species, parameters, parameter_values,
+                 reactant_ptr, reactant_idx, product_ptr, product_idx, rate_index,
+                 rate_scale=None):
+        self.species = list(species)
+        self.parameters = list(parameters)
+        self.parameter_values = np.asarray(parameter_values, dtype=float)
+        self.reactant_ptr = np.asarray(reactant_ptr, dtype=np.int64)
+        self.reactant_idx = np.asarray(reactant_idx, dtype=np.int64)
+        self.product_ptr = np.asarray(product_ptr, dtype=np.int64)
+        self.product_idx = np.asarray(product_idx, dtype=np.int64)
+        self.rate_index = np.asarray(rate_index, dtype=np.int64)
+        self.rate_scale = np.ones(len(self.rate_index)) if rate_scale is None else \
+            np.asarray(rate_scale, dtype=float)
+        self.species_index = {s: i for i, s in enumerate(self.species)}
+        self.parameter_index = {p: i for i, p in enumerate(self.parameters)}
+        self._incidence = None
+        self._stoichiometry = None
+        self._digest = None
+
+    def __repr__(self):
+        return (f'CompiledCRN({self.n_reactions} reactions, {self.n_species} species, '
+                f'{len(self.parameters)} parameters)')
+
+    @property
+    def n_species(self):
+        return len(self.species)
+
+    @property
+    def n_reactions(self):
+        return len(self.rate_index)
+
+    @property
+    def k(self):
+        """Per-reaction rate constants."""
+        return self.rates(self.parameter_values)
+
+    def rates(self, parameter_values):
+        """Per-reaction rate constants for a parameter vector (or a
+        ``(conditions, parameters)`` matrix)."""
+        return np.asarray(parameter_values)[..., self.rate_index] * self.rate_scale
+
+    def _matrix(self, ptr, idx):
+        counts = np.diff(ptr)
+        cols = np.repeat(np.arange(self.n_reactions), counts)
+        return sp.csr_matrix((np.ones(len(idx)), (idx, cols)),
+                             shape=(self.n_species, self.n_reactions))
+
+    @property
+    def reactant_matrix(self):
+        """Sparse species x reactions matrix of reactant coefficients."""
+        return self._matrix(self.reactant_ptr, self.reactant_idx)
+
+    @property
+    def product_matrix(self):
+        """Sparse species x reactions matrix of product coefficients."""
+        return self._matrix(self.product_ptr, self.product_idx)
+
+    @property
+    def incidence(self):
+        """The network's `Incidence` indexes, built on first use."""
+        if self._incidence is None:
+            self._incidence = Incidence.from_crn(self)
+        return self._incidence
+
+    @property
+    def stoichiometry(self):
+        """Sparse species x reactions net stoichiometry matrix."""
+        if self._stoichiometry is None:
+            self._stoichiometry = self.incidence.stoichiometry.tocsr()
+        return self._stoichiometry
+
+    def reactions_of(self, name):
+        """Indices of the reactions that consume or produce species `name`."""
+        return self.incidence.touching(self.species_index[name])
+
+    def digest(self):
+        """sha256 of the species, parameters and reaction arrays."""
+        if self._digest is None:
+            h = hashlib.sha256()
+            for names in (self.species, self.parameters):
+                h.update('\n'.join(names).encode() + b'\0')
+            for a in (self.parameter_values, self.reactant_ptr, self.reactant_idx,
+                      self.product_ptr, self.product_idx, self.rate_index):
+                h.update(a.tobytes())
+            #Unscaled networks keep the digests they had before rate_scale
+            if (self.rate_scale != 1).any():
+                h.update(self.rate_scale.tobytes())
+            self._digest = h.hexdigest()
+        return self._digest
+
+    def species_matching(self, pattern):
+        """Species whose names match the regular expression `pattern` (``re.search``)."""
+        regex = re.compile(pattern)
+        return [s for s in self.species if regex.search(s)]
+
+    def reactants(self, r):
+        return [self.species[i] for i in self.reactant_idx[self.reactant_ptr[r]:self.reactant_ptr[r + 1]]]
+
+    def products(self, r):
+        return [self.species[i] for i in self.product_idx[self.product_ptr[r]:self.product_ptr[r + 1]]]
+
+    def reaction(self, r):
+        """Reaction `r` as a ``(reactants, products, parameter)`` tuple of names."""
+        return self.reactants(r), self.products(r), self.parameters[self.rate_index[r]]
+
+    def reactions(self):
+        for r in range(self.n_reactions):
+            yield self.reaction(r)
+
+    def subnetwork(self, reactions, species=None):
+        """Network of the `reactions` (indices or boolean mask) over `species`
+        (indices or mask; default the species they involve), keeping the
+        parameter vector. Reactions and species stay in their original order."""
+        reactions = np.arange(self.n_reactions)[reactions]
+        reactions.sort()
+        if species is None:
+            keep = np.zeros(self.n_reactions, dtype=bool)
+            keep[reactions] = True
+            species = np.zeros(self.n_species, dtype=bool)
+            for ptr, idx in ((self.reactant_ptr, self.reactant_idx),
+                             (self.product_ptr, self.product_idx)):
+                species[idx[np.repeat(keep, np.diff(ptr))]] = True
+        species = np.arange(self.n_species)[species]
+        species.sort()
+        new_index = np.full(self.n_species, -1, dtype=np.int64)
+        new_index[species] = np.arange(len(species))
+
+        def take(ptr, idx):
+            counts = np.diff(ptr)[reactions]
+            entries = np.repeat(ptr[reactions], counts) + \
+                np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            mapped = new_index[idx[entries]]
+            if (mapped < 0).any():
+                missing = sorted({self.species[i] for i in idx[entries][mapped < 0]})
+                raise ValueError(f'Reactions use species outside the subnetwork: {missing}')
+            return np.concatenate([[0], np.cumsum(counts)]), mapped
+
+        return CompiledCRN([self.species[i] for i in species], self.parameters,
+                           self.parameter_values, *take(self.reactant_ptr, self.reactant_idx),
+                           *take(self.product_ptr, self.product_idx),
+                           self.rate_index[reactions], self.rate_scale[reactions])
+
+    def initial_state(self, initial_condition_dict=None):
+        """State vector with `initial_condition_dict` entries, zero elsewhere.
+
+        Names not in the network are ignored, as bioscrape does.
+        """
+        x0 = np.zeros(self.n_species)
+        for name, value in (initial_condition_dict or {}).items():
+            i = self.species_index.get(name)
+            if i is not None:
+                x0[i] = value
+        return x0
+
+    def save(self, file):
+        """Write the network and its `incidence` to `file` (path or binary
+        file) in npz format."""
+        incidence = {'incidence_' + a: getattr(self.incidence, a) for a in Incidence._arrays}
+        np.savez(file, species=np.array(self.species), parameters=np.array(self.parameters),
+                 parameter_values=self.parameter_values,
+                 reactant_ptr=self.reactant_ptr, reactant_idx=self.reactant_idx,
+                 product_ptr=self.product_ptr, product_idx=self.product_idx,
+                 rate_index=self.rate_index, rate_scale=self.rate_scale, **incidence)
+
+    @classmethod
+    def load(cls, file):
+        """Read a network written by `save`.
+
+        Files written before `incidence` was saved rebuild it on first use.
+        """
+        with np.load(file, allow_pickle=False) as data:
+            crn = cls(data['species'].tolist(), data['parameters'].tolist(),
+                      data['parameter_values'], data['reactant_ptr'], data['reactant_idx'],
+                      data['product_ptr'], data['product_idx'], data['rate_index'],
+                      data['rate_scale'] if 'rate_scale' in data.files else None)
+            if 'incidence_change_ptr' in data.files:
+                crn._incidence = Incidence(crn.n_species, crn.n_reactions,
+                                           *(data['incidence_' + a] for a in Incidence._arrays))
+        return crn
+
+    def to_bioscrape_model(self, initial_condition_dict=None):
+        """Build a bioscrape `Model` directly, without an SBML round trip."""
+        from bioscrape.types import Model
+
+        reactions = []
+        for (reactants, products, parameter), scale in zip(self.reactions(), self.rate_scale):
+            if scale == 1:
+                reactions.append((reactants, products, 'massaction', {'k': parameter}))
+            else:
+                rate = '*'.join([repr(float(scale)), parameter] + reactants)
+                reactions.append((reactants, products, 'general', {'rate': rate}))
+        parameters = dict(zip(self.parameters, self.parameter_values.tolist()))
+        initial_con = {s: v for s, v in (initial_condition_dict or {}).items()
+                       if s in self.species_index}
+        return Model(species=self.species, reactions=reactions, parameters=parameters,
+                     initial_condition_dict=initial_con)
+
+
+class CRNBuilder:
+    """Incrementally builds a `CompiledCRN`.
+
+    Species and parameters are interned by name, so the same species used by
+    several sub-networks (e.g. ATP in TX and TL) is stored once.
+    """
+
+    def __init__(self):
+        self.species = []
+        self.species_index = {}
+        self.parameters = []
+        self.parameter_values = []
+        self.parameter_index = {}
+        self._reactant_ptr = [0]
+        self._reactant_idx = []
+        self._product_ptr = [0]
+        self._product_idx = []
+        self._rate_index = []
+        self._rate_scale = []
+
+    @classmethod
+    def from_crn(cls, crn):
+        """Builder holding the species, parameters and reactions of `crn`, to extend it."""
+        builder = cls()
+        builder.species = list(crn.species)
+        builder.species_index = dict(crn.species_index)
+        builder.parameters = list(crn.parameters)
+        builder.parameter_values = crn.parameter_values.tolist()
+        builder.parameter_index = dict(crn.parameter_index)
+        builder._reactant_ptr = crn.reactant_ptr.tolist()
+        builder._reactant_idx = crn.reactant_idx.tolist()
+        builder._product_ptr = crn.product_ptr.tolist()
+        builder._product_idx = crn.product_idx.tolist()
+        builder._rate_index = crn.rate_index.tolist()
+        builder._rate_scale = crn.rate_scale.tolist()
+        return builder
+
+    def add_species(self, *names):
+        """Intern species names, returning the index of the last one."""
+        index = self.species_index
+        i = None
+        for name in names:
+            i = index.get(name)
+            if i is None:
+                i = index[name] = len(self.species)
+                self.species.append(name)
+        return i
+
+    def add_parameter(self, name, value):
+        """Intern a parameter; the first value given for a name is kept."""
+        i = self.parameter_index.get(name)
+        if i is None:
+            i = self.parameter_index[name] = len(self.parameters)
+            self.parameters.append(name)
+            self.parameter_values.append(float(value))
+        return i
+
+    def add_reaction(self, reactants, products, parameter, value=None, scale=1.):
+        """Add a mass-action reaction with rate constant ``scale * parameter``.
+
+        `value` is required the first time a parameter name is used.
+        """
+        k = self.parameter_index.get(parameter)
+        if k is None:
+            if value is None:
+                raise KeyError(f'No value given for parameter {parameter!r}')
+            k = self.add_parameter(parameter, value)
+        add = self.add_species
+        self._reactant_idx.extend(add(s) for s in reactants)
+        self._reactant_ptr.append(len(self._reactant_idx))
+        self._product_idx.extend(add(s) for s in products)
+        self._product_ptr.append(len(self._product_idx))
+        self._rate_index.append(k)
+        self._rate_scale.append(float(scale))
+
+    def compile(self):
+        """`CompiledCRN` of the reactions so far, with its `incidence` built."""
+        crn = CompiledCRN(self.species, self.parameters, self.parameter_values,
+                          self._reactant_ptr, self._reactant_idx,
+                          self._product_ptr, self._product_idx, self._rate_index,
+                          self._rate_scale)
+        crn.incidence
+        return crn
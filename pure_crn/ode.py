@@ -0,0 +1,371 @@
+"""Deterministic simulation of a `CompiledCRN` with an analytic sparse Jacobian.
+
+The TX and TL networks are long elongation chains: each species only reacts
+with its neighbours on the chain plus a few shared pools (NTPs, PPi, tRNAs,
+...). The Jacobian is therefore a band plus a handful of dense rows and
+columns. `MassActionODE` evaluates it analytically into a fixed sparsity
+pattern and hands it to an implicit scipy integrator, whose sparse LU
+(SuperLU with a fill-reducing column ordering) factors this
+band-plus-dense-columns structure with little fill-in. bioscrape's odeint
+path instead builds a dense Jacobian by finite differences.
+
+The default integrator is Radau rather than BDF: the polymerase and ribosome
+recycling loops give eigenvalues close to the imaginary axis, where the
+higher-order BDF formulas are unstable and BDF is held to steps of a few
+hundredths of a second.
+
+With a C compiler, the right-hand side and Jacobian can instead come from
+code generated for the network (`pure_crn.codegen`); see `MassActionODE`.
+
+`simulate`, `simulate_batch` and `Experiment` use the solver settings that
+`pure_crn.tuning` recorded for the network in `SOLVER_CONFIG`, if any,
+unless a method or tolerance is passed explicitly (`tuned_options`).
+"""
+import json
+import os
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.integrate import BDF, DOP853, LSODA, RK23, RK45, Radau
+
+from .codegen import load_kernel
+
+METHODS = {'Radau': Radau, 'BDF': BDF, 'LSODA': LSODA, 'RK45': RK45, 'RK23': RK23,
+           'DOP853': DOP853}
+
+SOLVER_CONFIG = os.environ.get(
+    'PURE_CRN_SOLVER_CONFIG', os.path.join(os.path.expanduser('~'), '.config', 'pure_crn', 'solver.json'))
+
+
+def tuned_options(crn, options=None, path=None):
+    """Solver `options` completed with the `method`, `rtol` and `atol` that
+    `pure_crn.tuning` recorded for `crn` in the JSON config `path` (default
+    `SOLVER_CONFIG`). Options that set any of the three are returned
+    unchanged, as are those of networks without an entry. Entries are keyed
+    on `CompiledCRN.digest`, so they apply only to the network, with the
+    rates, that was tuned."""
+    options = dict(options or {})
+    if any(k in options for k in ('method', 'rtol', 'atol')):
+        return options
+    path = SOLVER_CONFIG if path is None else path
+    try:
+        with open(path) as f:
+            entry = json.load(f).get(crn.digest())
+    except (FileNotFoundError, ValueError):
+        return options
+    return options if entry is None else {**entry['options'], **options}
+
+
+def parameter_vector(crn, parameters=None, values=None):
+    """`values` (default `crn.parameter_values`) with the ``{name: value}``
+    overrides applied, as a new array."""
+    values = np.array(crn.parameter_values if values is None else values, dtype=float)
+    for name, value in (parameters or {}).items():
+        try:
+            values[crn.parameter_index[name]] = value
+        except KeyError:
+            raise KeyError(f'Unknown parameter {name!r}') from None
+    return values
+
+
+def observation(crn, observables=None):
+    """``(names, W)`` for recording `observables` of `crn`.
+
+    `observables` is a list of species names, or a dict mapping an output
+    name to a species name or a list of species whose concentrations are
+    summed (e.g. all ribosome-bound species, see
+    `CompiledCRN.species_matching`). `W` is the sparse ``(outputs, species)``
+    observation matrix; ``None`` observes every species and gives ``W=None``.
+    """
+    if observables is None:
+        return list(crn.species), None
+    if not isinstance(observables, dict):
+        observables = {name: name for name in observables}
+    rows, cols = [], []
+    for row, members in enumerate(observables.values()):
+        for name in [members] if isinstance(members, str) else members:
+            try:
+                cols.append(crn.species_index[name])
+            except KeyError:
+                raise KeyError(f'Unknown species {name!r}') from None
+            rows.append(row)
+    W = sp.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(observables), crn.n_species))
+    return list(observables), W
+
+
+class IntegrationAborted(RuntimeError):
+    """Raised when an `abort` callback stops `MassActionODE.integrate`."""
+
+
+def ode_solver(fun, jac, t0, y0, t_bound, rtol=1e-6, atol=1e-9, method='Radau', **options):
+    """scipy `OdeSolver` of ``y' = fun(t, y)`` with the sparse Jacobian
+    `jac`, densified for LSODA, which only takes dense Jacobians."""
+    if method == 'LSODA':
+        sparse_jac = jac
+        jac = lambda t, y: sparse_jac(t, y).toarray()
+    return METHODS.get(method, method)(fun, t0, y0, t_bound, rtol=rtol, atol=atol, jac=jac, **options)
+
+
+def step_through(solver, timepoints, store, abort=None, stats=None):
+    """Step `solver` from ``timepoints[0]`` past ``timepoints[-1]``.
+
+    ``store(i, j, y)`` receives the dense-output states ``(states, j - i)``
+    at ``timepoints[i:j]`` as soon as the solver has passed them, after
+    which ``abort(j)`` may stop the run with `IntegrationAborted`. A
+    `stats` dict is filled with the step, right-hand-side, Jacobian and LU
+    counts.
+    """
+    i, steps = 1, 0
+    while i < len(timepoints):
+        solver.step()
+        steps += 1
+        if solver.status == 'failed':
+            raise RuntimeError(f'Integration failed at t={solver.t}')
+        j = np.searchsorted(timepoints, solver.t, side='right')
+        if j > i:
+            store(i, j, solver.dense_output()(timepoints[i:j]))
+            i = j
+            if abort is not None and abort(j):
+                raise IntegrationAborted(f'Aborted at t={solver.t}')
+    if stats is not None:
+        stats.update(steps=steps, nfev=solver.nfev, njev=solver.njev, nlu=solver.nlu)
+
+
+class MassActionODE:
+    """Right-hand side and Jacobian of the mass-action ODEs of `crn`.
+
+    Reactant lists are padded to the network's highest reaction order with
+    a sentinel index pointing at a constant 1, so propensities are a single
+    gather and product over a ``(reactions, order)`` index array.
+
+    States may carry a leading batch axis, ``(conditions, species)``, with
+    rate constants ``k`` of shape ``(conditions, reactions)``; the batch is
+    integrated as one block-diagonal system.
+
+    `backend` picks how single-condition `rhs` and `jacobian` calls are
+    evaluated: 'numpy', 'auto' (the compiled `pure_crn.codegen` kernel if one
+    is already cached for this topology, else numpy) or 'compile' (build the
+    kernel on a miss, which takes seconds to a minute once per topology).
+    The ``PURE_CRN_BACKEND`` environment variable overrides it.
+    """
+
+    def __init__(self, crn, parameters=None, backend='auto'):
+        self.crn = crn
+        n, nr = crn.n_species, crn.n_reactions
+        order = np.diff(crn.reactant_ptr)
+        self.order = int(order.max()) if nr else 0
+
+        #Padded reactant indices; index n is the constant 1
+        R = np.full((nr, self.order), n, dtype=np.int64)
+        rows = np.repeat(np.arange(nr), order)
+        slots = np.arange(len(crn.reactant_idx)) - np.repeat(crn.reactant_ptr[:-1], order)
+        R[rows, slots] = crn.reactant_idx
+        self.reactant_slots = R
+
+        #d(propensity)/dx entries: one per (reaction, reactant slot)
+        valid = R < n
+        self._valid = valid
+        da_rxn, da_slot = np.nonzero(valid)
+        da_species = R[da_rxn, da_slot]
+
+        #Jacobian J = S @ dA; J's data is M @ dA's data, with M fixed by the pattern
+        S = crn.stoichiometry.tocsc()
+        counts = np.diff(S.indptr)[da_rxn]
+        entry = np.repeat(np.arange(len(da_rxn)), counts)
+        starts = np.repeat(S.indptr[da_rxn], counts)
+        offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        J_rows = S.indices[starts + offset]
+        J_cols = da_species[entry]
+        #Column-major keys so the unique pattern is already in CSC order
+        keys, position = np.unique(J_cols * n + J_rows, return_inverse=True)
+        self._M = sp.csr_matrix((S.data[starts + offset], (position, entry)),
+                                shape=(len(keys), len(da_rxn)))
+        self._J_indices = (keys % n).astype(np.int32)
+        self._J_indptr = np.searchsorted(keys // n, np.arange(n + 1)).astype(np.int32)
+        self._S = crn.stoichiometry.tocsr()
+        #Reaction -> rate parameter incidence, for derivatives w.r.t. shared parameters
+        self._R = sp.csr_matrix((crn.rate_scale, (np.arange(nr), crn.rate_index)),
+                                shape=(nr, len(crn.parameters)))
+
+        self.k = crn.k.copy()
+        if parameters:
+            self.set_parameters(parameters)
+
+        self.backend = os.environ.get('PURE_CRN_BACKEND', backend)
+        if self.backend not in ('numpy', 'auto', 'compile'):
+            raise ValueError(f'Unknown backend {self.backend!r}')
+        self.kernel = None if self.backend == 'numpy' else \
+            load_kernel(self, compile=self.backend == 'compile')
+
+    @property
+    def n_species(self):
+        return self.crn.n_species
+
+    @property
+    def n_conditions(self):
+        """Batch size implied by `k`: 1 for a single rate vector."""
+        return 1 if self.k.ndim == 1 else len(self.k)
+
+    def set_parameters(self, parameters):
+        """Set rate constants from a ``{parameter name: value}`` dict."""
+        self.k = self.crn.rates(parameter_vector(self.crn, parameters))
+
+    def set_parameter_matrix(self, parameter_matrix):
+        """Set per-condition rate constants from a ``(conditions, parameters)``
+        matrix, columns in `crn.parameters` order."""
+        P = np.asarray(parameter_matrix, dtype=float)
+        if P.shape[-1] != len(self.crn.parameters):
+            raise ValueError(f'Expected {len(self.crn.parameters)} parameter columns, got {P.shape[-1]}')
+        self.k = self.crn.rates(P)
+
+    def _gather(self, x):
+        #Reactant concentrations, (..., reactions, order), with the padding slots at 1
+        x = np.concatenate([x, np.ones(x.shape[:-1] + (1,))], axis=-1)
+        return x[..., self.reactant_slots]
+
+    def propensities(self, x):
+        return self.k * self._gather(x).prod(axis=-1)
+
+    def rhs(self, t, x):
+        if self.kernel is not None and x.ndim == 1 and self.k.ndim == 1 and len(x) == self.n_species:
+            return self.kernel.rhs(self.k, x)
+        X = x.reshape(-1, self.n_species)
+        return (self._S @ self.propensities(X).T).T.reshape(x.shape)
+
+    def parameter_jacobian(self, x):
+        """Sparse ``(species, parameters)`` derivative of `rhs` w.r.t. the
+        network parameters; a parameter shared by many reactions gets one column."""
+        monomials = self._gather(x).prod(axis=-1)
+        return (self._S @ sp.diags(monomials) @ self._R).tocsc()
+
+    def jacobian(self, t, x):
+        """Sparse (CSC) Jacobian of `rhs` at `x`; block diagonal for a batch."""
+        n = self.n_species
+        if self.kernel is not None and x.ndim == 1 and self.k.ndim == 1 and len(x) == n:
+            return sp.csc_matrix((self.kernel.jacobian_data(self.k, x), self._J_indices, self._J_indptr),
+                                 shape=(n, n))
+        X = self._gather(x.reshape(-1, n))
+        k = np.atleast_2d(self.k)
+        #Propensity derivative w.r.t. each slot: k times the other slots' product
+        dA = np.empty_like(X)
+        for s in range(self.order):
+            dA[..., s] = k * np.delete(X, s, axis=-1).prod(axis=-1)
+        data = (self._M @ dA[:, self._valid].T).T
+        nb, nnz = data.shape
+        indices = (self._J_indices + n * np.arange(nb)[:, None]).ravel()
+        indptr = np.append((self._J_indptr[:-1] + nnz * np.arange(nb)[:, None]).ravel(), nb * nnz)
+        return sp.csc_matrix((data.ravel(), indices, indptr), shape=(nb * n, nb * n))
+
+    def solver(self, t0, x0, t_bound, rtol=1e-6, atol=1e-9, method='Radau', **options):
+        """scipy `OdeSolver` for the current rates, to be stepped by the caller."""
+        return ode_solver(self.rhs, self.jacobian, t0, np.asarray(x0, dtype=float).ravel(), t_bound,
+                          rtol, atol, method, **options)
+
+    def integrate(self, timepoints, x0, rtol=1e-6, atol=1e-9, method='Radau', observe=None,
+                  abort=None, stats=None, **options):
+        """Solve from ``timepoints[0]``.
+
+        Returns the ``(len(timepoints), n_species)`` states, or for a
+        ``(conditions, species)`` `x0` a ``(conditions, time, species)`` array.
+        With an ``(outputs, species)`` matrix `observe` (see `observation`)
+        only ``observe @ x`` is recorded, so memory scales with the outputs
+        rather than the network. ``abort(out, j)`` is called whenever the
+        first `j` timepoints of `out` have been filled and raises
+        `IntegrationAborted` if it returns true. A `stats` dict is filled
+        with the solver's step, right-hand-side, Jacobian and LU counts.
+        Extra `options` go to the scipy solver.
+        """
+        timepoints = np.asarray(timepoints, dtype=float)
+        x0 = np.asarray(x0, dtype=float)
+        batch = x0.ndim == 2
+        if batch and self.k.ndim == 2 and len(self.k) != len(x0):
+            raise ValueError(f'{len(self.k)} parameter sets for {len(x0)} initial conditions')
+        if self.k.ndim == 2 and not batch:
+            raise ValueError('Per-condition rate constants need a (conditions, species) x0')
+        nb, n = (len(x0) if batch else 1), self.n_species
+
+        def record(y):
+            #(nb * n, m) states -> (nb, m, outputs)
+            y = y.reshape(nb, n, -1)
+            if observe is not None:
+                y = (observe @ y.transpose(1, 0, 2).reshape(n, -1)).reshape(-1, nb, y.shape[-1])
+                y = y.transpose(1, 0, 2)
+            return y.transpose(0, 2, 1)
+
+        n_out = n if observe is None else observe.shape[0]
+        out = np.empty((nb, len(timepoints), n_out))
+        out[:, 0] = record(x0.reshape(-1, 1))[:, 0]
+
+        def store(i, j, y):
+            out[:, i:j] = record(y)
+
+        solver = self.solver(timepoints[0], x0, timepoints[-1], rtol, atol, method, **options)
+        step_through(solver, timepoints, store,
+                     None if abort is None else lambda j: abort(out if batch else out[0], j), stats)
+        return out if batch else out[0]
+
+
+def simulate(crn, timepoints, initial_condition_dict=None, parameters=None, observables=None,
+             backend='auto', **options):
+    """Deterministic simulation of `crn`, as a bioscrape-style DataFrame.
+
+    Columns are the species (or the `observables`, see `observation`) plus
+    ``'time'``; `parameters` overrides rate constants by name. Solver
+    `options` (`rtol`, `atol`, `method`, ...) go to `MassActionODE.integrate`;
+    `backend` is that of `MassActionODE`. Without a method or tolerances,
+    those of `tuned_options` are used.
+    """
+    options = tuned_options(crn, options)
+    names, W = observation(crn, observables)
+    ode = MassActionODE(crn, parameters, backend)
+    y = ode.integrate(timepoints, crn.initial_state(initial_condition_dict), observe=W, **options)
+    return to_frame(names, timepoints, y)
+
+
+def to_frame(names, timepoints, y):
+    """``(time, outputs)`` array as a bioscrape-style DataFrame."""
+    import pandas as pd
+
+    df = pd.DataFrame(y, columns=names, copy=False)
+    df['time'] = timepoints
+    return df
+
+
+def simulate_batch(crn, timepoints, parameter_matrix=None, initial_matrix=None, observables=None,
+                   **options):
+    """Integrate many conditions of `crn` together.
+
+    `parameter_matrix` is ``(conditions, parameters)`` in `crn.parameters`
+    order and `initial_matrix` ``(conditions, species)`` in `crn.species`
+    order; either may be omitted (network values, zero state) or be a single
+    row shared by all conditions. Returns a ``(conditions, time, species)``
+    array, or ``(conditions, time, outputs)`` for `observables` (see
+    `observation`). The conditions share the integrator's step size, so batch
+    conditions with similar dynamics; `parameter_rows` and `initial_rows`
+    build the matrices from dicts. Without a method or tolerances, those of
+    `tuned_options` are used.
+    """
+    options = tuned_options(crn, options)
+    n_params, n = len(crn.parameters), crn.n_species
+    P = np.atleast_2d(crn.parameter_values if parameter_matrix is None else parameter_matrix)
+    X0 = np.atleast_2d(np.zeros(n) if initial_matrix is None else initial_matrix)
+    if P.shape[1] != n_params or X0.shape[1] != n:
+        raise ValueError(f'Expected (N, {n_params}) parameters and (N, {n}) initial conditions, '
+                         f'got {P.shape} and {X0.shape}')
+    N = max(len(P), len(X0))
+    if len(P) not in (1, N) or len(X0) not in (1, N):
+        raise ValueError(f'{len(P)} parameter sets for {len(X0)} initial conditions')
+    ode = MassActionODE(crn)
+    ode.set_parameter_matrix(np.broadcast_to(P, (N, n_params)))
+    W = observation(crn, observables)[1]
+    return ode.integrate(timepoints, np.broadcast_to(X0, (N, n)), observe=W, **options)
+
+
+def parameter_rows(crn, conditions):
+    """``(conditions, parameters)`` matrix from a list of ``{name: value}`` overrides."""
+    return np.array([parameter_vector(crn, c) for c in conditions])
+
+
+def initial_rows(crn, conditions):
+    """``(conditions, species)`` matrix from a list of initial-condition dicts."""
+    return np.array([crn.initial_state(c) for c in conditions])
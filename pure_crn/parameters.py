@@ -0,0 +1,52 @@
+"""Rate constants and initial conditions for the PURE models."""
+import csv
+import os
+
+#Repo data files
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(REPO_DIR, 'Data_files')
+RATE_CONSTANTS_FILE = os.path.join(DATA_DIR, 'fMGG_synthesis_parameters_CRN.csv')
+INITIAL_VALUES_FILE = os.path.join(DATA_DIR, 'PURE_TXTL_initial_values_Final.csv')
+
+#TX parameter names, in the order they appear in the TX reactions
+TX_PARAMETER_NAMES = ('k_rnapbF1', 'k_rnapbF2', 'k_rnapbF3', 'k_start',
+                      'k_ntpbound', 'k_ntpadd', 'k_ntpdis', 'k_term')
+
+#TX parameters from the MGapt-TXonly fit (Models/CRN_PURE_MGaptTXonly.ipynb)
+TX_PARAMETERS_TXONLY = {
+    'k_rnapbF1': 6.1, 'k_rnapbF2': 2.93, 'k_rnapbF3': 7.82, 'k_start': 5.23,
+    'k_ntpbound': 1.47, 'k_ntpadd': 23.59, 'k_ntpdis': 948.25, 'k_term': 32.38}
+
+#Final parameters based on MGapt-TXonly fine tuning with B4 data (TXwTL models)
+TX_PARAMETERS = {
+    'k_rnapbF1': 9.406062, 'k_rnapbF2': 5.080765, 'k_rnapbF3': 10.656306,
+    'k_start': 7.463710, 'k_ntpbound': 2.676172, 'k_ntpadd': 100.066259,
+    'k_ntpdis': 1306.617911, 'k_term': 45.998466}
+
+#IC for Transcription only reactions (uM)
+TX_INITIAL_CONDITIONS = {'T7RNAP': 1, 'DNA': .005, 'ATP': 3750, 'GTP': 2500,
+                         'CTP': 1250, 'UTP': 1250, 'mRNA_i': 0}
+
+#Protein folding (bionumbers) and mRNA linker to account for mean ribosome load
+K_FOLD = .001667
+K_LINKER = 1000
+
+
+def read_name_value_csv(filename):
+    """Read a headerless ``name,value`` csv into a dict of floats."""
+    with open(filename, mode='r') as infile:
+        reader = csv.reader(infile)
+        return {rows[0]: float(rows[1]) for rows in reader if rows}
+
+
+def load_rate_constants(filename=RATE_CONSTANTS_FILE):
+    """TL rate constants keyed by reaction id (e.g. ``re0000000001_k1``)."""
+    return read_name_value_csv(filename)
+
+
+def load_initial_conditions(filename=INITIAL_VALUES_FILE, dna=None):
+    """TXTL initial conditions in uM, optionally overriding the DNA level."""
+    initial_con = read_name_value_csv(filename)
+    if dna is not None:
+        initial_con['DNA'] = dna
+    return initial_con
@@ -0,0 +1,73 @@
+"""Reachability pruning of compiled networks.
+
+The TL builder emits the synthetase, EF-Tu and recycling blocks of every
+amino acid it is given. When a block's amino acid, synthetase or tRNA is
+absent from the initial conditions (e.g. the fMGG TL-only runs), its
+species stay at zero and its reactions never fire, but the integrator
+still carries them.
+
+`reachable` finds the species that can ever become nonzero. These are the
+species that start nonzero, plus the products of reactions whose reactants
+can all become nonzero, iterated to a fixed point. `prune` keeps those
+species and the reactions that can fire. A dropped reaction has a reactant
+that is zero at all times, so its propensity is zero, and the remaining
+species follow exactly the same trajectories. Parameters are kept, so
+names and parameter vectors stay interchangeable with the full network.
+"""
+import numpy as np
+
+
+class PruneReport:
+    """What `prune` removed: the `removed_species` names, the original
+    indices of the `removed_reactions`, and the original indices of the
+    kept `species` and `reactions`."""
+
+    def __init__(self, crn, species, reactions):
+        self.species = species
+        self.reactions = reactions
+        self.n_species, self.n_reactions = crn.n_species, crn.n_reactions
+        kept = np.zeros(crn.n_species, dtype=bool)
+        kept[species] = True
+        self.removed_species = [s for s, k in zip(crn.species, kept) if not k]
+        self.removed_reactions = np.setdiff1d(np.arange(crn.n_reactions), reactions)
+
+    def __repr__(self):
+        return (f'PruneReport(removed {len(self.removed_species)} of {self.n_species} species, '
+                f'{len(self.removed_reactions)} of {self.n_reactions} reactions)')
+
+
+def reachable(crn, initial_condition_dict=None, x0=None):
+    """``(species, reactions)`` boolean masks of the species that can become
+    nonzero from the initial state, and of the reactions that can fire."""
+    x0 = crn.initial_state(initial_condition_dict) if x0 is None else np.asarray(x0)
+    incidence = crn.incidence
+    present = x0 > 0
+    #Distinct reactant species of each reaction not yet present
+    consumer_species = np.repeat(np.arange(crn.n_species), np.diff(incidence.consumer_ptr))
+    missing = np.bincount(incidence.consumer_idx[~present[consumer_species]],
+                          minlength=crn.n_reactions)
+    fired = np.zeros(crn.n_reactions, dtype=bool)
+    product_rxn = np.repeat(np.arange(crn.n_reactions), np.diff(crn.product_ptr))
+    new = missing == 0
+    #Breadth-first over reaction layers: fire the newly enabled reactions, add their products
+    while new.any():
+        fired |= new
+        produced = np.unique(crn.product_idx[new[product_rxn]])
+        produced = produced[~present[produced]]
+        present[produced] = True
+        starts, ends = incidence.consumer_ptr[produced], incidence.consumer_ptr[produced + 1]
+        counts = ends - starts
+        entries = np.repeat(starts, counts) + np.arange(counts.sum()) - \
+            np.repeat(np.cumsum(counts) - counts, counts)
+        np.subtract.at(missing, incidence.consumer_idx[entries], 1)
+        new = (missing == 0) & ~fired
+    return present, fired
+
+
+def prune(crn, initial_condition_dict=None, x0=None):
+    """``(pruned_crn, report)``: `crn` without the species that stay zero
+    from the initial state and the reactions that never fire; see
+    `PruneReport`."""
+    species, reactions = reachable(crn, initial_condition_dict, x0)
+    species, reactions = np.flatnonzero(species), np.flatnonzero(reactions)
+    return crn.subnetwork(reactions, species), PruneReport(crn, species, reactions)
@@ -0,0 +1,138 @@
+"""Columnar on-disk store for simulation trajectories.
+
+A results directory holds ``meta.json`` (species order, chunking, dtype and
+free-form metadata such as the model digest, parameters and tolerances),
+``time.npy`` and the trajectories in chunks of `chunk_species` species.
+Each chunk is a ``(species, time)`` array, so one species' trajectory is
+contiguous on disk: uncompressed chunks (``.npy``) are memory-mapped and
+reading ``results['MGapt']`` touches only that column. Compressed chunks
+(``.npz``) trade this for smaller files and are decompressed per chunk.
+
+`from_csv` and `Results.to_csv` convert from and to the
+``DataFrame.to_csv`` layout of the notebooks (index column, species, `time`).
+"""
+import json
+import os
+
+import numpy as np
+
+FORMAT_VERSION = 1
+
+
+def simulation_metadata(crn, parameter_values=None, **options):
+    """Metadata of a `crn` run: network digest, parameters and solver options."""
+    values = crn.parameter_values if parameter_values is None else parameter_values
+    return {'model_digest': crn.digest(),
+            'parameters': dict(zip(crn.parameters, np.asarray(values, dtype=float).tolist())),
+            'options': options}
+
+
+def write_results(path, times, states, species, metadata=None, dtype=np.float64,
+                  chunk_species=256, compress=False):
+    """Write ``(time, species)`` `states` to the results directory `path`.
+
+    `dtype` may be float32 to halve the size. Returns a `Results` reader.
+    """
+    states = np.asarray(states)
+    times = np.asarray(times, dtype=float)
+    species = list(species)
+    if states.shape != (len(times), len(species)):
+        raise ValueError(f'states have shape {states.shape}, expected {(len(times), len(species))}')
+    os.makedirs(path, exist_ok=True)
+    dtype = np.dtype(dtype)
+    ext = '.npz' if compress else '.npy'
+    np.save(os.path.join(path, 'time.npy'), times)
+    for c, start in enumerate(range(0, len(species), chunk_species)):
+        block = np.ascontiguousarray(states[:, start:start + chunk_species].T, dtype=dtype)
+        filename = os.path.join(path, f'chunk_{c:04d}{ext}')
+        if compress:
+            np.savez_compressed(filename, data=block)
+        else:
+            np.save(filename, block)
+    meta = {'format': FORMAT_VERSION, 'species': species, 'dtype': dtype.str,
+            'chunk_species': chunk_species, 'compressed': bool(compress),
+            'metadata': metadata or {}}
+    #meta.json last: a directory without it is an incomplete write
+    with open(os.path.join(path, 'meta.json'), 'w') as f:
+        json.dump(meta, f, indent=1)
+    return Results(path)
+
+
+class Results:
+    """Reader for a results directory written by `write_results`."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, 'meta.json')) as f:
+            meta = json.load(f)
+        if meta.get('format') != FORMAT_VERSION:
+            raise ValueError(f'Unsupported results format {meta.get("format")!r} in {path}')
+        self.species = meta['species']
+        self.species_index = {s: i for i, s in enumerate(self.species)}
+        self.dtype = np.dtype(meta['dtype'])
+        self.chunk_species = meta['chunk_species']
+        self.compressed = meta['compressed']
+        self.metadata = meta['metadata']
+        self.times = np.load(os.path.join(path, 'time.npy'))
+        self._chunks = {}
+
+    def __repr__(self):
+        return f'Results({self.path!r}, {len(self.times)} times, {len(self.species)} species)'
+
+    def __len__(self):
+        return len(self.times)
+
+    def __contains__(self, name):
+        return name in self.species_index
+
+    def _chunk(self, c):
+        chunk = self._chunks.get(c)
+        if chunk is None:
+            if self.compressed:
+                with np.load(os.path.join(self.path, f'chunk_{c:04d}.npz')) as data:
+                    chunk = data['data']
+            else:
+                chunk = np.load(os.path.join(self.path, f'chunk_{c:04d}.npy'), mmap_mode='r')
+            self._chunks[c] = chunk
+        return chunk
+
+    def __getitem__(self, name):
+        """Trajectory of species `name` (a memory-mapped view when uncompressed)."""
+        if name == 'time':
+            return self.times
+        try:
+            i = self.species_index[name]
+        except KeyError:
+            raise KeyError(f'Unknown species {name!r}') from None
+        return self._chunk(i // self.chunk_species)[i % self.chunk_species]
+
+    def array(self, species=None):
+        """``(time, species)`` array of `species` (default all), in that order."""
+        species = self.species if species is None else list(species)
+        out = np.empty((len(self.times), len(species)), dtype=self.dtype)
+        for j, name in enumerate(species):
+            out[:, j] = self[name]
+        return out
+
+    def read(self, species=None):
+        """`species` (default all) as a bioscrape-style DataFrame with a `time` column."""
+        import pandas as pd
+
+        species = self.species if species is None else list(species)
+        df = pd.DataFrame(self.array(species), columns=species)
+        df['time'] = self.times
+        return df
+
+    def to_csv(self, filename, species=None):
+        """Write in the notebooks' ``DataFrame.to_csv`` layout."""
+        self.read(species).to_csv(filename)
+
+
+def from_csv(filename, path, metadata=None, **options):
+    """Convert a notebook trajectory csv (index, species..., `time`) to a
+    results directory; `options` as `write_results`."""
+    import pandas as pd
+
+    df = pd.read_csv(filename, index_col=0, float_precision='round_trip')
+    times = df.pop('time').to_numpy()
+    return write_results(path, times, df.to_numpy(), df.columns, metadata, **options)
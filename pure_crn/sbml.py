@@ -0,0 +1,164 @@
+"""SBML export of compiled networks and post-processing of BioCRNpyler SBML.
+
+libsbml is only needed here and is imported lazily.
+"""
+import csv
+import warnings
+from collections import Counter
+
+
+def write_sbml(crn, filename, initial_condition_dict=None, model_id='PURE_CRN'):
+    """Write `crn` as an SBML level 3 model with global rate parameters.
+
+    Kinetic laws are mass action, ``k * reactant_1 * ... * reactant_n``, with
+    `k` the network parameter names (times the reaction's `rate_scale` where
+    it is not 1), so the file loads in bioscrape with
+    ``Model(sbml_filename=filename)``.
+    """
+    import libsbml
+
+    x0 = crn.initial_state(initial_condition_dict)
+    doc = libsbml.SBMLDocument(3, 2)
+    model = doc.createModel()
+    model.setId(model_id)
+    comp = model.createCompartment()
+    comp.setId('default')
+    comp.setSize(1)
+    comp.setSpatialDimensions(3)
+    comp.setConstant(True)
+
+    for name, value in zip(crn.species, x0):
+        s = model.createSpecies()
+        s.setId(name)
+        s.setCompartment('default')
+        s.setInitialConcentration(float(value))
+        s.setHasOnlySubstanceUnits(False)
+        s.setBoundaryCondition(False)
+        s.setConstant(False)
+
+    for name, value in zip(crn.parameters, crn.parameter_values):
+        p = model.createParameter()
+        p.setId(name)
+        p.setValue(float(value))
+        p.setConstant(True)
+
+    for r, ((reactants, products, k), scale) in enumerate(zip(crn.reactions(), crn.rate_scale)):
+        rxn = model.createReaction()
+        rxn.setId(f'r{r}')
+        rxn.setReversible(False)
+        for name, n in Counter(reactants).items():
+            ref = rxn.createReactant()
+            ref.setSpecies(name)
+            ref.setStoichiometry(n)
+            ref.setConstant(True)
+        for name, n in Counter(products).items():
+            ref = rxn.createProduct()
+            ref.setSpecies(name)
+            ref.setStoichiometry(n)
+            ref.setConstant(True)
+        law = rxn.createKineticLaw()
+        factors = [k] + reactants if scale == 1 else [repr(float(scale)), k] + reactants
+        law.setMath(libsbml.parseL3Formula(' * '.join(factors)))
+
+    if not libsbml.writeSBMLToFile(doc, filename):
+        raise IOError(f'Could not write SBML file {filename}')
+    return filename
+
+
+def globalize_parameters(filename, out_filename=None, key='value', map_filename=None):
+    """Replace the local kinetic-law parameters of an SBML file by globals.
+
+    Single pass over the reactions with dict lookups; parameter references
+    are renamed on the kinetic-law AST rather than by string replacement.
+
+    `key` decides which local parameters share a global one:
+    ``'value'`` ties parameters with the same value, named ``k_forward``,
+    ``k_forward1``, ... in order of first appearance (the naming of
+    `update_model_local_to_global_params`, used by the inference priors);
+    ``'reaction'`` gives every local parameter its own ``<reaction>_<id>``.
+    With ``'value'``, a warning lists local parameters with different ids
+    that were merged because their values coincide.
+
+    The identity map (reaction, local id, value, global id) is written as csv
+    to `map_filename`, by default next to `out_filename`, and returned.
+    """
+    import libsbml
+
+    if key not in ('value', 'reaction'):
+        raise ValueError(f"key must be 'value' or 'reaction', not {key!r}")
+    if out_filename is None:
+        out_filename = filename.split('.xml')[0] + '_updated.xml'
+    if map_filename is None:
+        map_filename = out_filename.split('.xml')[0] + '_parameters.csv'
+
+    doc = libsbml.readSBMLFromFile(filename)
+    if doc.getNumErrors(libsbml.LIBSBML_SEV_FATAL):
+        raise IOError(f'Could not read SBML file {filename}')
+    model = doc.getModel()
+    taken = {model.getParameter(i).getId() for i in range(model.getNumParameters())}
+    global_ids = {}
+    first_ids = {}
+    merged = []
+    identity = []
+
+    for rxn in model.getListOfReactions():
+        kl = rxn.getKineticLaw()
+        if kl is None or not kl.getNumLocalParameters():
+            continue
+        math = kl.getMath().deepCopy()
+        locals_ = kl.getListOfLocalParameters()
+        renames = []
+        for i in range(locals_.size()):
+            param = locals_.get(i)
+            pid, value = param.getId(), param.getValue()
+            group = value if key == 'value' else (rxn.getId(), pid)
+            gid = global_ids.get(group)
+            if gid is None:
+                gid = pid + (str(len(global_ids)) if global_ids else '') if key == 'value' \
+                    else f'{rxn.getId()}_{pid}'
+                while gid in taken:
+                    gid += '_'
+                taken.add(gid)
+                global_ids[group] = gid
+                p = model.createParameter()
+                p.setId(gid)
+                p.setValue(value)
+                #Kept non-constant, as in the original script, so bioscrape can update it
+                p.setConstant(False)
+                first_ids[gid] = pid
+            elif first_ids[gid] != pid:
+                merged.append(f'{rxn.getId()}:{pid} -> {gid}')
+            if gid != pid:
+                renames.append((pid, gid))
+            identity.append((rxn.getId(), pid, value, gid))
+        #Rename through unique temporaries, so one rename never catches another's target
+        local_ids = {locals_.get(i).getId() for i in range(locals_.size())}
+        temporaries = []
+        for pid, gid in renames:
+            tmp = f'_local_{len(temporaries)}'
+            while tmp in taken or tmp in local_ids:
+                tmp += '_'
+            math.renameSIdRefs(pid, tmp)
+            temporaries.append((tmp, gid))
+        for tmp, gid in temporaries:
+            math.renameSIdRefs(tmp, gid)
+        kl.setMath(math)
+        while kl.getNumLocalParameters():
+            kl.removeLocalParameter(kl.getLocalParameter(0).getId())
+    if merged:
+        warnings.warn(f"{len(merged)} local parameters were merged by value into a global one of a "
+                      f"different local id ({', '.join(merged[:5])}{', ...' if len(merged) > 5 else ''}); "
+                      f"use key='reaction' to keep them apart", stacklevel=2)
+
+    if not libsbml.writeSBMLToFile(doc, out_filename):
+        raise IOError(f'Could not write SBML file {out_filename}')
+    with open(map_filename, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['reaction', 'local_id', 'value', 'global_id'])
+        writer.writerows(identity)
+    return identity
+
+
+def update_model_local_to_global_params(filename):
+    """Drop-in for the notebook function; writes ``<filename>_updated.xml``."""
+    globalize_parameters(filename, key='value')
@@ -0,0 +1,116 @@
+"""Sequence helpers for building the PURE TX/TL networks.
+
+Mirrors the helper cells of the model notebooks: `getTranscript`, `translate`
+and `coding_protein`, plus the amino acid/tRNA reference lists used to name the
+translation species.
+"""
+
+#DNA constructs used in the repo (5'->3', from the T7 promoter)
+MGAPT_DNA = ('GGATCCCGACTGGCGAGAGCCAGGTAACGAATGGATCTCGAGCCTTAGGAGATCCGGCTGCTAACAAAG'
+             'CCCGAAAGGAAGCTGAGTTGGCTGCTGCCACCGCTGAGCAATAA')
+
+MGAPT_DEGFP_DNA = (
+    'GAGACCACAACGGTTTCCCTCTAGAGGGATCCCGACTGGCGAGAGCCAGGTAACGAATGGATCCAATAATTTTGTTTAA'
+    'CTTTAAGAAGGAGATATACCATGGAGCTTTTCACTGGCGTTGTTCCCATCCTGGTCGAGCTGGACGGCGACGTAAACGG'
+    'CCACAAGTTCAGCGTGTCCGGCGAGGGCGAGGGCGATGCCACCTACGGCAAGCTGACCCTGAAGTTCATCTGCACCACCG'
+    'GCAAGCTGCCCGTGCCCTGGCCCACCCTCGTGACCACCCTGACCTACGGCGTGCAGTGCTTCAGCCGCTACCCCGACCAC'
+    'ATGAAGCAGCACGACTTCTTCAAGTCCGCCATGCCCGAAGGCTACGTCCAGGAGCGCACCATCTTCTTCAAGGACGACGG'
+    'CAACTACAAGACCCGCGCCGAGGTGAAGTTCGAGGGCGACACCCTGGTGAACCGCATCGAGCTGAAGGGCATCGACTTCA'
+    'AGGAGGACGGCAACATCCTGGGGCACAAGCTGGAGTACAACTACAACAGCCACAACGTCTATATCATGGCCGACAAGCAG'
+    'AAGAACGGCATCAAGGTGAACTTCAAGATCCGCCACAACATCGAGGACGGCAGCGTGCAGCTCGCCGACCACTACCAGCA'
+    'GAACACCCCCATCGGCGACGGCCCCGTGCTGCTGCCCGACAACCACTACCTGAGCACCCAGTCCGCCCTGAGCAAAGACC'
+    'CCAACGAGAAGCGCGATCACATGGTCCTGCTGGAGTTCGTGACCGCCGCCGGGATCTAACTCGAGCCTTAGGAGATCCGG'
+    'CTGCTAACAAAGCCCGAAAGGAAGCTGAGTTG')
+
+#Malachite green aptamer; MGapt is released once the transcript extends past it
+MGAPT_MOTIF = 'GGATCCCGACTGGCGAGAGCCAGGTAACGAATGGATC'
+
+#Nucleotide -> NTP consumed by T7RNAP
+NTP = {'A': 'ATP', 'T': 'UTP', 'G': 'GTP', 'C': 'CTP'}
+
+#Reference lists for aa and respective tRNA codon label
+LIST_AA = ['Ala', 'Arg', 'Asn', 'Asp', 'Cys',
+           'Gln', 'Glu', 'Gly', 'His', 'Ile',
+           'Leu', 'Lys', 'Met', 'Phe', 'Pro',
+           'Ser', 'Thr', 'Trp', 'Tyr', 'Val']
+LIST_CODON = ['AGU', 'CCG', 'AUU', 'AUC', 'ACA',
+              'UUG', 'UUC', 'GCC', 'AUG', 'AAU',
+              'CAG', 'CUU', 'CAU', 'GAA', 'AGG',
+              'GCU', 'AGU', 'CCA', 'AUA', 'CAC']
+TRNA_CODON = dict(zip(LIST_AA, LIST_CODON))
+
+#One letter amino acid codes, for writing short peptides as strings
+ONE_LETTER = {'A': 'Ala', 'R': 'Arg', 'N': 'Asn', 'D': 'Asp', 'C': 'Cys',
+              'Q': 'Gln', 'E': 'Glu', 'G': 'Gly', 'H': 'His', 'I': 'Ile',
+              'L': 'Leu', 'K': 'Lys', 'M': 'Met', 'F': 'Phe', 'P': 'Pro',
+              'S': 'Ser', 'T': 'Thr', 'W': 'Trp', 'Y': 'Tyr', 'V': 'Val'}
+
+#DNA code chart for coding domain
+CODON_TABLE = {
+    'ATA': 'Ile', 'ATC': 'Ile', 'ATT': 'Ile', 'ATG': 'Met',
+    'ACA': 'Thr', 'ACC': 'Thr', 'ACG': 'Thr', 'ACT': 'Thr',
+    'AAC': 'Asn', 'AAT': 'Asn', 'AAA': 'Lys', 'AAG': 'Lys',
+    'AGC': 'Ser', 'AGT': 'Ser', 'AGA': 'Arg', 'AGG': 'Arg',
+    'CTA': 'Leu', 'CTC': 'Leu', 'CTG': 'Leu', 'CTT': 'Leu',
+    'CCA': 'Pro', 'CCC': 'Pro', 'CCG': 'Pro', 'CCT': 'Pro',
+    'CAC': 'His', 'CAT': 'His', 'CAA': 'Gln', 'CAG': 'Gln',
+    'CGA': 'Arg', 'CGC': 'Arg', 'CGG': 'Arg', 'CGT': 'Arg',
+    'GTA': 'Val', 'GTC': 'Val', 'GTG': 'Val', 'GTT': 'Val',
+    'GCA': 'Ala', 'GCC': 'Ala', 'GCG': 'Ala', 'GCT': 'Ala',
+    'GAC': 'Asp', 'GAT': 'Asp', 'GAA': 'Glu', 'GAG': 'Glu',
+    'GGA': 'Gly', 'GGC': 'Gly', 'GGG': 'Gly', 'GGT': 'Gly',
+    'TCA': 'Ser', 'TCC': 'Ser', 'TCG': 'Ser', 'TCT': 'Ser',
+    'TTC': 'Phe', 'TTT': 'Phe', 'TTA': 'Leu', 'TTG': 'Leu',
+    'TAC': 'Tyr', 'TAT': 'Tyr', 'TAA': '_', 'TAG': '_',
+    'TGC': 'Cys', 'TGT': 'Cys', 'TGA': '_', 'TGG': 'Trp'}
+
+
+def get_transcript(dna):
+    """Return the NTP consumed for each nucleotide of `dna`."""
+    try:
+        return [NTP[bp] for bp in dna]
+    except KeyError as err:
+        raise ValueError(f'Non-standard nucleotide {err.args[0]!r}') from None
+
+
+def translate(seq):
+    """Translate an in-frame DNA sequence up to the first stop codon."""
+    protein = []
+    if len(seq) % 3 == 0:
+        for i in range(0, len(seq), 3):
+            aa = CODON_TABLE[seq[i:i + 3]]
+            if aa == '_':
+                break
+            protein.append(aa)
+    return protein
+
+
+def coding_protein(dna, start=0):
+    """Return the protein of the first complete ORF (ATG...stop) in `dna`."""
+    for bp in range(start, len(dna) - 2):
+        if dna[bp:bp + 3] == 'ATG':
+            cds = dna[bp:len(dna) - (len(dna) - bp) % 3]
+            protein = translate(cds)
+            #Only accept frames that reach a stop codon
+            if len(protein) < len(cds) // 3:
+                return protein
+    raise ValueError('No start codon found')
+
+
+def as_protein(protein):
+    """Normalise a protein given as one-letter string or three-letter list."""
+    if isinstance(protein, str):
+        return [ONE_LETTER[aa] for aa in protein.upper()]
+    return list(protein)
+
+
+def reporter_position(dna, motif=MGAPT_MOTIF):
+    """Transcript position at which the reporter aptamer is released.
+
+    Matches the hard-coded `L==38` (MGapt) and `L==64` (MGapt-deGFP) of the
+    notebooks; returns None if `motif` is not in `dna`.
+    """
+    i = dna.find(motif)
+    if i < 0:
+        return None
+    return i + len(motif) + 1
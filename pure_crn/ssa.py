@@ -0,0 +1,363 @@
+"""Stochastic simulation of `CompiledCRN` networks in small volumes.
+
+Concentrations (uM) become copy numbers with ``omega = N_A * volume * 1e-6``
+molecules per uM; at 5 nM a 1 fL compartment holds three DNA copies. A
+rate constant `k` of a reaction of order `n` gives the stochastic constant
+``k / omega**(n - 1)``, and propensities use falling factorials for repeated
+reactants.
+
+`StochasticSimulator.run` has two methods:
+
+- ``'exact'``: Gillespie's direct method. After each event only the
+  propensities of the reactions whose reactants it changed are recomputed
+  (the dependency graph).
+- ``'tau'``: adaptive tau-leaping (Cao, Gillespie & Petzold 2006). The
+  leap keeps the relative change of the reactants of non-critical
+  reactions below `eps`. Critical reactions, those fewer than
+  `n_critical` firings away from exhausting a reactant, fire at most once
+  per leap, so copy numbers never go negative. A leap expected to hold
+  fewer than about ten firings, because it is shorter than ten exact steps
+  or the next critical firing cuts it short, is replaced by a burst of
+  exact steps. Leaping pays off for abundant pools (the fast binding
+  equilibria of the TL networks in 10 fL take over 200 firings per leap);
+  elongation chains, where every step involves a low-copy polymerase
+  state, run as exact bursts.
+
+`ssa_ensemble` runs trajectories in a process pool. It merges per-chunk
+`EnsembleSummary` statistics, so memory does not grow with the number of
+trajectories: mean and variance per timepoint, and quantiles from a uniform
+reservoir sample of bounded size.
+"""
+import multiprocessing
+
+import numpy as np
+
+from .inference import default_processes
+from .ode import observation, parameter_vector, to_frame
+
+AVOGADRO = 6.02214076e23
+
+#Per-process simulator, set by _init_worker
+_worker = None
+
+
+class StochasticSimulator:
+    """Copy-number simulation of `crn` in a compartment of `volume` litres."""
+
+    def __init__(self, crn, volume, parameters=None):
+        self.crn = crn
+        self.volume = volume
+        self.omega = AVOGADRO * volume * 1e-6
+        n, nr = crn.n_species, crn.n_reactions
+        order = np.diff(crn.reactant_ptr)
+        width = int(order.max()) if nr else 0
+
+        #Padded reactant slots (index n is a constant 1) and falling-factorial offsets
+        R = np.full((nr, width), n, dtype=np.int64)
+        rows = np.repeat(np.arange(nr), order)
+        slots = np.arange(len(crn.reactant_idx)) - np.repeat(crn.reactant_ptr[:-1], order)
+        R[rows, slots] = crn.reactant_idx
+        offset = np.zeros((nr, width))
+        for j in range(1, width):
+            offset[:, j] = (R[:, :j] == R[:, j:j + 1]).sum(axis=1)
+        offset[R == n] = 0
+        self._slots, self._offset = R, offset
+        self._order = order
+
+        incidence = crn.incidence
+        S = incidence.stoichiometry
+        self._S = crn.stoichiometry
+        self._S2 = self._S.multiply(self._S).tocsr()
+        self._changed_ptr = incidence.change_ptr
+        self._changed_idx, self._changed_delta = incidence.change_idx, incidence.change_delta
+        #Reactions whose propensity changes when reaction r fires
+        self._dep_ptr, self._dep_idx = incidence.dependency
+
+        #Net consumption, for the critical-reaction test
+        consumed = (-S).tocoo()
+        keep = consumed.data > 0
+        self._cons_species, self._cons_rxn = consumed.row[keep], consumed.col[keep]
+        self._cons_amount = consumed.data[keep]
+
+        #Highest reaction order and multiplicity per reactant species, for the tau bound
+        pairs, mult = np.unique(np.stack([crn.reactant_idx, rows]), axis=1, return_counts=True)
+        species, rank = pairs[0], order[pairs[1]] * (width + 1) + mult
+        best = np.zeros(n, dtype=np.int64)
+        np.maximum.at(best, species, rank)
+        self._reactant_species = np.flatnonzero(best)
+        self._hor, self._mult = np.divmod(best[self._reactant_species], width + 1)
+
+        self._x = np.ones(n + 1)
+        self.set_parameters(parameters)
+
+    def __repr__(self):
+        return (f'StochasticSimulator({self.crn.n_reactions} reactions, '
+                f'volume={self.volume:g} L, omega={self.omega:.4g} per uM)')
+
+    def set_parameters(self, parameters=None):
+        """Set rate constants from a ``{name: value}`` dict (network values otherwise)."""
+        k = self.crn.rates(parameter_vector(self.crn, parameters))
+        self.c = k * self.omega ** (1. - self._order)
+
+    def to_counts(self, initial_condition_dict):
+        """Copy numbers of an initial-condition dict, rounded to integers."""
+        return np.round(self.crn.initial_state(initial_condition_dict) * self.omega)
+
+    def propensities(self, x, reactions=None):
+        """Propensities at copy numbers `x` (of `reactions`, default all)."""
+        self._x[:-1] = x
+        slots, offset, c = self._slots, self._offset, self.c
+        if reactions is not None:
+            slots, offset, c = slots[reactions], offset[reactions], c[reactions]
+        return c * np.maximum(self._x[slots] - offset, 0).prod(axis=1)
+
+    def _fire(self, x, a, r):
+        lo, hi = self._changed_ptr[r], self._changed_ptr[r + 1]
+        x[self._changed_idx[lo:hi]] += self._changed_delta[lo:hi]
+        deps = self._dep_idx[self._dep_ptr[r]:self._dep_ptr[r + 1]]
+        a[deps] = self.propensities(x, deps)
+
+    def _ssa(self, x, t, timepoints, k_out, out, rng, max_steps, stats):
+        #Exact direct-method steps; returns (t, k_out)
+        a = self.propensities(x)
+        for _ in range(max_steps):
+            stats['exact'] += 1
+            cumulative = np.cumsum(a)
+            a0 = cumulative[-1]
+            t_next = t + rng.exponential(1 / a0) if a0 > 0 else np.inf
+            while k_out < len(timepoints) and timepoints[k_out] < t_next:
+                out[k_out] = x
+                k_out += 1
+            if k_out == len(timepoints):
+                break
+            r = min(np.searchsorted(cumulative, rng.random() * a0, side='right'), len(a) - 1)
+            self._fire(x, a, r)
+            t = t_next
+        return t, k_out
+
+    def _g(self, x):
+        #Cao et al. g_i: how fast the reactant's highest-order propensity changes with it
+        g = self._hor.astype(float)
+        xi = x[self._reactant_species]
+        two = self._mult == 2
+        g[two] = self._hor[two] / 2 * (2 + 1 / np.maximum(xi[two] - 1, 1))
+        three = self._mult == 3
+        g[three] = 3 + 1 / np.maximum(xi[three] - 1, 1) + 2 / np.maximum(xi[three] - 2, 1)
+        return g
+
+    def run(self, timepoints, x0, rng=None, method='tau', eps=.03, n_critical=10,
+            burst=100, stats=None):
+        """``(time, species)`` copy numbers at `timepoints` from counts `x0`.
+
+        A `stats` dict is filled with the number of exact steps, of leaps
+        and of reactions fired in leaps.
+        """
+        if method not in ('tau', 'exact'):
+            raise ValueError(f"method must be 'tau' or 'exact', not {method!r}")
+        rng = np.random.default_rng(rng)
+        timepoints = np.asarray(timepoints, dtype=float)
+        x = np.array(x0, dtype=float)
+        out = np.empty((len(timepoints), len(x)))
+        out[0] = x
+        t, k_out = timepoints[0], 1
+        stats = {} if stats is None else stats
+        stats.update(exact=0, leaps=0, leap_firings=0)
+        if method == 'exact':
+            self._ssa(x, t, timepoints, k_out, out, rng, np.iinfo(np.int64).max, stats)
+            return out
+
+        species = self._reactant_species
+        while k_out < len(timepoints):
+            a = self.propensities(x)
+            a0 = a.sum()
+            if a0 <= 0:
+                out[k_out:] = x
+                break
+            #Critical reactions: fewer than n_critical firings left before a reactant runs out
+            limit = np.full(len(a), np.inf)
+            np.minimum.at(limit, self._cons_rxn,
+                          np.floor(x[self._cons_species] / self._cons_amount))
+            critical = (a > 0) & (limit < n_critical)
+            a_nc = np.where(critical, 0, a)
+            #The bound covers the reactants of non-critical reactions only (Cao et al. I_rs)
+            reactant = np.zeros(len(x) + 1, dtype=bool)
+            reactant[self._slots[a_nc > 0]] = True
+            rs = reactant[species]
+            mu = np.abs(self._S @ a_nc)[species[rs]]
+            sigma2 = (self._S2 @ a_nc)[species[rs]]
+            bound = np.maximum(eps * x[species[rs]] / self._g(x)[rs], 1)
+            with np.errstate(divide='ignore'):
+                tau1 = min(np.min(bound / mu, initial=np.inf),
+                           np.min(bound ** 2 / sigma2, initial=np.inf))
+            a0_c = a[critical].sum()
+            #A leap cut short by the next critical firing, expected after 1/a0_c, or shorter
+            #than a few exact steps gains nothing
+            if min(tau1, 1 / a0_c if a0_c > 0 else np.inf) < 10 / a0:
+                t, k_out = self._ssa(x, t, timepoints, k_out, out, rng, burst, stats)
+                continue
+            while True:
+                tau2 = rng.exponential(1 / a0_c) if a0_c > 0 else np.inf
+                tau = min(tau1, tau2, timepoints[k_out] - t)
+                firings = rng.poisson(a_nc * tau).astype(float)
+                if tau2 <= tau and tau2 < tau1:
+                    ac = np.flatnonzero(critical)
+                    p = a[ac].cumsum()
+                    firings[ac[min(np.searchsorted(p, rng.random() * p[-1], side='right'),
+                                   len(ac) - 1)]] += 1
+                x_new = x + self._S @ firings
+                if (x_new >= 0).all():
+                    break
+                tau1 /= 2
+            x, t = x_new, t + tau
+            stats['leaps'] += 1
+            stats['leap_firings'] += int(firings.sum())
+            while k_out < len(timepoints) and timepoints[k_out] <= t:
+                out[k_out] = x
+                k_out += 1
+        return out
+
+
+class EnsembleSummary:
+    """Streaming statistics of ``(time, outputs)`` trajectories.
+
+    Mean and variance use Welford's update and Chan's merge; quantiles come
+    from a uniform reservoir sample of at most `reservoir` trajectories.
+    """
+
+    def __init__(self, timepoints, names, reservoir=1000, seed=None):
+        self.timepoints = np.asarray(timepoints, dtype=float)
+        self.names = list(names)
+        self.n = 0
+        self.mean = np.zeros((len(self.timepoints), len(self.names)))
+        self._m2 = np.zeros_like(self.mean)
+        self.reservoir = reservoir
+        self.sample = []
+        self._rng = np.random.default_rng(seed)
+
+    def __repr__(self):
+        return f'EnsembleSummary({self.n} trajectories, {len(self.timepoints)} times, {self.names})'
+
+    def add(self, y):
+        """Add one ``(time, outputs)`` trajectory."""
+        self.n += 1
+        d = y - self.mean
+        self.mean += d / self.n
+        self._m2 += d * (y - self.mean)
+        if len(self.sample) < self.reservoir:
+            self.sample.append(np.array(y))
+        else:
+            j = self._rng.integers(self.n)
+            if j < self.reservoir:
+                self.sample[j] = np.array(y)
+
+    def merge(self, other):
+        """Fold the statistics of `other` (disjoint trajectories) into this summary."""
+        if not other.n:
+            return self
+        n1, n2 = self.n, other.n
+        n = n1 + n2
+        d = other.mean - self.mean
+        self.mean = self.mean + d * n2 / n
+        self._m2 = self._m2 + other._m2 + d ** 2 * n1 * n2 / n
+        #Uniform sample of the union: how many to keep from each side is hypergeometric
+        size = min(self.reservoir, len(self.sample) + len(other.sample))
+        k1 = self._rng.hypergeometric(n1, n2, size) if n1 else 0
+        k1 = min(max(k1, size - len(other.sample)), len(self.sample))
+        keep1 = self._rng.choice(len(self.sample), k1, replace=False) if k1 else []
+        keep2 = self._rng.choice(len(other.sample), size - k1, replace=False)
+        self.sample = [self.sample[i] for i in keep1] + [other.sample[i] for i in keep2]
+        self.n = n
+        return self
+
+    @property
+    def var(self):
+        return self._m2 / max(self.n - 1, 1)
+
+    @property
+    def std(self):
+        return np.sqrt(self.var)
+
+    def quantiles(self, q):
+        """Quantiles `q` per timepoint and output, from the reservoir sample."""
+        return np.quantile(np.array(self.sample), q, axis=0)
+
+    def to_frame(self, q=(.05, .5, .95)):
+        """DataFrame with `time` and ``<name>_mean``, ``_std`` and ``_q<percent>`` columns."""
+        import pandas as pd
+
+        columns = {'time': self.timepoints}
+        Q = self.quantiles(q)
+        for j, name in enumerate(self.names):
+            columns[f'{name}_mean'] = self.mean[:, j]
+            columns[f'{name}_std'] = self.std[:, j]
+            for qi, values in zip(q, Q):
+                columns[f'{name}_q{100 * qi:g}'] = values[:, j]
+        return pd.DataFrame(columns)
+
+
+def _init_worker(simulator, timepoints, x0, W, names, reservoir, options):
+    global _worker
+    _worker = (simulator, timepoints, x0, W, names, reservoir, options)
+
+
+def _run_chunk(seeds):
+    simulator, timepoints, x0, W, names, reservoir, options = _worker
+    summary = EnsembleSummary(timepoints, names, reservoir, seeds[0])
+    for seed in seeds:
+        counts = simulator.run(timepoints, x0, np.random.default_rng(seed), **options)
+        y = counts if W is None else (W @ counts.T).T
+        summary.add(y / simulator.omega)
+    return summary
+
+
+def simulate_ssa(crn, timepoints, initial_condition_dict, volume, parameters=None,
+                 observables=None, seed=None, **options):
+    """One stochastic trajectory, in uM, as a bioscrape-style DataFrame.
+
+    `volume` is in litres; `options` as `StochasticSimulator.run`.
+    """
+    simulator = StochasticSimulator(crn, volume, parameters)
+    names, W = observation(crn, observables)
+    counts = simulator.run(timepoints, simulator.to_counts(initial_condition_dict), seed, **options)
+    y = counts if W is None else (W @ counts.T).T
+    return to_frame(names, timepoints, y / simulator.omega)
+
+
+def ssa_ensemble(crn, timepoints, n_trajectories, initial_condition_dict, volume,
+                 parameters=None, observables=None, processes=None, chunk_size=None,
+                 seed=None, reservoir=1000, callback=None, mp_context=None, **options):
+    """`EnsembleSummary` (in uM) of `n_trajectories` stochastic runs.
+
+    Chunks of `chunk_size` trajectories run in a pool of `processes`
+    (default `default_processes()`); `callback(summary)` is called with the
+    merged summary after each chunk. Trajectories are seeded from `seed`
+    independently of how they are chunked. `options` as
+    `StochasticSimulator.run`.
+    """
+    processes = default_processes() if processes is None else processes
+    simulator = StochasticSimulator(crn, volume, parameters)
+    names, W = observation(crn, observables)
+    x0 = simulator.to_counts(initial_condition_dict)
+    seeds = np.random.SeedSequence(seed).spawn(n_trajectories)
+    chunk_size = chunk_size or max(1, -(-n_trajectories // (4 * processes)))
+    chunks = [seeds[i:i + chunk_size] for i in range(0, n_trajectories, chunk_size)]
+    initargs = (simulator, np.asarray(timepoints, dtype=float), x0, W, names, reservoir, options)
+    summary = EnsembleSummary(timepoints, names, reservoir, seed)
+
+    def collect(results):
+        for part in results:
+            summary.merge(part)
+            if callback is not None:
+                callback(summary)
+
+    if processes > 1:
+        #Fork by default, as in py_inference_parallel
+        if mp_context is None and 'fork' in multiprocessing.get_all_start_methods():
+            mp_context = 'fork'
+        ctx = multiprocessing.get_context(mp_context)
+        with ctx.Pool(processes, initializer=_init_worker, initargs=initargs) as pool:
+            collect(pool.imap_unordered(_run_chunk, chunks))
+    else:
+        _init_worker(*initargs)
+        collect(map(_run_chunk, chunks))
+    return summary
@@ -0,0 +1,298 @@
+"""Polynomial-chaos emulator of an `Experiment` for surrogate MCMC.
+
+Every likelihood call of the TXwTL inference integrates the full network.
+`py_inference_surrogate` instead simulates a Latin-hypercube design over the
+prior box once, in a process pool. It then fits a `Surrogate`: a Legendre
+polynomial of total degree `degree` in the scaled log-rates, with one
+coefficient vector per measurement time and observable. emcee then runs on
+the emulated likelihood, and all walkers are evaluated in one matrix
+product.
+
+A single polynomial over the whole prior box is too coarse near the
+posterior, so the emulator is first refined over `n_stages` stages of
+`refine_every` steps. After each stage the true model is simulated at
+`n_refine` walker positions, and the error of the emulator the stage used
+is recorded there in `Surrogate.errors`. The box is then zoomed onto the
+walkers, widened by their spread on each side, and a new design is
+simulated in it. The polynomial is refit on all design points in the new
+box. Errors are the maximum and RMS deviations from the true model in
+units of the measurement `sigma`. Their square is roughly the error in
+``-2 log L`` per measurement.
+
+Each stage targets a different emulator, so the stage samples are written
+apart, with their stage number, to `filename_stages`. The chain in
+`filename_csv` holds only the `nsteps` steps drawn with the final emulator,
+whose error at the final walkers is the last entry of `errors`. Outside
+the emulator box the full model is evaluated instead (counted in
+`SurrogateLikelihood.n_full`), so the box does not truncate the
+posterior.
+"""
+import csv
+import multiprocessing
+
+import numpy as np
+
+from .hmc import prior_terms
+from .inference import default_processes, write_log_prob
+
+#Per-process experiment, set by _init_worker
+_experiment = None
+
+
+def prior_box(prior, names, width=3.):
+    """``(lower, upper)`` rate bounds covering `prior`: the bounds of
+    (log-)uniform priors, else ``width`` standard deviations, clipped to
+    three decades below the upper bound."""
+    lower, upper = [], []
+    for name in names:
+        spec = prior[name]
+        kind = spec[0]
+        if kind in ('uniform', 'log-uniform'):
+            lo, hi = spec[1], spec[2]
+        elif kind == 'gaussian':
+            lo, hi = spec[1] - width * spec[2], spec[1] + width * spec[2]
+        elif kind == 'log-gaussian':
+            lo, hi = np.exp(spec[1] - width * spec[2]), np.exp(spec[1] + width * spec[2])
+        elif kind == 'exponential':
+            lo, hi = 0., (1 + width) / spec[1]
+        elif kind == 'gamma':
+            mean, sd = spec[1] / spec[2], np.sqrt(spec[1]) / spec[2]
+            lo, hi = mean - width * sd, mean + width * sd
+        else:
+            raise ValueError(f'Unsupported prior type {kind!r}')
+        lower.append(max(lo, 1e-3 * hi))
+        upper.append(hi)
+    return np.array(lower, dtype=float), np.array(upper, dtype=float)
+
+
+def total_degree(ndim, degree):
+    """Multi-indices of `ndim` non-negative powers summing to at most
+    `degree`, in lexicographic order; built directly, without enumerating
+    the ``(degree + 1) ** ndim`` tensor grid."""
+    if ndim == 0:
+        return [()]
+    return [(p,) + rest for p in range(degree + 1) for rest in total_degree(ndim - 1, degree - p)]
+
+
+def latin_hypercube(lower, upper, n, seed=None):
+    """`n` points stratified in log-space between the positive bounds."""
+    rng = np.random.default_rng(seed)
+    ndim = len(lower)
+    z = (rng.permuted(np.tile(np.arange(n), (ndim, 1)), axis=1).T + rng.random((n, ndim))) / n
+    return np.exp(np.log(lower) + z * (np.log(upper) - np.log(lower)))
+
+
+class Surrogate:
+    """Total-degree Legendre expansion of the ``(time, observables)``
+    prediction over the log-rate box ``[lower, upper]``."""
+
+    def __init__(self, lower, upper, degree=3):
+        self.lower = np.log(np.asarray(lower, dtype=float))
+        self.upper = np.log(np.asarray(upper, dtype=float))
+        self.degree = degree
+        ndim = len(self.lower)
+        self.powers = np.array(total_degree(ndim, degree), dtype=np.int64).reshape(-1, ndim)
+        self.coef = None
+        self.errors = []
+
+    @property
+    def n_terms(self):
+        return len(self.powers)
+
+    def __repr__(self):
+        return f'Surrogate({len(self.lower)} rates, degree {self.degree}, {self.n_terms} terms)'
+
+    def inside(self, theta):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            u = np.log(np.atleast_2d(theta))
+        return ((u >= self.lower) & (u <= self.upper)).all(axis=1)
+
+    def basis(self, theta):
+        """``(points, terms)`` Legendre basis at the rates `theta`."""
+        theta = np.atleast_2d(np.asarray(theta, dtype=float))
+        z = 2 * (np.log(theta) - self.lower) / (self.upper - self.lower) - 1
+        P = np.empty((self.degree + 1,) + z.shape)
+        P[0] = 1
+        if self.degree:
+            P[1] = z
+        for d in range(1, self.degree):
+            P[d + 1] = ((2 * d + 1) * z * P[d] - d * P[d - 1]) / (d + 1)
+        dims = np.arange(z.shape[1])
+        return P[self.powers, :, dims].prod(axis=1).T
+
+    def fit(self, theta, y):
+        """Least-squares fit to predictions `y` ``(points, time, observables)``."""
+        y = np.asarray(y, dtype=float)
+        self.shape = y.shape[1:]
+        self.coef = np.linalg.lstsq(self.basis(theta), y.reshape(len(y), -1), rcond=None)[0]
+        return self
+
+    def __call__(self, theta):
+        """``(points, time, observables)`` emulated predictions."""
+        return (self.basis(theta) @ self.coef).reshape((-1,) + self.shape)
+
+    def error(self, theta, y, sigma):
+        """Max and RMS of ``|emulated - y| / sigma`` at the points `theta`."""
+        r = np.abs(self(theta) - y) / sigma
+        return {'max': float(r.max()), 'rms': float(np.sqrt((r ** 2).mean()))}
+
+
+def _zoom(walkers, lower, upper):
+    #Box around the walkers, widened by their log-range on each side, within the prior box
+    u = np.log(walkers)
+    lo, hi = u.min(axis=0), u.max(axis=0)
+    span = np.maximum(hi - lo, .05)
+    return (np.maximum(np.exp(lo - span), lower) * (1 - 1e-12),
+            np.minimum(np.exp(hi + span), upper) * (1 + 1e-12))
+
+
+def _init_worker(experiment):
+    global _experiment
+    _experiment = experiment
+
+
+def _simulate(theta):
+    try:
+        return _experiment.simulate(theta)
+    except (RuntimeError, ValueError, FloatingPointError):
+        return None
+
+
+def simulate_design(experiment, theta, processes=None, mp_context=None):
+    """``(theta, y)``: `experiment` predictions at the rows of `theta`,
+    computed in a process pool; failed integrations are dropped."""
+    processes = default_processes() if processes is None else processes
+    if processes > 1:
+        #Fork by default, as in py_inference_parallel
+        if mp_context is None and 'fork' in multiprocessing.get_all_start_methods():
+            mp_context = 'fork'
+        ctx = multiprocessing.get_context(mp_context)
+        with ctx.Pool(processes, initializer=_init_worker, initargs=(experiment,)) as pool:
+            y = pool.map(_simulate, theta)
+    else:
+        _init_worker(experiment)
+        y = [_simulate(t) for t in theta]
+    ok = [i for i, yi in enumerate(y) if yi is not None]
+    return np.asarray(theta)[ok], np.array([y[i] for i in ok])
+
+
+class SurrogateLikelihood:
+    """Gaussian log-posterior of `experiment` with `surrogate` predictions,
+    vectorized over emcee walkers. Walkers outside the emulator box get the
+    full model's likelihood; those outside the prior's support ``-inf``."""
+
+    def __init__(self, experiment, surrogate, prior):
+        self.experiment = experiment
+        self.surrogate = surrogate
+        terms = [prior_terms(prior[name]) for name in experiment.params_to_estimate]
+        self._terms = [t[0] for t in terms]
+        self._lower = np.array([-np.inf if t[1][0] is None else t[1][0] for t in terms])
+        self._upper = np.array([np.inf if t[1][1] is None else t[1][1] for t in terms])
+        self.n_full = 0
+
+    def log_prior(self, theta):
+        return np.array([sum(f(t)[0] for f, t in zip(self._terms, row)) for row in theta])
+
+    def supported(self, theta):
+        """Rows of `theta` inside the prior's support."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            u = np.log(np.atleast_2d(theta))
+        return ((u >= self._lower) & (u <= self._upper)).all(axis=1)
+
+    def __call__(self, theta):
+        theta = np.atleast_2d(theta)
+        e = self.experiment
+        out = np.full(len(theta), -np.inf)
+        supported = self.supported(theta)
+        inside = supported & self.surrogate.inside(theta)
+        if inside.any():
+            y = self.surrogate(theta[inside])
+            r = (e._data[None] - y[:, None]) * e._weight
+            out[inside] = e._norm - .5 * np.einsum('nijk,nijk->n', r, r) + self.log_prior(theta[inside])
+        for i in np.flatnonzero(supported & ~inside):
+            out[i] = e.log_likelihood(theta[i]) + self.log_prior(theta[i:i + 1])[0]
+            self.n_full += 1
+        return out
+
+
+def py_inference_surrogate(experiment, prior, n_design=None, degree=3, nwalkers=None,
+                           nsteps=2000, n_stages=3, refine_every=200, n_refine=8, processes=None,
+                           seed=None, validation=.2, box=None, filename_csv='mcmc_results.csv',
+                           filename_txt='mcmc_results.txt', filename_stages='mcmc_stages.csv',
+                           progress=False):
+    """Emulator-accelerated emcee over the `params_to_estimate` of `experiment`.
+
+    `n_design` full simulations (default twice the number of polynomial
+    terms) over `box` (default `prior_box`); a `validation` fraction is
+    held out for the first error estimate, then the emulator is refit on
+    all of them. Walkers start at the best design points. After the
+    `n_stages` refinement stages (rows ``stage, params...`` in
+    `filename_stages`, or not written if None), `nsteps` steps with the
+    final emulator are written like `py_inference_parallel`. Returns
+    ``(sampler, surrogate)``; the sampler holds the final steps only.
+    """
+    import emcee
+
+    names = experiment.params_to_estimate
+    box = prior_box(prior, names) if box is None else tuple(np.asarray(b, dtype=float) for b in box)
+    surrogate = Surrogate(*box, degree)
+    n_design = 2 * surrogate.n_terms if n_design is None else n_design
+    nwalkers = 4 * len(names) if nwalkers is None else nwalkers
+    rng = np.random.default_rng(seed)
+
+    theta, y = simulate_design(experiment, latin_hypercube(*box, n_design, seed), processes)
+    n_fit = len(theta) - int(validation * len(theta))
+    surrogate.fit(theta[:n_fit], y[:n_fit])
+    errors = []
+    if n_fit < len(theta):
+        errors.append(surrogate.error(theta[n_fit:], y[n_fit:], experiment.sigma))
+    surrogate.fit(theta, y)
+
+    log_prob_fn = SurrogateLikelihood(experiment, surrogate, prior)
+    ll = np.array([experiment._norm - .5 * experiment.chi2(yi) for yi in y])
+    state = theta[np.argsort(-(ll + log_prob_fn.log_prior(theta)))[:nwalkers]]
+    if len(state) < nwalkers:
+        raise ValueError(f'{len(theta)} successful design runs, need at least nwalkers={nwalkers}')
+
+    def validate(coords):
+        #Error of the current emulator against the true model at some walkers
+        pick = coords[rng.choice(nwalkers, min(n_refine, nwalkers), replace=False)]
+        new_theta, new_y = simulate_design(experiment, pick, processes)
+        if len(new_theta):
+            errors.append(surrogate.error(new_theta, new_y, experiment.sigma))
+        return new_theta, new_y
+
+    stages = open(filename_stages, 'w', newline='') if filename_stages else None
+    stage_writer = csv.writer(stages) if stages else None
+    try:
+        for stage in range(n_stages):
+            #A fresh sampler per stage: log-probabilities of different emulators never mix
+            sampler = emcee.EnsembleSampler(nwalkers, len(names), log_prob_fn, vectorize=True)
+            for state in sampler.sample(state, iterations=refine_every, progress=progress):
+                if stage_writer:
+                    stage_writer.writerows([stage, *row] for row in state.coords)
+            state = state.coords
+            new_theta, new_y = validate(state) if n_refine else (theta[:0], y[:0])
+            #Zoom the box onto the walkers and add a design there
+            lower, upper = _zoom(state, *box)
+            zoom_theta, zoom_y = simulate_design(
+                experiment, latin_hypercube(lower, upper, surrogate.n_terms, rng), processes)
+            theta = np.concatenate([theta, new_theta, zoom_theta])
+            y = np.concatenate([y, new_y, zoom_y])
+            inside = ((theta >= lower) & (theta <= upper)).all(axis=1)
+            surrogate = Surrogate(lower, upper, degree).fit(theta[inside], y[inside])
+            log_prob_fn.surrogate = surrogate
+    finally:
+        if stages:
+            stages.close()
+
+    sampler = emcee.EnsembleSampler(nwalkers, len(names), log_prob_fn, vectorize=True)
+    with open(filename_csv, 'w', newline='') as f:
+        writer = csv.writer(f)
+        for state in sampler.sample(state, iterations=nsteps, progress=progress):
+            writer.writerows(state.coords)
+    if n_refine:
+        validate(state.coords)
+    surrogate.errors = errors
+    write_log_prob(sampler.get_log_prob(), sampler.backend.accepted, nsteps, filename_txt)
+    return sampler, surrogate
@@ -0,0 +1,217 @@
+"""PURE translation (TL) network.
+
+Port of the TL cells of `Models/CRN_PURE_MGaptTXwTL.ipynb` (background
+translation machinery) and `Examples/CRN_PURE_TXTL_MGaptdeGFP.ipynb`
+(codon-by-codon elongation and termination of a given protein). Rate
+constants are looked up by reaction id in `rxn_k`, as read from
+`Data_files/fMGG_synthesis_parameters_CRN.csv`.
+"""
+from . import _tl_reactions as tables
+from .network import CRNBuilder
+from .parameters import load_rate_constants
+from .sequence import LIST_AA, TRNA_CODON, as_protein
+
+
+def _pept(n):
+    return str(n).zfill(4)
+
+
+def add_tl_reactions(builder, protein=None, rxn_k=None, amino_acids=None):
+    """Add the TL reactions to `builder`.
+
+    Without `protein` only the translation machinery is built (aa charging,
+    initiation, recycling). With `protein` (three-letter list or one-letter
+    string, starting with Met) the elongation and termination reactions of
+    that protein are added as well. `amino_acids` restricts the aminoacyl-tRNA
+    blocks to a subset of `LIST_AA`; by default all 20 are built. With
+    ``amino_acids='protein'`` only the amino acids the protein elongates
+    with are built, which is exact when the others are absent from the
+    initial conditions (their synthetases otherwise still bind ATP). Returns
+    the name of the released peptide species, or None without `protein`.
+    """
+    rxn_k = load_rate_constants() if rxn_k is None else rxn_k
+    if amino_acids == 'protein':
+        if protein is None:
+            raise ValueError("amino_acids='protein' needs a protein")
+        used = set(as_protein(protein)[1:])
+        amino_acids = [aa for aa in LIST_AA if aa in used]
+    add_species = builder.add_species
+
+    def rxn(reactants, products, key):
+        builder.add_reaction(reactants, products, key, rxn_k[key])
+
+    #General proteins and small molecules, then fMet initiation
+    add_species(*tables.GENERAL_SPECIES)
+    for reactants, products, key in tables.GENERAL_REACTIONS:
+        rxn(reactants, products, key)
+    add_species(*tables.FMET_SPECIES)
+    for reactants, products, key in tables.FMET_REACTIONS:
+        rxn(reactants, products, key)
+
+    #Aminoacyl-tRNA synthesis for each aa
+    for aa in (LIST_AA if amino_acids is None else amino_acids):
+        if aa == 'Met':
+            add_species(*tables.MET_SPECIES)
+            for reactants, products, key in tables.MET_REACTIONS:
+                rxn(reactants, products, key)
+            continue
+        fmt = {'aa': aa, 'xyz': TRNA_CODON[aa]}
+        add_species(*(s.format(**fmt) for s in tables.AA_SPECIES))
+        for reactants, products, key in tables.AA_REACTIONS:
+            rxn([s.format(**fmt) for s in reactants], [s.format(**fmt) for s in products], key)
+
+    if protein is not None:
+        return add_elongation_reactions(builder, as_protein(protein), rxn)
+    return None
+
+
+def add_elongation_reactions(builder, protein, rxn):
+    """Elongation and termination reactions for `protein`.
+
+    `rxn(reactants, products, key)` adds one reaction. Returns the name of the
+    released full-length peptide species.
+    """
+    if len(protein) < 2 or protein[0] != 'Met':
+        raise ValueError('protein must start with Met and have at least 2 aa')
+    add_species = builder.add_species
+
+    #Initiation complex moves fMet-tRNA to the P site
+    aa, xyz = protein[1], TRNA_CODON[protein[1]]
+    A = 'elRS70SA' + xyz + '0002_fMet'
+    add_species(A, A + '_EFTu_GDP', A + 'tRNAfMetCAU')
+    rxn([A + 'tRNAfMetCAU'], [A, 'tRNAfMetCAU'], 're0000000001_k1')
+    rxn([A + '_EFTu_GDP'], [A, 'EFTu_GDP'], 're0000000028_k1')
+    rxn(['RS70S_IF2_GDP_fMettRNAfMetCAU_mRNA'], [A + 'tRNAfMetCAU', 'IF2_GDP'], 're0000000726_k1')
+    rxn([A + 'tRNAfMetCAU', 'IF2_GDP'], ['RS70S_IF2_GDP_fMettRNAfMetCAU_mRNA'], 're0000000752_k1')
+    rxn(['RS70S_IF3_fMettRNAfMetCAU_mRNA'], [A + 'tRNAfMetCAU', 'IF3'], 're0000000763_k1')
+    rxn(['RS70S_IF1_fMettRNAfMetCAU_mRNA'], [A + 'tRNAfMetCAU', 'IF1'], 're0000000765_k1')
+
+    #Incorporation of the 2nd amino acid
+    aatrna = aa + 'tRNA' + aa + xyz
+    B = 'elRS70SB' + xyz + '0002_Pept0002tRNA' + aa + xyz
+    add_species(A + '_EFTu_GDP_' + aatrna, A + '_EFTu_GDP_PO4_' + aatrna,
+                A + '_EFTu_GTP_' + aatrna, A + '_' + aatrna,
+                B, B + '_EFG_GDP_PO4', B + '_EFG_GTP',
+                'Pept0002', 'Pept0002_degraded', 'Pept0002tRNA' + aa + xyz,
+                'Pept0002tRNA' + aa + xyz + '_degraded')
+    rxn(['EFTu_GTP_' + aatrna, A], [A + '_EFTu_GTP_' + aatrna], 're0000000013_k1')
+    rxn([A + '_EFTu_GTP_' + aatrna], [A + '_EFTu_GDP_PO4_' + aatrna], 're0000000014_k1')
+    rxn([A + '_EFTu_GDP_PO4_' + aatrna], ['PO4', A + '_EFTu_GDP_' + aatrna], 're0000000016_k1')
+    rxn([A + '_EFTu_GDP_' + aatrna], ['EFTu_GDP', A + '_' + aatrna], 're0000000017_k1')
+    rxn([A + '_' + aatrna], [B], 're0000000018_k1')
+    rxn([B, 'EFG_GTP'], [B + '_EFG_GTP'], 're0000000019_k1')
+    rxn([B + '_EFG_GTP'], ['EFG_GTP', B], 're0000000020_k1')
+    rxn([A + '_EFTu_GTP_' + aatrna], ['EFTu_GTP_' + aatrna, A], 're0000000021_k1')
+    rxn([B + '_EFG_GTP'], [B + '_EFG_GDP_PO4'], 're0000000022_k1')
+    rxn([B + '_EFG_GDP_PO4'], [B + '_EFG_GTP'], 're0000000023_k1')
+
+    #The 3rd amino acid to the last one
+    for L in range(2, len(protein)):
+        oA, oX = aa, xyz
+        aa, xyz = protein[L], TRNA_CODON[protein[L]]
+        aatrna = aa + 'tRNA' + aa + xyz
+        spept, gpept = _pept(L), _pept(L + 1)
+        C = 'elRS70SC' + xyz + gpept + '_Pept' + spept + 'tRNA' + oA + oX + '_EFG_GDP'
+        A = 'elRS70SA' + xyz + gpept + '_Pept' + spept
+        Bprev = B
+        B = 'elRS70SB' + xyz + gpept + '_Pept' + gpept + 'tRNA' + aa + xyz
+        add_species(C, A, A + '_EFTu_GDP', A + '_EFTu_GDP_' + aatrna,
+                    A + '_EFTu_GDP_PO4_' + aatrna, A + '_EFTu_GTP_' + aatrna,
+                    A + '_' + aatrna, A + 'tRNA' + oA + oX,
+                    B + '_EFG_GTP', B, B + '_EFG_GDP_PO4',
+                    'Pept' + gpept, 'Pept' + gpept + 'tRNA' + aa + xyz,
+                    'Pept' + gpept + 'tRNA' + aa + xyz + '_degraded')
+        rxn([Bprev + '_EFG_GDP_PO4'], ['PO4', C], 're0000000024_k1')
+        rxn([C], [A + 'tRNA' + oA + oX, 'EFG_GDP'], 're0000000025_k1')
+        rxn([A + 'tRNA' + oA + oX], [A, 'tRNA' + oA + oX], 're0000000068_k1')
+        #Switched to the new aa
+        rxn(['EFTu_GTP_' + aatrna, A], [A + '_EFTu_GTP_' + aatrna], 're0000000074_k1')
+        rxn([A + '_EFTu_GTP_' + aatrna], [A + '_EFTu_GDP_PO4_' + aatrna], 're0000000075_k1')
+        rxn([A + '_EFTu_GDP_PO4_' + aatrna], ['PO4', A + '_EFTu_GDP_' + aatrna], 're0000000077_k1')
+        rxn([A + '_EFTu_GDP_' + aatrna], ['EFTu_GDP', A + '_' + aatrna], 're0000000078_k1')
+        rxn([A + '_' + aatrna], [B], 're0000000079_k1')
+        rxn([B, 'EFG_GTP'], [B + '_EFG_GTP'], 're0000000080_k1')
+        rxn([B + '_EFG_GTP'], ['EFG_GTP', B], 're0000000081_k1')
+        rxn([A + '_EFTu_GTP_' + aatrna], ['EFTu_GTP_' + aatrna, A], 're0000000082_k1')
+        rxn([B + '_EFG_GTP'], [B + '_EFG_GDP_PO4'], 're0000000083_k1')
+        rxn([B + '_EFG_GDP_PO4'], [B + '_EFG_GTP'], 're0000000084_k1')
+        rxn([A + '_EFTu_GDP'], [A, 'EFTu_GDP'], 're0000000089_k1')
+
+    #Translocation onto the UAA stop codon. The stop position keeps the
+    #notebook's padding ('0000'[:-len(str(L))] + str(L+2)).
+    L = len(protein) - 1
+    gpept = _pept(L + 1)
+    lpept = '0000'[:-len(str(L))] + str(L + 2)
+    peptide = 'Pept' + gpept
+    aatrna = 'tRNA' + aa + xyz
+    S = 'elRS70SAUAA' + lpept + '_Pept' + gpept + aatrna
+    C = 'elRS70SCUAA' + lpept + '_Pept' + gpept + aatrna + '_EFG_GDP'
+    add_species(S, S + '_RF1', S + '_RF2', C)
+    rxn([B + '_EFG_GDP_PO4'], ['PO4', C], 're0000000085_k1')
+    rxn([C], [S, 'EFG_GDP'], 're0000000086_k1')
+    rxn([S, 'RF1'], [S + '_RF1'], 're0000000796_k1')
+    rxn([S + '_RF1'], [S, 'RF1'], 're0000000797_k1')
+    rxn([S, 'RF2'], [S + '_RF2'], 're0000000811_k1')
+    rxn([S + '_RF2'], [S, 'RF2'], 're0000000812_k1')
+
+    #Peptide release and ribosome recycling
+    T = 'termRS70SUAA' + lpept + '_' + aatrna
+    add_species('termRS30S_mRNA', *(T + s for s in (
+        '', '_EFG_GTP', '_RF1', '_RF1_RF3', '_RF1_RF3_GDP', '_RF1_RF3_GTP', '_RF2',
+        '_RF2_RF3', '_RF2_RF3_GDP', '_RF2_RF3_GTP', '_RF3_GDP', '_RF3_GDP_PO4',
+        '_RF3_GTP', '_RRF', '_RRF_EFG_GDP', '_RRF_EFG_GDP_PO4', '_RRF_EFG_GTP')))
+    rxn([S + '_RF1'], [T + '_RF1', peptide], 're0000000798_k1')
+    rxn([T + '_RF1'], [T, 'RF1'], 're0000000799_k1')
+    rxn([T, 'RF1'], [T + '_RF1'], 're0000000800_k1')
+    rxn([S + '_RF2'], [T + '_RF2', peptide], 're0000000813_k1')
+    rxn([T + '_RF2'], [T, 'RF2'], 're0000000814_k1')
+    rxn([T, 'RF2'], [T + '_RF2'], 're0000000815_k1')
+    rxn(['RF3_GDP', T + '_RF1'], [T + '_RF1_RF3_GDP'], 're0000000829_k1')
+    rxn([T + '_RF1_RF3_GDP'], [T + '_RF1', 'RF3_GDP'], 're0000000830_k1')
+    rxn([T + '_RF1', 'RF3_GTP'], [T + '_RF1_RF3_GTP'], 're0000000831_k1')
+    rxn([T + '_RF1_RF3_GTP'], [T + '_RF1', 'RF3_GTP'], 're0000000832_k1')
+    rxn([T + '_RF1', 'RF3'], [T + '_RF1_RF3'], 're0000000833_k1')
+    rxn([T + '_RF1_RF3'], [T + '_RF1', 'RF3'], 're0000000834_k1')
+    rxn([T + '_RF1_RF3_GTP'], [T + '_RF3_GTP', 'RF1'], 're0000000838_k1')
+    rxn([T + '_RF3_GTP', 'RF1'], [T + '_RF1_RF3_GTP'], 're0000000839_k1')
+    rxn([T + '_RF3_GTP'], [T + '_RF3_GDP_PO4'], 're0000000840_k1')
+    rxn([T + '_RF3_GDP_PO4'], [T + '_RF3_GTP'], 're0000000841_k1')
+    rxn([T + '_RF3_GDP_PO4'], [T + '_RF3_GDP', 'PO4'], 're0000000842_k1')
+    rxn([T + '_RF1_RF3_GDP'], [T + '_RF1_RF3', 'GDP'], 're0000000843_k1')
+    rxn([T + '_RF1_RF3', 'GDP'], [T + '_RF1_RF3_GDP'], 're0000000844_k1')
+    rxn([T + '_RF1_RF3_GTP'], [T + '_RF1_RF3', 'GTP'], 're0000000845_k1')
+    rxn([T + '_RF1_RF3', 'GTP'], [T + '_RF1_RF3_GTP'], 're0000000846_k1')
+    rxn([T + '_RF3_GDP'], [T, 'RF3_GDP'], 're0000000847_k1')
+    rxn(['RF3_GDP', T + '_RF2'], [T + '_RF2_RF3_GDP'], 're0000000870_k1')
+    rxn([T + '_RF2_RF3_GDP'], [T + '_RF2', 'RF3_GDP'], 're0000000871_k1')
+    rxn([T + '_RF2', 'RF3_GTP'], [T + '_RF2_RF3_GTP'], 're0000000872_k1')
+    rxn([T + '_RF2_RF3_GTP'], [T + '_RF2', 'RF3_GTP'], 're0000000873_k1')
+    rxn([T + '_RF2', 'RF3'], [T + '_RF2_RF3'], 're0000000874_k1')
+    rxn([T + '_RF2_RF3'], [T + '_RF2', 'RF3'], 're0000000875_k1')
+    rxn([T + '_RF2_RF3_GTP'], [T + '_RF3_GTP', 'RF2'], 're0000000879_k1')
+    rxn([T + '_RF3_GTP', 'RF2'], [T + '_RF2_RF3_GTP'], 're0000000880_k1')
+    rxn([T + '_RF2_RF3_GDP'], [T + '_RF2_RF3', 'GDP'], 're0000000881_k1')
+    rxn([T + '_RF2_RF3', 'GDP'], [T + '_RF2_RF3_GDP'], 're0000000882_k1')
+    rxn([T + '_RF2_RF3_GTP'], [T + '_RF2_RF3', 'GTP'], 're0000000883_k1')
+    rxn([T + '_RF2_RF3', 'GTP'], [T + '_RF2_RF3_GTP'], 're0000000884_k1')
+    rxn([T + '_RRF', 'EFG_GTP'], [T + '_RRF_EFG_GTP'], 're0000000895_k1')
+    rxn([T + '_RRF_EFG_GTP'], [T + '_RRF', 'EFG_GTP'], 're0000000896_k1')
+    rxn([T + '_RRF_EFG_GTP'], [T + '_EFG_GTP', 'RRF'], 're0000000900_k1')
+    rxn([T + '_EFG_GTP', 'RRF'], [T + '_RRF_EFG_GTP'], 're0000000901_k1')
+    rxn([T + '_RRF_EFG_GDP_PO4'], [T + '_RRF_EFG_GDP', 'PO4'], 're0000000902_k1')
+    rxn([T, 'RRF'], [T + '_RRF'], 're0000000904_k1')
+    rxn([T + '_RRF'], [T, 'RRF'], 're0000000905_k1')
+    rxn([T, 'EFG_GTP'], [T + '_EFG_GTP'], 're0000000906_k1')
+    rxn([T + '_EFG_GTP'], [T, 'EFG_GTP'], 're0000000907_k1')
+    rxn([T + '_RRF_EFG_GTP'], [T + '_RRF_EFG_GDP_PO4'], 're0000000908_k1')
+    rxn([T + '_RRF_EFG_GDP_PO4'], [T + '_RRF_EFG_GTP'], 're0000000909_k1')
+    rxn([T + '_RRF_EFG_GDP'], ['RS50S_' + aatrna + '_RRF_EFG_GDP', 'termRS30S_mRNA'], 're0000000910_k1')
+    rxn(['termRS30S_mRNA'], ['RS30S', 'mRNA'], 're0000000911_k1')
+    return peptide
+
+
+def build_tl_crn(protein=None, rxn_k=None, amino_acids=None):
+    """Compile the TL network; see `add_tl_reactions`."""
+    builder = CRNBuilder()
+    add_tl_reactions(builder, protein, rxn_k, amino_acids)
+    return builder.compile()
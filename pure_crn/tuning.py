@@ -0,0 +1,201 @@
+"""Solver and tolerance selection against a tight reference run.
+
+The inference scripts choose tolerances by hand (``rtol=.01`` in Fine and
+Course, ``atol=.01`` in TXwTL) with no record of the error this costs.
+`tune` first integrates the observables of a network at `REFERENCE`
+tolerances. It then times every method and ``(rtol, atol)`` pair of a grid
+and measures each one's error against the reference. The error is the
+largest deviation over the timepoints divided by the observable's range in
+the reference. The fastest setting within `max_error` is `best`.
+
+`write_config` records it under the network's `CompiledCRN.digest` in the
+JSON config (`pure_crn.ode.SOLVER_CONFIG`, ``PURE_CRN_SOLVER_CONFIG``), from
+which `simulate`, `simulate_batch` and `Experiment` take their default
+solver options (`pure_crn.ode.tuned_options`), and so do `pure_crn.hmc`
+and `pure_crn.surrogate`.
+
+    python -m pure_crn.tuning tx_mgapt --error 1e-3 --times Data_files/MGapt_mRNA_data_final.csv
+
+tunes a `pure_crn.benchmark` fixture, here on the measurement times of the
+MGapt data, and writes the config; ``--report FILE`` saves the whole grid.
+"""
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+from .ode import SOLVER_CONFIG, IntegrationAborted, MassActionODE, observation
+
+REFERENCE = {'method': 'Radau', 'rtol': 1e-10, 'atol': 1e-13}
+METHODS = ('Radau', 'BDF', 'LSODA')
+RTOLS = (1e-2, 1e-3, 1e-4, 1e-5, 1e-6, 1e-7)
+ATOLS = (1e-2, 1e-4, 1e-6, 1e-9)
+
+
+class TuningReport:
+    """Result of `tune`: the `reference` run's options and time, the grid's
+    `rows` (``method, rtol, atol, time_s, error, steps, status``) and the
+    fastest setting within `max_error`, `best` (None if none is)."""
+
+    def __init__(self, crn, observables, timepoints, max_error, reference, rows):
+        self.digest = crn.digest()
+        self.observables = list(observables)
+        self.timepoints = np.asarray(timepoints, dtype=float)
+        self.max_error = max_error
+        self.reference = reference
+        self.rows = rows
+        ok = [r for r in rows if r['status'] == 'ok' and r['error'] <= max_error]
+        self.best = min(ok, key=lambda r: r['time_s']) if ok else None
+
+    def __repr__(self):
+        if self.best is None:
+            return f'TuningReport({len(self.rows)} settings, none within {self.max_error:g})'
+        b = self.best
+        return (f"TuningReport(best {b['method']} rtol={b['rtol']:g} atol={b['atol']:g}: "
+                f"{b['time_s']:.3g} s, error {b['error']:.2g}; reference {self.reference['time_s']:.3g} s)")
+
+    @property
+    def options(self):
+        """Solver options of `best`."""
+        if self.best is None:
+            raise ValueError(f'No setting is within max_error={self.max_error:g}')
+        return {k: self.best[k] for k in ('method', 'rtol', 'atol')}
+
+    def to_frame(self):
+        """The grid as a DataFrame, fastest first."""
+        import pandas as pd
+
+        return pd.DataFrame(self.rows).sort_values('time_s', ignore_index=True)
+
+
+def _run(ode, timepoints, x0, W, max_time, **options):
+    #(time, outputs, steps) of one integration, aborted after max_time seconds
+    start = time.perf_counter()
+    stats = {}
+
+    def abort(out, j):
+        return time.perf_counter() - start > max_time
+
+    y = ode.integrate(timepoints, x0, observe=W, abort=abort, stats=stats, **options)
+    return time.perf_counter() - start, y, stats['steps']
+
+
+def tune(crn, timepoints, initial_condition_dict=None, observables=('MGapt',), max_error=1e-3,
+         methods=METHODS, rtols=RTOLS, atols=ATOLS, reference=None, repeat=1, max_time=None,
+         backend='auto'):
+    """`TuningReport` of the solver settings for the `observables` of `crn`.
+
+    Each setting's time is the minimum over `repeat` runs; settings slower
+    than `max_time` seconds (default 10 reference runs) or failing are
+    recorded with their status and skipped. `reference` overrides
+    `REFERENCE`, and `backend` is that of `MassActionODE`.
+    """
+    timepoints = np.asarray(timepoints, dtype=float)
+    W = observation(crn, list(observables))[1]
+    x0 = crn.initial_state(initial_condition_dict)
+    ode = MassActionODE(crn, backend=backend)
+    reference = {**REFERENCE, **(reference or {})}
+    t_ref, y_ref, steps = _run(ode, timepoints, x0, W, np.inf, **reference)
+    scale = np.ptp(y_ref, axis=0)
+    scale[scale == 0] = 1
+    max_time = 10 * t_ref if max_time is None else max_time
+
+    rows = []
+    for method in methods:
+        for rtol in rtols:
+            for atol in atols:
+                row = {'method': method, 'rtol': rtol, 'atol': atol, 'time_s': np.nan,
+                       'error': np.nan, 'steps': None, 'status': 'ok'}
+                try:
+                    for _ in range(repeat):
+                        t, y, row['steps'] = _run(ode, timepoints, x0, W, max_time, method=method,
+                                                  rtol=rtol, atol=atol)
+                        row['time_s'] = np.fmin(row['time_s'], t)
+                    row['error'] = float((np.abs(y - y_ref) / scale).max())
+                except IntegrationAborted:
+                    row['status'] = 'timeout'
+                except (RuntimeError, ValueError, FloatingPointError) as e:
+                    row['status'] = f'failed: {e}'
+                rows.append(row)
+    return TuningReport(crn, observables, timepoints, max_error,
+                        {**reference, 'time_s': t_ref, 'steps': steps}, rows)
+
+
+def write_config(crn, report, path=None):
+    """Record `report.options` for `crn` in the solver config `path`
+    (default `SOLVER_CONFIG`), keeping the entries of other networks."""
+    path = SOLVER_CONFIG if path is None else path
+    try:
+        with open(path) as f:
+            config = json.load(f)
+    except (FileNotFoundError, ValueError):
+        config = {}
+    config[crn.digest()] = {
+        'options': report.options,
+        'max_error': report.max_error,
+        'error': report.best['error'],
+        'time_s': report.best['time_s'],
+        'reference': report.reference,
+        'observables': report.observables,
+        'timepoints': [float(report.timepoints[0]), float(report.timepoints[-1]), len(report.timepoints)],
+        'tuned': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(config, f, indent=1)
+    os.replace(tmp, path)
+    return path
+
+
+def _read_times(filename, duration):
+    #First column of a data CSV with a header row, up to `duration`
+    import pandas as pd
+
+    t = pd.read_csv(filename).iloc[:, 0].to_numpy(dtype=float)
+    t = t[t <= duration]
+    return t if t[0] == 0 else np.concatenate([[0.], t])
+
+
+def main(argv=None):
+    from .benchmark import FIXTURES
+
+    parser = argparse.ArgumentParser(prog='python -m pure_crn.tuning', description=__doc__.split('\n\n')[0])
+    parser.add_argument('fixture', choices=list(FIXTURES))
+    parser.add_argument('--observables', nargs='+', help="default the fixture's observable")
+    parser.add_argument('--error', type=float, default=1e-3, help='maximum relative error')
+    parser.add_argument('--times', help='data CSV whose first column gives the timepoints')
+    parser.add_argument('--duration', type=float, help="default the fixture's (3 h with --times)")
+    parser.add_argument('--timepoints', type=int, default=61)
+    parser.add_argument('--methods', nargs='+', default=METHODS)
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--config', help=f'solver config to update (default {SOLVER_CONFIG})')
+    parser.add_argument('--report', help='csv of the whole grid')
+    parser.add_argument('--dry-run', action='store_true', help='do not write the config')
+    args = parser.parse_args(argv)
+
+    from .network import CRNBuilder
+
+    fixture = FIXTURES[args.fixture]
+    builder = CRNBuilder()
+    fixture['build'](builder)
+    crn = builder.compile()
+    if args.times:
+        timepoints = _read_times(args.times, args.duration or 3 * 3600.)
+    else:
+        timepoints = np.linspace(0, args.duration or fixture['duration'], args.timepoints)
+    report = tune(crn, timepoints, fixture['initial'](), args.observables or [fixture['observable']],
+                  args.error, args.methods, repeat=args.repeat)
+    frame = report.to_frame()
+    if args.report:
+        frame.to_csv(args.report, index=False)
+    print(frame.head(10).to_string(index=False))
+    print(report)
+    if report.best is not None and not args.dry_run:
+        print('Wrote', write_config(crn, report, args.config))
+
+
+if __name__ == '__main__':
+    main()
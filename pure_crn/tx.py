@@ -0,0 +1,129 @@
+"""T7 transcription (TX) network, one elongation step per nucleotide.
+
+Port of the TX cells of `Models/CRN_PURE_MGaptTXonly.ipynb`: T7RNAP binds the
+DNA with GTP, then for every nucleotide the polymerase binds the NTP, adds it
+and releases PPi. The reporter aptamer (MGapt) is released once the aptamer
+has been transcribed and the finished transcript leaves as `mRNA_i`/`mRNA_t`.
+
+With ``lumped=n`` the per-nucleotide chain is replaced by `n` elongation
+stages, so the network size no longer grows with the gene length. Stage
+``s`` covers a segment of the transcript. For each NTP type in the segment,
+the stage waits for one NTP binding (``k_ntpbound / count``, catalytic in the
+NTP), then adds and releases (``k_ntpadd / length``, ``k_ntpdis / length``).
+This keeps the mean elongation time of the full chain. The nucleotides
+consumed are produced as `<NTP>_pending`, which draws down the NTP pool
+through ``<NTP>_pending + NTP -> 0`` (`k_ntpbound`). The ATP/GTP/CTP/UTP and
+PPi totals of a transcript are therefore those of its sequence. The rates
+are fixed multiples (`rate_scale`) of the eight shared TX parameters.
+Stage boundaries fall after the reporter position, so `MGapt` is released
+when it is in the full model. `txtl.compare_lumped` measures the error
+against the full network.
+"""
+import numpy as np
+
+from .network import CRNBuilder
+from .parameters import TX_PARAMETERS, TX_PARAMETER_NAMES
+from .sequence import get_transcript, reporter_position as find_reporter
+
+
+def add_tx_reactions(builder, dna_seq, params=None, reporter_position=None,
+                     reporter='MGapt', suffix='', lumped=None):
+    """Add the TX reactions for `dna_seq` to `builder`.
+
+    `reporter_position` is the transcript step at which `reporter` is released;
+    by default it is located from the MGapt motif (no reporter if absent).
+    `suffix` is appended to the TX small molecules (NTPs, GDP, PPi, PO4), e.g.
+    ``'_tx'`` for the split-pool models. `lumped` is the number of elongation
+    stages of the reduced model (None for one step per nucleotide).
+    """
+    if not dna_seq:
+        raise ValueError('Empty DNA sequence')
+    params = TX_PARAMETERS if params is None else params
+    if reporter_position is None:
+        reporter_position = find_reporter(dna_seq)
+    for name in TX_PARAMETER_NAMES:
+        builder.add_parameter(name, params[name])
+    rxn = builder.add_reaction
+    gtp, gdp, ppi, po4 = 'GTP' + suffix, 'GDP' + suffix, 'PPi' + suffix, 'PO4' + suffix
+    rna_seq = [ntp + suffix for ntp in get_transcript(dna_seq)]
+
+    builder.add_species('T7RNAP', 'DNA', 'mRNA_i', 'mRNA_t')
+    if reporter_position is not None:
+        builder.add_species(reporter)
+    builder.add_species('ATP' + suffix, gtp, 'CTP' + suffix, 'UTP' + suffix, gdp, ppi, po4,
+                        'T7RNAP_bound_GTP', 'T7RNAP_bound', 'T7RNAP_bound_GDP_PO4')
+
+    #Binding of RNAP and beginning of transcription
+    rxn(['T7RNAP', 'DNA', gtp], ['T7RNAP_bound_GTP'], 'k_rnapbF1')
+    rxn(['T7RNAP_bound_GTP'], ['T7RNAP_bound_GDP_PO4'], 'k_rnapbF2')
+    rxn(['T7RNAP_bound_GDP_PO4'], ['T7RNAP_bound', gdp, po4], 'k_rnapbF3')
+
+    if lumped is not None:
+        _add_lumped_elongation(builder, rna_seq, lumped, reporter_position, reporter, ppi)
+        return
+
+    #Loop over the mRNA sequence
+    nt_len = len(rna_seq)
+    for L, ntp in enumerate(rna_seq):
+        mrna0 = 'T7RNAP_bound_mRNA' + str(L).zfill(4)  #starting mRNA
+        mrnaG = 'T7RNAP_bound_mRNA' + str(L + 1).zfill(4)  #growing mRNA
+        if L == 0:
+            rxn(['T7RNAP_bound'], [mrna0], 'k_start')
+        released = [mrnaG, ppi]
+        if L == reporter_position and 0 < L < nt_len - 1:
+            released.append(reporter)
+        rxn([mrna0, ntp], [mrna0 + '_' + ntp], 'k_ntpbound')
+        rxn([mrna0 + '_' + ntp], [mrnaG + '_PPi'], 'k_ntpadd')
+        rxn([mrnaG + '_PPi'], released, 'k_ntpdis')
+    #Termination of mRNA strand
+    rxn([mrnaG], ['T7RNAP', 'DNA', 'mRNA_i', 'mRNA_t'], 'k_term')
+
+
+def _add_lumped_elongation(builder, rna_seq, n_stages, reporter_position, reporter, ppi):
+    rxn = builder.add_reaction
+    nt_len = len(rna_seq)
+    if n_stages < 1:
+        raise ValueError(f'lumped must be a positive number of stages, not {n_stages}')
+    bounds = np.linspace(0, nt_len, min(n_stages, nt_len) + 1).round().astype(int)
+    releases_reporter = reporter_position is not None and 0 < reporter_position < nt_len - 1
+    if releases_reporter:
+        bounds = np.union1d(bounds, [reporter_position + 1])
+    ntps = sorted(set(rna_seq), key=rna_seq.index)
+    for ntp in ntps:
+        rxn([ntp + '_pending', ntp], [], 'k_ntpbound')
+
+    stage = 'T7RNAP_bound_stage0000'
+    rxn(['T7RNAP_bound'], [stage], 'k_start')
+    for s, (start, end) in enumerate(zip(bounds[:-1], bounds[1:])):
+        segment = rna_seq[start:end]
+        length = len(segment)
+        state = stage
+        #One NTP binding per NTP type, at the mean rate of its `count` nucleotides
+        for ntp in ntps:
+            count = segment.count(ntp)
+            if count:
+                rxn([state, ntp], [state + '_' + ntp, ntp], 'k_ntpbound', scale=1 / count)
+                state += '_' + ntp
+        pending = [ntp + '_pending' for ntp in segment]
+        rxn([state], [stage + '_PPi'] + pending, 'k_ntpadd', scale=1 / length)
+        next_stage = 'T7RNAP_bound_stage' + str(s + 1).zfill(4)
+        released = [next_stage] + [ppi] * length
+        if releases_reporter and end == reporter_position + 1:
+            released.append(reporter)
+        rxn([stage + '_PPi'], released, 'k_ntpdis', scale=1 / length)
+        stage = next_stage
+    #Termination of mRNA strand
+    rxn([stage], ['T7RNAP', 'DNA', 'mRNA_i', 'mRNA_t'], 'k_term')
+
+
+def build_tx_crn(dna_seq, params=None, reporter_position=None, reporter='MGapt', suffix='',
+                 lumped=None):
+    """Compile the TX-only network for `dna_seq`.
+
+    `params` maps the eight TX rate names (`k_rnapbF1` ... `k_term`) to values
+    and defaults to `parameters.TX_PARAMETERS`. `lumped` gives the reduced
+    model with that many elongation stages.
+    """
+    builder = CRNBuilder()
+    add_tx_reactions(builder, dna_seq, params, reporter_position, reporter, suffix, lumped)
+    return builder.compile()
@@ -0,0 +1,77 @@
+"""Coupled transcription-translation (TXTL) networks.
+
+Combines `tx` and `tl` as in the notebooks' `Combine_PURE` networks: the TX
+and TL species share the NTP/PPi/PO4 pools (unless `split`), the finished
+protein folds into `deGFP_m` and the transcript `mRNA_i` is handed to TL as
+`mRNA` through the linker reaction.
+
+`compare_lumped` checks the reduced TX elongation model (``lumped=n``, see
+`tx`) against the full network for a given sequence.
+"""
+import numpy as np
+
+from .network import CRNBuilder
+from .ode import simulate
+from .parameters import K_FOLD, K_LINKER
+from .tl import add_tl_reactions
+from .tx import add_tx_reactions, build_tx_crn
+
+
+def add_txtl_reactions(builder, dna_seq, protein=None, params=None, rxn_k=None,
+                       k_fold=K_FOLD, k_linker=K_LINKER, split=False,
+                       reporter_position=None, amino_acids=None, folded='deGFP_m', lumped=None):
+    """Add TX, TL and the coupling reactions to `builder`.
+
+    With ``protein=None`` this is the MGapt TXwTL model (TX plus the TL
+    background, no coupling). With `protein` the elongation of that protein,
+    its folding into `folded` (`k_fold`) and the mRNA linker (`k_linker`) are
+    added. `split` gives TX its own `_tx` NTP pool and tracks the folded
+    `Peptide` and linked `mRNA_d` totals, as in the Split nucleus simulations.
+    `lumped` is the number of TX elongation stages of the reduced model.
+    """
+    add_tx_reactions(builder, dna_seq, params, reporter_position,
+                     suffix='_tx' if split else '', lumped=lumped)
+    peptide = add_tl_reactions(builder, protein, rxn_k, amino_acids)
+    if peptide is None:
+        return
+    builder.add_species(folded)
+    builder.add_reaction([peptide], [folded, 'Peptide'] if split else [folded],
+                         'k_fold', k_fold)
+    builder.add_reaction(['mRNA_i'], ['mRNA', 'mRNA_d'] if split else ['mRNA'],
+                         'k_linker', k_linker)
+
+
+def build_txtl_crn(dna_seq, protein=None, params=None, rxn_k=None, **kwargs):
+    """Compile the TXTL network; see `add_txtl_reactions` for options.
+
+    `params` are the TX rates (`k_rnapbF1` ... `k_term`) and `rxn_k` the TL
+    rates keyed by reaction id.
+    """
+    builder = CRNBuilder()
+    add_txtl_reactions(builder, dna_seq, protein, params, rxn_k, **kwargs)
+    return builder.compile()
+
+
+def compare_lumped(dna_seq, timepoints, initial_condition_dict, lumped=32, protein=None,
+                   observables=None, **kwargs):
+    """Simulate the full and the `lumped` network for `dna_seq` and compare.
+
+    Without `protein` these are TX-only networks observed at `MGapt`. With
+    `protein` they are TXTL networks observed at `MGapt` and the folded
+    protein. `kwargs` go to `build_tx_crn` or `build_txtl_crn`. Returns
+    ``{observable: max |lumped - full| / max |full|}``.
+    """
+    if protein is None:
+        full = build_tx_crn(dna_seq, **kwargs)
+        reduced = build_tx_crn(dna_seq, lumped=lumped, **kwargs)
+        observables = ['MGapt'] if observables is None else list(observables)
+    else:
+        full = build_txtl_crn(dna_seq, protein, **kwargs)
+        reduced = build_txtl_crn(dna_seq, protein, lumped=lumped, **kwargs)
+        if observables is None:
+            observables = ['MGapt', kwargs.get('folded', 'deGFP_m')]
+    y_full = simulate(full, timepoints, initial_condition_dict, observables=observables)
+    y_reduced = simulate(reduced, timepoints, initial_condition_dict, observables=observables)
+    return {name: float(np.abs(y_reduced[name] - y_full[name]).max() /
+                        max(np.abs(y_full[name]).max(), np.finfo(float).tiny))
+            for name in observables}
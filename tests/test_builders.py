@@ -0,0 +1,45 @@
+import os
+from collections import defaultdict
+
+import numpy as np
+import pytest
+
+from pure_crn import MGAPT_DNA, TX_PARAMETERS, TX_PARAMETERS_TXONLY, build_tx_crn, build_txtl_crn
+
+libsbml = pytest.importorskip('libsbml')
+
+MODELS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Models')
+
+
+def _sbml_network(filename):
+    #Species ids and {(reactants, products): rate constants} of the notebooks' BioCRNpyler export
+    model = libsbml.readSBMLFromFile(filename).getModel()
+    reactions = defaultdict(list)
+    for r in model.getListOfReactions():
+        (k,) = [p.getValue() for p in r.getKineticLaw().getListOfLocalParameters()]
+        side = [tuple(sorted(s.getSpecies() for s in refs for _ in range(int(s.getStoichiometry()))))
+                for refs in (r.getListOfReactants(), r.getListOfProducts())]
+        reactions[tuple(side)].append(k)
+    return {s.getId() for s in model.getListOfSpecies()}, reactions
+
+
+def _crn_network(crn):
+    reactions = defaultdict(list)
+    for r, k in enumerate(crn.k):
+        reactants, products, _ = crn.reaction(r)
+        reactions[tuple(sorted(reactants)), tuple(sorted(products))].append(k)
+    return set(crn.species), reactions
+
+
+@pytest.mark.parametrize('name, build', [
+    ('CRN_PURE_MGaptTXonly', lambda: build_tx_crn(MGAPT_DNA, TX_PARAMETERS_TXONLY)),
+    ('CRN_PURE_MGaptTXwTL', lambda: build_txtl_crn(MGAPT_DNA, params=TX_PARAMETERS))])
+def test_builders_match_notebook_networks(name, build):
+    crn = build()
+    species, reactions = _sbml_network(os.path.join(MODELS_DIR, f'{name}.xml'))
+    assert crn.n_reactions == sum(len(k) for k in reactions.values())
+    got_species, got = _crn_network(crn)
+    assert got_species == species
+    assert got.keys() == reactions.keys()
+    for key, k in reactions.items():
+        np.testing.assert_allclose(sorted(got[key]), sorted(k), rtol=1e-6, err_msg=str(key))
@@ -0,0 +1,88 @@
+import os
+import shutil
+
+import numpy as np
+
+from pure_crn import MGAPT_DNA, TX_PARAMETERS, ModelCache, SnapshotCache, cache as cache_module
+from pure_crn.parameters import RATE_CONSTANTS_FILE
+
+
+def _count_builds(monkeypatch):
+    builds = []
+    build = cache_module.build_txtl_crn
+    monkeypatch.setattr(cache_module, 'build_txtl_crn', lambda *a, **kw: builds.append(a) or build(*a, **kw))
+    return builds
+
+
+def test_model_cache_hit(tmp_path, monkeypatch):
+    builds = _count_builds(monkeypatch)
+    cache = ModelCache(str(tmp_path))
+    crn = cache.load(MGAPT_DNA)
+    cached = cache.load(MGAPT_DNA)
+    assert len(builds) == 1
+    assert cached.digest() == crn.digest()
+    np.testing.assert_array_equal(cached.k, crn.k)
+    #A fresh cache on the same directory hits too
+    assert ModelCache(str(tmp_path)).load(MGAPT_DNA).digest() == crn.digest()
+    assert len(builds) == 1
+
+
+def test_model_cache_invalidation(tmp_path, monkeypatch):
+    builds = _count_builds(monkeypatch)
+    cache = ModelCache(str(tmp_path / 'cache'))
+    rate_file = str(tmp_path / 'rates.csv')
+    shutil.copy(RATE_CONSTANTS_FILE, rate_file)
+    key = cache.key(MGAPT_DNA, rate_file=rate_file)
+    crn = cache.load(MGAPT_DNA, rate_file=rate_file)
+    assert cache.key(MGAPT_DNA, protein='MGG', rate_file=rate_file) != key
+    assert cache.key(MGAPT_DNA, params={**TX_PARAMETERS, 'k_term': 1.}, rate_file=rate_file) != key
+    assert cache.key(MGAPT_DNA, rate_file=rate_file, lumped=8) != key
+    monkeypatch.setattr(cache_module, 'BUILDER_VERSION', cache_module.BUILDER_VERSION + 1)
+    assert cache.key(MGAPT_DNA, rate_file=rate_file) != key
+    monkeypatch.undo()
+    builds = _count_builds(monkeypatch)
+
+    #Editing the rate file changes the key and rebuilds with the new value
+    with open(rate_file) as f:
+        rows = f.read().splitlines()
+    i = next(i for i, row in enumerate(rows) if row.split(',')[0] in crn.parameter_index)
+    rows[i] = rows[i].split(',')[0] + ',12345.0'
+    with open(rate_file, 'w') as f:
+        f.write('\n'.join(rows) + '\n')
+    assert cache.key(MGAPT_DNA, rate_file=rate_file) != key
+    rebuilt = cache.load(MGAPT_DNA, rate_file=rate_file)
+    assert len(builds) == 1
+    assert rebuilt.species == crn.species
+    np.testing.assert_array_equal(rebuilt.reactant_idx, crn.reactant_idx)
+    assert 12345. in rebuilt.k and 12345. not in crn.k
+
+
+def test_model_cache_corrupt_entry_is_rebuilt(tmp_path, monkeypatch):
+    builds = _count_builds(monkeypatch)
+    cache = ModelCache(str(tmp_path))
+    crn = cache.load(MGAPT_DNA)
+    with open(cache.path(cache.key(MGAPT_DNA)), 'wb') as f:
+        f.write(b'not a network')
+    assert cache.load(MGAPT_DNA).digest() == crn.digest()
+    assert len(builds) == 2
+
+
+def test_eviction_keeps_the_entry_just_written(tmp_path):
+    cache = SnapshotCache(str(tmp_path), max_bytes=1)
+    cache.put('a', [0.], np.zeros((1, 10)))
+    cache.put('b', [0.], np.ones((1, 10)))
+    assert cache.get('a') is None
+    times, states = cache.get('b')
+    np.testing.assert_array_equal(states, np.ones((1, 10)))
+
+
+def test_eviction_removes_least_recently_used(tmp_path):
+    cache = SnapshotCache(str(tmp_path))
+    for i, key in enumerate('abc'):
+        cache.put(key, [0.], np.zeros((1, 100)))
+        os.utime(cache.path(key), (i, i))
+    sizes = {path[-5]: size for _, size, path in cache.entries()}
+    cache.max_bytes = sizes['b'] + sizes['c']
+    cache.evict()
+    assert cache.get('a') is None
+    assert cache.get('b') is not None and cache.get('c') is not None
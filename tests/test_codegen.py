@@ -0,0 +1,48 @@
+import os
+
+import numpy as np
+import pytest
+
+from pure_crn import MGAPT_DNA, TX_INITIAL_CONDITIONS, TX_PARAMETERS_TXONLY, MassActionODE, build_tx_crn
+from pure_crn import codegen
+from pure_crn.likelihood import Experiment
+
+
+@pytest.fixture(scope='module')
+def crn():
+    return build_tx_crn(MGAPT_DNA, TX_PARAMETERS_TXONLY)
+
+
+@pytest.fixture
+def kernel_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv('PURE_CRN_BACKEND', raising=False)
+    monkeypatch.setattr(codegen, 'DEFAULT_KERNEL_DIR', str(tmp_path))
+    return tmp_path
+
+
+def test_experiment_does_not_compile_by_default(crn, kernel_dir):
+    e = Experiment(crn, [0., 60.], np.zeros((1, 2)), ['MGapt'], initial_condition_dict=TX_INITIAL_CONDITIONS)
+    assert e._ode.kernel is None
+    assert not os.listdir(kernel_dir)
+
+
+def test_failed_build_falls_back_to_numpy(crn, kernel_dir, monkeypatch):
+    monkeypatch.setenv('CC', 'no-such-compiler')
+    ode = MassActionODE(crn, backend='compile')
+    assert ode.kernel is None
+    x = crn.initial_state(TX_INITIAL_CONDITIONS)
+    assert np.all(np.isfinite(ode.rhs(0., x)))
+
+
+@pytest.mark.skipif(codegen.compiler() is None, reason='no C compiler')
+def test_compiled_kernel_matches_numpy(crn, kernel_dir):
+    compiled = MassActionODE(crn, backend='compile')
+    assert compiled.kernel is not None
+    numpy_ode = MassActionODE(crn, backend='numpy')
+    rng = np.random.default_rng(0)
+    x = rng.random(crn.n_species)
+    np.testing.assert_allclose(compiled.rhs(0., x), numpy_ode.rhs(0., x), rtol=1e-12, atol=1e-15)
+    np.testing.assert_allclose(compiled.jacobian(0., x).toarray(), numpy_ode.jacobian(0., x).toarray(),
+                               rtol=1e-12, atol=1e-15)
+    #A cached kernel is picked up by the default backend
+    assert MassActionODE(crn).kernel is not None
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from pure_crn import MGAPT_DNA, TX_INITIAL_CONDITIONS, TX_PARAMETERS_TXONLY, JointLikelihood, build_tx_crn
+from pure_crn.conditions import DNA_SERIES, dna_series_experiments, read_dna_condition
+
+PARAMS = ['k_rnapbF1', 'k_rnapbF2']
+OPTIONS = {'method': 'Radau', 'rtol': 1e-6, 'atol': 1e-9, 'backend': 'numpy'}
+
+
+def test_condition_merges_observables():
+    t, data = read_dna_condition(DNA_SERIES[0], ['MGapt', 'deGFP_m'], duration=3600)
+    assert data.shape == (3, len(t), 2)
+    #MGapt and deGFP are read at alternate times, never together
+    read = np.isfinite(data[0])
+    assert np.all(read.sum(axis=1) == 1)
+    assert read[:, 0].sum() == read[:, 1].sum() == 20
+
+
+def test_one_experiment_per_condition():
+    crn = build_tx_crn(MGAPT_DNA, TX_PARAMETERS_TXONLY)
+    experiments = dna_series_experiments(crn, PARAMS, TX_INITIAL_CONDITIONS, duration=600, **OPTIONS)
+    assert len(experiments) == len(DNA_SERIES)
+    dna = crn.species_index['DNA']
+    np.testing.assert_allclose([e.x0[dna] for e in experiments], np.array(DNA_SERIES) * 1e-3)
+
+
+def test_joint_likelihood_is_the_sum():
+    crn = build_tx_crn(MGAPT_DNA, TX_PARAMETERS_TXONLY)
+    experiments = dna_series_experiments(crn, PARAMS, TX_INITIAL_CONDITIONS, concentrations=DNA_SERIES[-2:],
+                                         duration=1800, **OPTIONS)
+    theta = crn.parameter_values[experiments[0]._param_idx] * 1.5
+    serial = sum(e.log_likelihood(theta) for e in experiments)
+    with JointLikelihood(experiments, processes=2) as joint:
+        assert joint.log_likelihood(theta) == pytest.approx(serial, rel=1e-12)
+        ll, grad = joint.gradient(theta)
+    assert ll == pytest.approx(serial, rel=1e-6)
+    assert grad.shape == (len(PARAMS),)
@@ -0,0 +1,18 @@
+import numpy as np
+
+from pure_crn import MGAPT_DNA, TX_INITIAL_CONDITIONS, TX_PARAMETERS_TXONLY, build_tx_crn, simulate
+from pure_crn.conservation import conservation_laws, simulate_reduced
+
+OPTIONS = {'method': 'Radau', 'rtol': 1e-8, 'atol': 1e-10}
+
+
+def test_reduced_simulation_matches_full():
+    crn = build_tx_crn(MGAPT_DNA, TX_PARAMETERS_TXONLY)
+    C, dependent = conservation_laws(crn)
+    assert abs(C @ crn.stoichiometry).max() < 1e-12
+    assert len(set(dependent)) == C.shape[0]
+    timepoints = np.linspace(0, 3600, 13)
+    full = simulate(crn, timepoints, TX_INITIAL_CONDITIONS, **OPTIONS)
+    reduced = simulate_reduced(crn, timepoints, TX_INITIAL_CONDITIONS, **OPTIONS)
+    np.testing.assert_allclose(reduced[crn.species].to_numpy(), full[crn.species].to_numpy(),
+                               rtol=1e-5, atol=1e-8)
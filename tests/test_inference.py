@@ -0,0 +1,59 @@
+import emcee
+import numpy as np
+import pytest
+
+from pure_crn.inference import load_checkpoint, run_sampler
+
+NWALKERS, NDIM, NSTEPS = 8, 2, 20
+
+
+class Killed(Exception):
+    pass
+
+
+class Gaussian:
+    """Standard normal log-density that raises `Killed` on call `kill_at`."""
+
+    def __init__(self, kill_at=None):
+        self.calls = 0
+        self.kill_at = kill_at
+
+    def __call__(self, theta):
+        self.calls += 1
+        if self.calls == self.kill_at:
+            raise Killed
+        return -.5 * np.sum(theta ** 2)
+
+
+def _start():
+    rng = np.random.RandomState(0)
+    return emcee.State(rng.standard_normal((NWALKERS, NDIM)), random_state=rng.get_state())
+
+
+def _run(directory, log_prob_fn, resume=False):
+    files = {'filename_csv': str(directory / 'chain.csv'), 'filename_txt': str(directory / 'chain.txt'),
+             'checkpoint': str(directory / 'checkpoint.npz')}
+    run_sampler(log_prob_fn, _start(), NSTEPS, progress=False, checkpoint_every=5, resume=resume, **files)
+    return files
+
+
+def test_resume_is_byte_identical(tmp_path):
+    (tmp_path / 'straight').mkdir()
+    (tmp_path / 'resumed').mkdir()
+    straight = _run(tmp_path / 'straight', Gaussian())
+    #Killed during step 14: the last checkpoint is at step 10, the csv holds 13 steps
+    with pytest.raises(Killed):
+        _run(tmp_path / 'resumed', Gaussian(kill_at=NWALKERS * 14 + 1))
+    assert load_checkpoint(str(tmp_path / 'resumed' / 'checkpoint.npz'))[1] == 10
+    resumed = _run(tmp_path / 'resumed', Gaussian(), resume=True)
+    for name in ('filename_csv', 'filename_txt'):
+        with open(straight[name], 'rb') as a, open(resumed[name], 'rb') as b:
+            assert a.read() == b.read()
+
+
+def test_resume_rejects_other_walkers(tmp_path):
+    _run(tmp_path, Gaussian())
+    with pytest.raises(ValueError, match='walkers'):
+        run_sampler(Gaussian(), np.zeros((NWALKERS + 2, NDIM)), NSTEPS, progress=False,
+                    filename_csv=str(tmp_path / 'chain.csv'), filename_txt=str(tmp_path / 'chain.txt'),
+                    checkpoint=str(tmp_path / 'checkpoint.npz'), resume=True)
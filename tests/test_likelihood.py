@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from pure_crn import (MGAPT_DNA, TX_INITIAL_CONDITIONS, TX_PARAMETERS_TXONLY, Experiment,
+                      build_tx_crn, simulate)
+
+OPTIONS = {'method': 'Radau', 'rtol': 1e-6, 'atol': 1e-9}
+PARAMS = ['k_rnapbF1', 'k_rnapbF2']
+
+
+@pytest.fixture(scope='module')
+def experiment():
+    crn = build_tx_crn(MGAPT_DNA, TX_PARAMETERS_TXONLY)
+    timepoints = np.linspace(0, 3600, 13)
+    y = simulate(crn, timepoints, TX_INITIAL_CONDITIONS, observables=['MGapt'], **OPTIONS)
+    y = y['MGapt'].to_numpy()
+    data = y[None, :, None] * np.array([.95, 1., 1.05])[:, None, None]
+    return Experiment(crn, timepoints, data, ['MGapt'], PARAMS, TX_INITIAL_CONDITIONS,
+                      backend='numpy', **OPTIONS)
+
+
+def test_log_likelihood_is_finite_at_the_truth(experiment):
+    theta = experiment.crn.parameter_values[experiment._param_idx]
+    assert np.isfinite(experiment.log_likelihood(theta))
+    assert experiment.log_likelihood(theta) > experiment.log_likelihood(theta * 3)
+
+
+@pytest.mark.parametrize('theta', [[1.], [1., 2., 3.], [[1., 2.]]])
+def test_malformed_theta_raises(experiment, theta):
+    with pytest.raises(ValueError, match='theta has shape'):
+        experiment.log_likelihood(theta)
+    with pytest.raises(ValueError, match='theta has shape'):
+        experiment.gradient(theta)
+
+
+def test_failed_integration_is_minus_inf(experiment):
+    assert experiment.log_likelihood([np.nan, 1.]) == -np.inf
+    assert experiment.gradient([np.nan, 1.])[0] == -np.inf
+
+
+def test_aborted_integration_is_minus_inf(experiment):
+    theta = experiment.crn.parameter_values[experiment._param_idx]
+    experiment.max_chi2 = 1e-3
+    try:
+        assert experiment.log_likelihood(theta * 10) == -np.inf
+    finally:
+        experiment.max_chi2 = None
+
+
+def test_gaussian_log_likelihood(experiment):
+    from scipy.stats import norm
+
+    y = experiment.simulate()
+    expected = norm.logpdf(experiment.data, y, experiment.sigma).sum()
+    assert experiment.log_likelihood() == pytest.approx(expected, rel=1e-10)
+
+
+def test_missing_readings_are_left_out(experiment):
+    #Readings missing at some timepoints weigh as if those timepoints were never measured
+    data = experiment.data.copy()
+    data[:, 1::2] = np.nan
+    kwargs = dict(observables=['MGapt'], params_to_estimate=PARAMS, initial_condition_dict=TX_INITIAL_CONDITIONS,
+                  sigma=.1, t0=0., backend='numpy', **OPTIONS)
+    masked = Experiment(experiment.crn, experiment.timepoints, data, **kwargs)
+    kept = Experiment(experiment.crn, experiment.timepoints[::2], experiment.data[:, ::2], **kwargs)
+    theta = experiment.crn.parameter_values[experiment._param_idx] * 1.2
+    assert masked.log_likelihood(theta) == pytest.approx(kept.log_likelihood(theta), rel=1e-8)
+    np.testing.assert_allclose(masked.gradient(theta)[1], kept.gradient(theta)[1], rtol=1e-4)
+    np.testing.assert_allclose(masked.fisher_information(theta), kept.fisher_information(theta), rtol=1e-4)
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from pure_crn import (MGAPT_DNA, TX_INITIAL_CONDITIONS, TX_PARAMETERS_TXONLY, MutableModel,
+                      SnapshotCache, build_tx_crn)
+
+OPTIONS = {'method': 'Radau', 'rtol': 1e-8, 'atol': 1e-10}
+
+
+@pytest.fixture(scope='module')
+def model():
+    return MutableModel(build_tx_crn(MGAPT_DNA, TX_PARAMETERS_TXONLY), TX_INITIAL_CONDITIONS)
+
+
+def test_snapshots_do_not_change_the_run(tmp_path, model):
+    timepoints = np.linspace(600, 3600, 6)
+    plain = model.integrate(timepoints, observables=['MGapt'], **OPTIONS)
+    cache = SnapshotCache(str(tmp_path))
+    y = model.integrate(timepoints, cache=cache, snapshots=[900, 3600], observables=['MGapt'], **OPTIONS)
+    np.testing.assert_allclose(y, plain, rtol=1e-6, atol=1e-9)
+    key = model.snapshot_key(cache, t0=600., **OPTIONS)
+    np.testing.assert_array_equal(cache.get(key)[0], [900, 3600])
+
+
+@pytest.mark.parametrize('snapshots', [[0.], [1200., 7200.]])
+def test_snapshots_outside_timepoints_are_rejected(tmp_path, model, snapshots):
+    with pytest.raises(ValueError, match='snapshots must lie within'):
+        model.integrate(np.linspace(600, 3600, 6), cache=SnapshotCache(str(tmp_path)),
+                        snapshots=snapshots, **OPTIONS)
@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+
+from pure_crn import MGAPT_DNA, TX_INITIAL_CONDITIONS, TX_PARAMETERS_TXONLY, build_tx_crn, simulate
+
+simulator = pytest.importorskip('bioscrape.simulator')
+
+
+@pytest.mark.filterwarnings('ignore:Excess work done')
+@pytest.mark.parametrize('lumped', [None, 16])
+def test_ode_matches_bioscrape(lumped):
+    #The lumped network exercises the scaled-rate ('general') reactions
+    crn = build_tx_crn(MGAPT_DNA, TX_PARAMETERS_TXONLY, lumped=lumped)
+    timepoints = np.linspace(0, 3600, 13)
+    expected = simulator.py_simulate_model(timepoints, Model=crn.to_bioscrape_model(TX_INITIAL_CONDITIONS))
+    got = simulate(crn, timepoints, TX_INITIAL_CONDITIONS, rtol=1e-8, atol=1e-10)
+    np.testing.assert_allclose(got[crn.species].to_numpy(), expected[crn.species].to_numpy(),
+                               rtol=1e-5, atol=1e-6)
+    assert got['MGapt'].iloc[-1] > 1
@@ -0,0 +1,35 @@
+import numpy as np
+
+from pure_crn import CRNBuilder, MassActionODE, simulate
+from pure_crn.benchmark import FIXTURES
+from pure_crn.prune import prune
+
+OPTIONS = {'rtol': 1e-8, 'atol': 1e-10}
+
+
+def _fmgg():
+    #fMGG TL with the example's initial state: blocks of absent amino acids are unreachable
+    fixture = FIXTURES['tl_fMGG']
+    builder = CRNBuilder()
+    fixture['build'](builder)
+    return builder.compile(), fixture['initial']()
+
+
+def test_pruned_network_has_the_same_dynamics():
+    crn, initial = _fmgg()
+    pruned, report = prune(crn, initial)
+    assert report.removed_species and len(report.removed_reactions)
+    assert pruned.species == [crn.species[i] for i in report.species]
+
+    #The right-hand sides agree exactly wherever the removed species are zero
+    x = np.zeros(crn.n_species)
+    x[report.species] = np.random.default_rng(0).uniform(0, 10, len(report.species))
+    np.testing.assert_array_equal(MassActionODE(pruned).rhs(0, x[report.species]),
+                                  MassActionODE(crn).rhs(0, x)[report.species])
+
+    timepoints = np.linspace(0, 600, 5)
+    full = simulate(crn, timepoints, initial, **OPTIONS)
+    reduced = simulate(pruned, timepoints, initial, **OPTIONS)
+    np.testing.assert_allclose(reduced[pruned.species].to_numpy(), full[pruned.species].to_numpy(),
+                               rtol=1e-5, atol=1e-9)
+    assert np.abs(full[report.removed_species].to_numpy()).max() < 1e-12
@@ -0,0 +1,130 @@
+import csv
+import os
+
+import pytest
+
+from pure_crn.sbml import globalize_parameters, update_model_local_to_global_params
+
+libsbml = pytest.importorskip('libsbml')
+
+MODELS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Models')
+
+
+def _summary(filename):
+    #(global parameter values, kinetic-law formulas, number of local parameters)
+    model = libsbml.readSBMLFromFile(filename).getModel()
+    params = {p.getId(): p.getValue() for p in model.getListOfParameters()}
+    laws = {r.getId(): libsbml.formulaToL3String(r.getKineticLaw().getMath())
+            for r in model.getListOfReactions()}
+    n_local = sum(r.getKineticLaw().getNumLocalParameters() for r in model.getListOfReactions())
+    return params, laws, n_local
+
+
+def _local_model(filename, reactions):
+    #Write a model of reactions A -> B with local parameters: (reaction, id, value) for
+    #the law `id * A`, or (reaction, {id: value}, formula)
+    doc = libsbml.SBMLDocument(3, 2)
+    model = doc.createModel()
+    comp = model.createCompartment()
+    comp.setId('default')
+    comp.setConstant(True)
+    for name in ('A', 'B'):
+        s = model.createSpecies()
+        s.setId(name)
+        s.setCompartment('default')
+        s.setInitialConcentration(1.)
+        s.setHasOnlySubstanceUnits(False)
+        s.setBoundaryCondition(False)
+        s.setConstant(False)
+    for rid, local, formula in reactions:
+        if not isinstance(local, dict):
+            local, formula = {local: formula}, f'{local} * A'
+        rxn = model.createReaction()
+        rxn.setId(rid)
+        rxn.setReversible(False)
+        ref = rxn.createReactant()
+        ref.setSpecies('A')
+        ref.setConstant(True)
+        ref = rxn.createProduct()
+        ref.setSpecies('B')
+        ref.setConstant(True)
+        law = rxn.createKineticLaw()
+        for pid, value in local.items():
+            p = law.createLocalParameter()
+            p.setId(pid)
+            p.setValue(value)
+        law.setMath(libsbml.parseL3Formula(formula))
+    assert libsbml.writeSBMLToFile(doc, filename)
+    return filename
+
+
+@pytest.mark.parametrize('name', ['CRN_PURE_MGaptTXonly', 'CRN_PURE_MGaptTXwTL'])
+def test_globalize_matches_checked_in_models(tmp_path, name):
+    out = str(tmp_path / f'{name}_updated.xml')
+    identity = globalize_parameters(os.path.join(MODELS_DIR, f'{name}.xml'), out)
+    params, laws, n_local = _summary(out)
+    expected = _summary(os.path.join(MODELS_DIR, f'{name}_updated.xml'))
+    assert params == expected[0]
+    assert laws == expected[1]
+    assert n_local == 0
+    assert {gid for _, _, _, gid in identity} <= set(params)
+    with open(str(tmp_path / f'{name}_updated_parameters.csv')) as f:
+        assert len(list(csv.reader(f))) == len(identity) + 1
+
+
+def test_shared_value_different_ids(tmp_path):
+    filename = _local_model(str(tmp_path / 'm.xml'), [('r0', 'k_forward', 1.), ('r1', 'k_reverse', 1.),
+                                                        ('r2', 'k_forward', 2.)])
+    with pytest.warns(UserWarning, match='r1:k_reverse -> k_forward'):
+        identity = globalize_parameters(filename, str(tmp_path / 'value.xml'), key='value')
+    assert [gid for _, _, _, gid in identity] == ['k_forward', 'k_forward', 'k_forward1']
+    params, laws, _ = _summary(str(tmp_path / 'value.xml'))
+    assert params == {'k_forward': 1., 'k_forward1': 2.}
+    assert laws == {'r0': 'k_forward * A', 'r1': 'k_forward * A', 'r2': 'k_forward1 * A'}
+
+    identity = globalize_parameters(filename, str(tmp_path / 'reaction.xml'), key='reaction')
+    assert [gid for _, _, _, gid in identity] == ['r0_k_forward', 'r1_k_reverse', 'r2_k_forward']
+    params, laws, _ = _summary(str(tmp_path / 'reaction.xml'))
+    assert params == {'r0_k_forward': 1., 'r1_k_reverse': 1., 'r2_k_forward': 2.}
+    assert laws['r1'] == 'r1_k_reverse * A'
+
+
+def _rates(filename, species):
+    #Kinetic laws evaluated with the global and local parameter values and `species` values
+    model = libsbml.readSBMLFromFile(filename).getModel()
+    values = {**{p.getId(): p.getValue() for p in model.getListOfParameters()}, **species}
+    rates = {}
+    for r in model.getListOfReactions():
+        law = r.getKineticLaw()
+        local = {p.getId(): p.getValue() for p in law.getListOfLocalParameters()}
+        rates[r.getId()] = eval(libsbml.formulaToL3String(law.getMath()), {}, {**values, **local})
+    return rates
+
+
+@pytest.mark.filterwarnings('ignore:.*merged by value')
+@pytest.mark.parametrize('key', ['value', 'reaction'])
+def test_renames_do_not_chain(tmp_path, key):
+    #r1's k_reverse is renamed to k_forward while its own k_forward is renamed away
+    filename = _local_model(str(tmp_path / 'm.xml'), [
+        ('r0', 'k_forward', 1.),
+        ('r1', {'k_reverse': 1., 'k_forward': 3.}, 'k_forward * A - k_reverse * B')])
+    out = str(tmp_path / 'out.xml')
+    identity = globalize_parameters(filename, out, key=key)
+    species = {'A': 2., 'B': 5.}
+    assert _rates(out, species) == _rates(filename, species) == {'r0': 2., 'r1': 1.}
+    if key == 'value':
+        assert [gid for _, _, _, gid in identity] == ['k_forward', 'k_forward', 'k_forward1']
+        assert _summary(out)[1]['r1'] == 'k_forward1 * A - k_forward * B'
+
+
+def test_same_id_same_value_does_not_warn(tmp_path, recwarn):
+    filename = _local_model(str(tmp_path / 'm.xml'), [('r0', 'k', 1.), ('r1', 'k', 1.)])
+    globalize_parameters(filename, str(tmp_path / 'out.xml'))
+    assert not [w for w in recwarn if issubclass(w.category, UserWarning)]
+    assert _summary(str(tmp_path / 'out.xml'))[0] == {'k': 1.}
+
+
+def test_notebook_drop_in(tmp_path):
+    filename = _local_model(str(tmp_path / 'm.xml'), [('r0', 'k', 3.)])
+    update_model_local_to_global_params(filename)
+    assert _summary(str(tmp_path / 'm_updated.xml'))[:2] == ({'k': 3.}, {'r0': 'k * A'})
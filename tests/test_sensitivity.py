@@ -0,0 +1,31 @@
+import numpy as np
+
+from pure_crn import MGAPT_DNA, TX_INITIAL_CONDITIONS, TX_PARAMETERS_TXONLY, build_tx_crn, sensitivities, simulate
+
+PARAMS = ['k_rnapbF1', 'k_start', 'k_ntpadd', 'k_term']
+
+
+def test_sensitivities_match_finite_differences():
+    crn = build_tx_crn(MGAPT_DNA, TX_PARAMETERS_TXONLY)
+    timepoints = np.linspace(0, 1800, 4)
+    S = sensitivities(crn, timepoints, TX_INITIAL_CONDITIONS, params=PARAMS, observables=['MGapt'],
+                      rtol=1e-8, atol=1e-10)
+    assert S.shape == (len(timepoints), len(PARAMS), 1)
+    #Central differences; much smaller steps drown in solver error
+    fd = np.empty_like(S)
+    for j, name in enumerate(PARAMS):
+        h = 1e-3 * TX_PARAMETERS_TXONLY[name]
+        up, down = (simulate(crn, timepoints, TX_INITIAL_CONDITIONS, {name: TX_PARAMETERS_TXONLY[name] + d},
+                             ['MGapt'], rtol=1e-10, atol=1e-12)['MGapt'].to_numpy() for d in (h, -h))
+        fd[:, j, 0] = (up - down) / (2 * h)
+    scale = np.abs(fd).max(axis=0)
+    np.testing.assert_allclose(S / scale, fd / scale, rtol=0, atol=1e-4)
+
+
+    #bioscrape's normalization, p / output; the output starts at zero
+    normalized = sensitivities(crn, timepoints, TX_INITIAL_CONDITIONS, params=PARAMS, observables=['MGapt'],
+                               normalize=True, rtol=1e-8, atol=1e-10)
+    y = simulate(crn, timepoints, TX_INITIAL_CONDITIONS, observables=['MGapt'],
+                 rtol=1e-8, atol=1e-10)['MGapt'].to_numpy()
+    p = np.array([TX_PARAMETERS_TXONLY[name] for name in PARAMS])
+    np.testing.assert_allclose(normalized[1:], (S * p[None, :, None])[1:] / y[1:, None, None], rtol=1e-6)
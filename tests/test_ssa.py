@@ -0,0 +1,52 @@
+import numpy as np
+
+from pure_crn import simulate
+from pure_crn.network import CRNBuilder
+from pure_crn.ssa import StochasticSimulator, ssa_ensemble
+
+VOLUME = 1e-14
+
+
+def _binding_crn():
+    #A + B <-> C with micromolar pools: thousands of copies each in 10 fL
+    builder = CRNBuilder()
+    builder.add_reaction(['A', 'B'], ['C'], 'k_on', 1.)
+    builder.add_reaction(['C'], ['A', 'B'], 'k_off', 1.)
+    return builder.compile()
+
+
+def test_tau_leaps_on_abundant_species():
+    crn = _binding_crn()
+    simulator = StochasticSimulator(crn, VOLUME)
+    x0 = simulator.to_counts({'A': 1., 'B': .5})
+    timepoints = np.linspace(0, 2, 5)
+    tau, exact = {}, {}
+    y = simulator.run(timepoints, x0, 0, stats=tau)
+    simulator.run(timepoints, x0, 0, method='exact', stats=exact)
+    assert tau['leaps'] > 0
+    assert tau['leap_firings'] > 10 * tau['leaps']
+    assert tau['exact'] + tau['leaps'] < exact['exact'] / 10
+    assert (y >= 0).all()
+    #Copy numbers are conserved
+    A, B, C = (crn.species_index[s] for s in 'ABC')
+    np.testing.assert_array_equal(y[:, A] + y[:, C], x0[A] + x0[C])
+
+
+def test_tau_mean_matches_ode():
+    crn = _binding_crn()
+    timepoints = np.linspace(0, 2, 5)
+    initial = {'A': 1., 'B': .5}
+    summary = ssa_ensemble(crn, timepoints, 20, initial, VOLUME, processes=1, seed=0)
+    ode = simulate(crn, timepoints, initial, rtol=1e-8, atol=1e-10)
+    np.testing.assert_allclose(summary.mean[:, summary.names.index('C')], ode['C'], rtol=.01, atol=1e-3)
+
+
+def test_low_copy_reactions_stay_exact():
+    #Three template copies in 1 fL: every binding is critical
+    crn = _binding_crn()
+    simulator = StochasticSimulator(crn, 1e-15)
+    x0 = simulator.to_counts({'A': .005, 'B': 1.})
+    stats = {}
+    y = simulator.run(np.linspace(0, 100, 5), x0, 0, stats=stats)
+    assert stats['leaps'] == 0 and stats['exact'] > 0
+    assert (y >= 0).all()
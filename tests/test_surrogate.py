@@ -0,0 +1,61 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from pure_crn import (MGAPT_DNA, TX_INITIAL_CONDITIONS, TX_PARAMETERS_TXONLY, Experiment, build_tx_crn,
+                      simulate)
+from pure_crn.surrogate import Surrogate, SurrogateLikelihood, py_inference_surrogate, total_degree
+
+PARAMS = ['k_rnapbF1', 'k_rnapbF2']
+OPTIONS = {'method': 'Radau', 'rtol': 1e-6, 'atol': 1e-9, 'backend': 'numpy'}
+
+
+@pytest.mark.parametrize('ndim, degree', [(1, 4), (3, 3), (5, 2)])
+def test_total_degree_matches_filtered_grid(ndim, degree):
+    grid = [p for p in itertools.product(range(degree + 1), repeat=ndim) if sum(p) <= degree]
+    assert total_degree(ndim, degree) == grid
+
+
+def test_total_degree_scales_to_many_rates():
+    #C(40 + 3, 3) terms; the tensor grid would have 4 ** 40
+    assert Surrogate(np.ones(40), np.full(40, 2.), degree=3).n_terms == 12341
+
+
+@pytest.fixture(scope='module')
+def experiment():
+    crn = build_tx_crn(MGAPT_DNA, TX_PARAMETERS_TXONLY)
+    timepoints = np.linspace(0, 1800, 7)
+    y = simulate(crn, timepoints, TX_INITIAL_CONDITIONS, observables=['MGapt'], **OPTIONS)['MGapt']
+    data = y.to_numpy()[None] * np.array([.98, 1.02])[:, None]
+    e = Experiment(crn, timepoints, data, ['MGapt'], PARAMS, TX_INITIAL_CONDITIONS, sigma=.1, **OPTIONS)
+    return e, crn.parameter_values[e._param_idx]
+
+
+def test_outside_the_box_uses_the_full_model(experiment):
+    e, theta = experiment
+    prior = {name: ['log-uniform', t / 100, t * 100] for name, t in zip(PARAMS, theta)}
+    #A box that excludes theta: the full model answers there, not -inf
+    f = SurrogateLikelihood(e, Surrogate(theta * 2, theta * 3, degree=1), prior)
+    expected = e.log_likelihood(theta) - np.log(theta).sum()
+    assert f(theta)[0] == pytest.approx(expected)
+    assert f.n_full == 1
+    assert f(theta * 1e3)[0] == -np.inf
+
+
+def test_chain_holds_only_the_final_emulator(tmp_path, experiment):
+    e, theta = experiment
+    prior = {name: ['log-uniform', t / 3, t * 3] for name, t in zip(PARAMS, theta)}
+    files = {name: str(tmp_path / f'{name}.csv') for name in ('results', 'stages')}
+    sampler, surrogate = py_inference_surrogate(
+        e, prior, degree=2, nwalkers=6, nsteps=5, n_stages=2, refine_every=3, n_refine=2, processes=1,
+        seed=0, filename_csv=files['results'], filename_txt=str(tmp_path / 'results.txt'),
+        filename_stages=files['stages'])
+    chain = np.loadtxt(files['results'], delimiter=',')
+    stages = np.loadtxt(files['stages'], delimiter=',')
+    assert chain.shape == (5 * 6, 2)
+    np.testing.assert_array_equal(np.unique(stages[:, 0]), [0, 1])
+    assert stages.shape == (2 * 3 * 6, 3)
+    assert sampler.get_chain().shape == (5, 6, 2)
+    #Initial hold-out, one per stage, one for the final emulator
+    assert len(surrogate.errors) == 4
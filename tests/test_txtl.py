@@ -0,0 +1,22 @@
+import numpy as np
+
+from pure_crn import MGAPT_DEGFP_DNA, MGAPT_DNA, TX_INITIAL_CONDITIONS, TX_PARAMETERS_TXONLY, build_tx_crn
+from pure_crn.txtl import compare_lumped
+
+TIMEPOINTS = np.linspace(0, 3 * 3600, 37)
+
+
+def test_lumped_mgapt_degfp_within_readme_bound():
+    crn = build_tx_crn(MGAPT_DEGFP_DNA, lumped=16)
+    assert crn.n_reactions < build_tx_crn(MGAPT_DEGFP_DNA).n_reactions / 10
+    error = compare_lumped(MGAPT_DEGFP_DNA, TIMEPOINTS, TX_INITIAL_CONDITIONS, lumped=16,
+                           observables=['MGapt', 'ATP', 'GTP', 'CTP', 'UTP', 'PPi'])
+    assert error['MGapt'] < 3e-4
+    #The lumped stages consume the sequence's nucleotides
+    assert all(error[s] < 1e-4 for s in ('ATP', 'GTP', 'CTP', 'UTP', 'PPi'))
+
+
+def test_lumped_mgapt():
+    error = compare_lumped(MGAPT_DNA, TIMEPOINTS, TX_INITIAL_CONDITIONS, lumped=8,
+                           params=TX_PARAMETERS_TXONLY)
+    assert error['MGapt'] < 1e-4